@@ -0,0 +1,55 @@
+"""
+Benchmark of the time taken to import the wai.json packages, each in a
+fresh interpreter. Run from the repository root:
+
+    python benchmark/import_time.py [repeats]
+"""
+import os
+import subprocess
+import sys
+import time
+from statistics import median
+
+# The imports to time
+IMPORTS = (
+    "wai.json.raw",
+    "wai.json.schema",
+    "wai.json.serialise",
+    "wai.json.object",
+    "jsonschema"
+)
+
+# The source directory of the package
+SOURCE_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+
+def time_import(module: str) -> float:
+    """
+    Times importing a module in a fresh interpreter.
+
+    :param module:  The name of the module to import.
+    :return:        The time taken to import it, in seconds.
+    """
+    script = (f"import time\n"
+              f"start = time.perf_counter()\n"
+              f"import {module}\n"
+              f"print(time.perf_counter() - start)\n")
+
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join((SOURCE_DIRECTORY, os.environ.get("PYTHONPATH", "")))}
+
+    return float(subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, check=True).stdout)
+
+
+def main(repeats: int = 10):
+    """
+    Prints the median import time of each module.
+
+    :param repeats: The number of times to import each module.
+    """
+    for module in IMPORTS:
+        times = [time_import(module) for _ in range(repeats)]
+        print(f"{module:<20} {median(times) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
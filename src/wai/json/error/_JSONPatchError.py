@@ -0,0 +1,9 @@
+from ._JSONError import JSONError
+
+
+class JSONPatchError(JSONError):
+    """
+    Error for when a JSON patch is malformed or can't be
+    applied.
+    """
+    pass
@@ -0,0 +1,9 @@
+from ._JSONError import JSONError
+
+
+class JSONPathError(JSONError):
+    """
+    Error for when a path into a JSON structure can't be
+    resolved.
+    """
+    pass
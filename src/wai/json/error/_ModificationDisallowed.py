@@ -0,0 +1,9 @@
+from ._JSONError import JSONError
+
+
+class ModificationDisallowed(JSONError):
+    """
+    Error for when attempting to modify a frozen JSON object
+    or proxy.
+    """
+    pass
@@ -1,16 +1,30 @@
+import copyreg
+import re
 from enum import Enum, auto
 from typing import Dict, TypeVar, List, Any, Union, Optional, Iterator, Tuple
+from weakref import WeakValueDictionary
 
 from wai.common.meta import instanceoptionalmethod
 from wai.common.meta.dynamic_defaults import with_dynamic_defaults, dynamic_default
 
-from ..error import JSONValidationError, RequiredDisallowed, JSONPropertyError
-from ..raw import RawJSONElement, RawJSONObject
-from ..schema import JSONSchema, standard_object, IS_JSON_SCHEMA, IS_JSON_DEFINITION, TRIVIALLY_FAIL_SCHEMA, is_schema
+from ..error import JSONValidationError, RequiredDisallowed, JSONPropertyError, ModificationDisallowed
+from ..raw import RawJSONElement, RawJSONObject, RawJSONMeasurements, measure
+from ..schema import (
+    JSONSchema,
+    standard_object,
+    IS_JSON_SCHEMA,
+    IS_JSON_DEFINITION,
+    TRIVIALLY_FAIL_SCHEMA,
+    is_schema,
+    reference_schema,
+    extract_definitions
+)
 from ..schema.constants import DEFINITIONS_KEYWORD
 from ..serialise import JSONValidatedBiserialisable
 from ..validator import StaticJSONValidator
 from .property import RawProperty, Property, JSONObjectProperty
+from ._hashing import note_modification, cached_hash, mapping_hash, structural_equal
+from ._structural import PathLike, as_path, get_at_path, set_child, remove_child, update_in_place, replace_at_path
 from ._typing import Absent, OptionallyPresent, PropertyValueType
 
 # The type of this configuration
@@ -20,6 +34,39 @@ SelfType = TypeVar("SelfType", bound="Configuration")
 DEFAULT_SCHEMA: JSONSchema = {DEFINITIONS_KEYWORD: IS_JSON_DEFINITION}
 DEFAULT_SCHEMA.update(IS_JSON_SCHEMA)
 
+# The JSON object types which have been given definition names, by name
+_definition_types: WeakValueDictionary = WeakValueDictionary()
+
+# Characters which can't appear in definition names
+_DEFINITION_NAME_DISALLOWED = re.compile("[^A-Za-z0-9_.-]+")
+
+
+def definition_name(cls: type) -> str:
+    """
+    Gets the name under which the schema for a JSON object type is
+    defined in schema definitions. The name is based on the type's
+    module and qualified name, and is unique to the type.
+
+    :param cls:     The JSON object type.
+    :return:        The definition name.
+    """
+    # Return the existing name if the type already has one
+    if "_definition_name" in vars(cls):
+        return cls._definition_name
+
+    # Create a name from the fully-qualified name (so it is the same in
+    # every process), deduplicating by count (for locally-defined types)
+    base_name = _DEFINITION_NAME_DISALLOWED.sub("_", f"{cls.__module__}.{cls.__qualname__}").strip("_")
+    name, count = base_name, 1
+    while name in _definition_types:
+        count += 1
+        name = f"{base_name}-{count}"
+
+    _definition_types[name] = cls
+    cls._definition_name = name
+
+    return name
+
 
 def additional_properties_validation_as_property(validation: Union[JSONSchema, Property, None]) -> Optional[Property]:
     """
@@ -40,8 +87,9 @@ def additional_properties_validation_as_property(validation: Union[JSONSchema, P
 
         return validation
 
-    # Otherwise it's a schema, so make sure it's valid
-    if not is_schema(validation):
+    # Otherwise it's a schema, so make sure it's valid (the default is known
+    # to be, and checking it would import jsonschema for every JSONObject)
+    if validation is not DEFAULT_SCHEMA and not is_schema(validation):
         raise JSONValidationError(f"Validation for additional properties must be a property or a schema, "
                                   f"not a {type(validation).__name__}: {validation}")
 
@@ -63,6 +111,18 @@ class JSONObject(JSONValidatedBiserialisable[SelfType], StaticJSONValidator):
     All configurations are validated against a schema for format correctness.
     The attributes of a configuration should be either JSON types or nested
     configurations.
+
+    Instances compare equal by value (with values of different JSON types,
+    e.g. 1 and true, never equal), and are hashed by value. Modifying an
+    instance changes its hash, so instances in sets or used as dict keys
+    shouldn't be modified (freeze them to make sure).
+
+    Thread-safety: instances can be read (getting properties, serialising,
+    comparing, hashing, validating, and reading views) from several threads
+    at once without locking, as long as no thread modifies them. Frozen
+    instances can't be modified, so can always be shared between threads.
+    Modifying an instance which other threads are using (including the
+    JSON objects and proxies it contains) requires external locking.
     """
     # Forward-declarations of class attributes
     # If JSONObject is instantiated directly, it has only additional properties
@@ -71,6 +131,12 @@ class JSONObject(JSONValidatedBiserialisable[SelfType], StaticJSONValidator):
     _optional_properties: Dict[str, Property] = {}
     _additional_property: Optional[Property] = additional_properties_validation_as_property(DEFAULT_SCHEMA)
 
+    # Whether instances can be modified (see freeze)
+    _frozen: bool = False
+
+    # Whether instances are read-only views over raw JSON (see view)
+    _is_view: bool = False
+
     def __init__(self, **initial_values):
         # Create the property values container
         self._property_values: Dict[str, PropertyValueType] = {}
@@ -130,6 +196,10 @@ class JSONObject(JSONValidatedBiserialisable[SelfType], StaticJSONValidator):
         """
         # Get the property's value if we have one
         if name in self._property_values:
+            # Views hold the raw JSON, so wrap it on access
+            if self._is_view:
+                return self._get_property(name).view_value(self._property_values[name])
+
             return self._property_values[name]
 
         # If we don't want the default value, return Absent
@@ -175,6 +245,8 @@ class JSONObject(JSONValidatedBiserialisable[SelfType], StaticJSONValidator):
         # Use the property to validate the value
         value = prop.validate_value(value)
 
+        self._before_modification()
+
         if value is Absent:
             if name in self._property_values:
                 del self._property_values[name]
@@ -189,6 +261,160 @@ class JSONObject(JSONValidatedBiserialisable[SelfType], StaticJSONValidator):
         """
         self.set_property(name, Absent)
 
+    def evolve(self, **changes) -> SelfType:
+        """
+        Creates a copy of this object with the given property values changed.
+        Values of properties which aren't changed are shared with this object
+        rather than copied, so only the changed values are validated. As the
+        unchanged values are shared, modifying them in-place will affect both
+        objects.
+
+        :param changes:     The new property values, by property or attribute name.
+        :return:            The evolved copy.
+        """
+        # Attempt to convert attribute names to property names
+        self._attribute_to_property_names(changes)
+
+        # Create a copy sharing all current values
+        evolved = self._shallow_copy()
+
+        # Set the changed values (validating them in the process)
+        for name, value in changes.items():
+            evolved.set_property(name, value)
+
+        return evolved
+
+    def with_path(self, path: PathLike, value: OptionallyPresent[PropertyValueType]) -> SelfType:
+        """
+        Creates a copy of this object with the value at the given path
+        replaced. The path is either a JSON pointer (see get_path), or a
+        sequence of property names/map keys (strings) and array indices
+        (integers). Only the nodes on the path to the value are copied,
+        everything else is shared with this object (see evolve).
+
+        :param path:    The path to the value to replace.
+        :param value:   The new value.
+        :return:        The updated copy.
+        """
+        return replace_at_path(self, as_path(path), value)
+
+    def get_path(self, path: PathLike) -> PropertyValueType:
+        """
+        Gets the value at the given path in this object. The path is
+        either a JSON pointer (e.g. "/a/b/3/c") or a sequence of keys
+        (see with_path). Pointer strings are compiled once and cached,
+        so repeated paths are not re-parsed.
+
+        :param path:    The path to the value.
+        :return:        The value.
+        """
+        return get_at_path(self, as_path(path))
+
+    def set_path(self, path: PathLike, value: PropertyValueType):
+        """
+        Sets the value at the given path in this object, in-place. Only
+        the value being set is validated (or, where it lies within raw
+        JSON, the property holding the raw JSON). An array index one past
+        the end of an array (or "-") appends the value.
+
+        :param path:    The path to the value (see get_path).
+        :param value:   The value to set.
+        """
+        update_in_place(self,
+                        as_path(path),
+                        lambda parent, key: set_child(parent, key, value),
+                        allow_end=True)
+
+    def delete_path(self, path: PathLike):
+        """
+        Deletes the value at the given path in this object, in-place.
+
+        :param path:    The path to the value (see get_path).
+        """
+        update_in_place(self, as_path(path), remove_child)
+
+    def measure(self) -> RawJSONMeasurements:
+        """
+        Measures the raw JSON representation of this object, e.g. its
+        serialised size (see raw.measure).
+
+        :return:    The measurements.
+        """
+        return measure(self.to_raw_json(False))
+
+    @classmethod
+    def view(cls, raw_json: RawJSONObject, validate: bool = True) -> SelfType:
+        """
+        Creates a read-only view of the given raw JSON as an instance of
+        this type, without copying it. Nested objects, arrays and maps are
+        wrapped in views of their own as they are accessed. The raw JSON
+        must not be modified while the view is in use.
+
+        :param raw_json:    The raw JSON object.
+        :param validate:    Whether to validate the raw JSON.
+        :return:            The view.
+        """
+        # Validate the raw JSON if requested
+        if validate:
+            cls.validate_raw_json(raw_json)
+
+        # Create the view over the raw JSON
+        view = cls.__new__(cls)
+        view._property_values = raw_json
+        view._frozen = True
+        view._is_view = True
+
+        return view
+
+    @property
+    def is_view(self) -> bool:
+        """
+        Whether this object is a read-only view over raw JSON (see view).
+        """
+        return self._is_view
+
+    @property
+    def is_frozen(self) -> bool:
+        """
+        Whether this object is frozen (can't be modified).
+        """
+        return self._frozen
+
+    def freeze(self) -> SelfType:
+        """
+        Freezes this object and all JSON objects and proxies it contains,
+        so that they can no longer be modified. Raw JSON values are not
+        frozen, and should not be modified in-place.
+
+        :return:    This object.
+        """
+        if not self._frozen:
+            self._frozen = True
+            for value in self._property_values.values():
+                if hasattr(value, "freeze"):
+                    value.freeze()
+
+        return self
+
+    def __reduce__(self):
+        # Pickle the type and state only, so unpickling skips __init__ (and validation)
+        return copyreg.__newobj__, (type(self),), self.__getstate__()
+
+    def __getstate__(self):
+        # Views share their (read-only) raw JSON, otherwise the copy shares the values
+        values = self._property_values if self._is_view else dict(self._property_values)
+
+        return values, self._frozen, self._is_view
+
+    def __setstate__(self, state):
+        self._property_values, frozen, is_view = state
+
+        # Only set the flags on the instance if they differ from the class defaults
+        if frozen:
+            self._frozen = True
+        if is_view:
+            self._is_view = True
+
     @classmethod
     def get_property_optionality(cls, name: str) -> PropertyOptionality:
         """
@@ -275,6 +501,38 @@ class JSONObject(JSONValidatedBiserialisable[SelfType], StaticJSONValidator):
         """
         return JSONObjectProperty(name, cls, optional=optional)
 
+    @classmethod
+    def get_json_reference_schema(cls) -> JSONSchema:
+        """
+        Gets a schema which validates this type of object by reference
+        to its definition, which is included (along with the definitions
+        it depends on) under the schema's definitions. Nested objects are
+        validated this way, so that each type's schema appears only once
+        in the schema of an enclosing object, however many times the type
+        is used, and so that types can refer to themselves.
+
+        :return:    The reference schema.
+        """
+        name = definition_name(cls)
+
+        # If our schema is still being built, this is a recursive
+        # reference, and our definition will be added by our schema
+        if cls._is_building_json_validation_schema():
+            cls._note_recursive_json_validation_schema()
+            return reference_schema(name)
+
+        # Move our schema into the definitions
+        schema = cls.get_json_validation_schema()
+        definitions = dict(extract_definitions(schema))
+        if name not in definitions:
+            definitions[name] = {key: value for key, value in schema.items() if key != DEFINITIONS_KEYWORD}
+
+        # Create the reference to our definition
+        reference = reference_schema(name)
+        reference[DEFINITIONS_KEYWORD] = definitions
+
+        return reference
+
     @classmethod
     def _get_property(cls, name: str) -> Property:
         """
@@ -308,6 +566,73 @@ class JSONObject(JSONValidatedBiserialisable[SelfType], StaticJSONValidator):
     def __iter__(self):
         return self.properties()
 
+    def __eq__(self, other) -> bool:
+        # Objects are always equal to themselves
+        if other is self:
+            return True
+
+        # Can only compare to objects of the same type
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return structural_equal(self, other)
+
+    def __hash__(self) -> int:
+        # Hashed consistently with equality, so modifying objects changes their hash
+        return self._structural_hash()
+
+    def _shallow_copy(self) -> SelfType:
+        """
+        Creates a copy of this object which shares its property values
+        with this object.
+
+        :return:    The copy.
+        """
+        copy = type(self).__new__(type(self))
+        copy._property_values = (dict(self._property_values) if not self._is_view else
+                                 {name: self.get_property(name) for name in self._property_values})
+        return copy
+
+    def _replace_child(self, name: str, value: PropertyValueType):
+        """
+        Replaces the value of a property without validation. Only for use
+        where the value is known to be valid for the property.
+
+        :param name:    The property name.
+        :param value:   The new value.
+        """
+        self._before_modification()
+        self._property_values[name] = value
+
+    def _before_modification(self):
+        """
+        Checks that this object can be modified, and records that it
+        is about to be.
+        """
+        if self._frozen:
+            raise ModificationDisallowed(f"Can't modify frozen {type(self).__name__}")
+
+        note_modification(self)
+
+    def _structural_contents(self):
+        """
+        Gets the property values of this object, for structural equality.
+
+        :return:    The property values (raw JSON if this object is a view).
+        """
+        return self._property_values
+
+    def _structural_hash(self) -> int:
+        """
+        Gets the structural hash of this object's property values.
+        The hash is cached until this object, or any JSON object or proxy
+        it contains, is modified (raw JSON values are assumed not to be
+        modified in-place).
+
+        :return:    The hash.
+        """
+        return cached_hash(self, lambda: mapping_hash(self._property_values.items(), self))
+
     def _serialise_to_raw_json(self) -> RawJSONObject:
         return {name: self.get_property_as_raw_json(name, validate=False)
                 for name in self._property_values}
@@ -330,17 +655,26 @@ class JSONObject(JSONValidatedBiserialisable[SelfType], StaticJSONValidator):
             for name, prop in cls._optional_properties.items()
         }
 
-        # If no additional properties allowed, return a schema indicating this
+        # If no additional properties allowed, create a schema indicating this
         if not cls.allows_additional_properties():
-            return standard_object(required_properties_schema, optional_properties_schema)
+            schema = standard_object(required_properties_schema, optional_properties_schema)
+
+        else:
+            # Extract the additional properties schema
+            additional_properties_schema: JSONSchema = cls._additional_property.get_json_validation_schema()
+
+            # Create the schema
+            schema = standard_object(required_properties_schema,
+                                     optional_properties_schema,
+                                     additional_properties=additional_properties_schema)
 
-        # Extract the additional properties schema
-        additional_properties_schema: JSONSchema = cls._additional_property.get_json_validation_schema()
+        # If the schema refers to itself, it must also define itself
+        if cls._is_json_validation_schema_recursive():
+            extract_definitions(schema)[definition_name(cls)] = {key: value
+                                                                 for key, value in schema.items()
+                                                                 if key != DEFINITIONS_KEYWORD}
 
-        # Create the schema
-        return standard_object(required_properties_schema,
-                               optional_properties_schema,
-                               additional_properties=additional_properties_schema)
+        return schema
 
     @classmethod
     def _get_all_defined_properties(cls) -> Dict[str, Property]:
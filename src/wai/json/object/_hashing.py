@@ -0,0 +1,198 @@
+"""
+Module for structural equality and hashing of JSON objects, proxies
+and raw JSON. Structural hashes are consistent with structural equality,
+so they can be used to quickly reject unequal values.
+"""
+from typing import Any, Iterable, Optional, Tuple
+from weakref import ref
+
+
+def note_modification(obj: Any):
+    """
+    Records that a JSON object or proxy is about to be modified,
+    invalidating its cached structural hash and those of the JSON
+    objects and proxies which contain it.
+
+    :param obj:     The JSON object or proxy.
+    """
+    # Bump the hash version of the object and its (transitive) parents
+    to_invalidate = [obj]
+    invalidated = set()
+    while len(to_invalidate) > 0:
+        current = to_invalidate.pop()
+        if id(current) in invalidated:
+            continue
+        invalidated.add(id(current))
+
+        attributes = current.__dict__
+        attributes["_hash_version"] = attributes.get("_hash_version", 0) + 1
+
+        # Parents which have been collected are forgotten
+        parents = attributes.get("_hash_parents", None)
+        if parents is not None:
+            for parent_id, parent_ref in list(parents.items()):
+                parent = parent_ref()
+                if parent is None:
+                    del parents[parent_id]
+                else:
+                    to_invalidate.append(parent)
+
+
+def register_parent(child: Any, parent: Any):
+    """
+    Records that a JSON object or proxy contains another, so that modifying
+    the child invalidates the cached structural hash of the parent. Parents
+    are referenced weakly, and registrations are never removed (a stale
+    registration only causes an unnecessary invalidation).
+
+    :param child:   The contained JSON object or proxy.
+    :param parent:  The containing JSON object or proxy.
+    """
+    # Frozen children are never modified
+    if child._frozen:
+        return
+
+    parents = child.__dict__.get("_hash_parents", None)
+    if parents is None:
+        parents = child.__dict__["_hash_parents"] = {}
+
+    if id(parent) not in parents:
+        parents[id(parent)] = ref(parent)
+
+
+def structural_hash(value: Any, parent: Optional[Any] = None) -> int:
+    """
+    Calculates the structural hash of a value. Values which compare
+    equal have equal structural hashes.
+
+    :param value:   The value to hash.
+    :param parent:  The JSON object or proxy containing the value, if any.
+    :return:        The hash.
+    """
+    # JSON objects and proxies cache their own hashes
+    if hasattr(value, "_structural_hash"):
+        if parent is not None:
+            register_parent(value, parent)
+        return value._structural_hash()
+    elif isinstance(value, dict):
+        return mapping_hash(value.items(), parent)
+    elif isinstance(value, (list, tuple)):
+        return sequence_hash(value, parent)
+
+    try:
+        return hash(value)
+    except TypeError:
+        # Unhashable values all hash the same, so equality decides
+        return hash(type(value))
+
+
+def mapping_hash(items: Iterable[Tuple[str, Any]], parent: Optional[Any] = None) -> int:
+    """
+    Calculates the structural hash of a mapping, irrespective of
+    the order of its keys.
+
+    :param items:   The key/value pairs of the mapping.
+    :param parent:  The JSON object or proxy containing the values, if any.
+    :return:        The hash.
+    """
+    return hash(frozenset((key, structural_hash(value, parent)) for key, value in items))
+
+
+def sequence_hash(values: Iterable[Any], parent: Optional[Any] = None) -> int:
+    """
+    Calculates the structural hash of a sequence.
+
+    :param values:  The values in the sequence.
+    :param parent:  The JSON object or proxy containing the values, if any.
+    :return:        The hash.
+    """
+    return hash(tuple(structural_hash(value, parent) for value in values))
+
+
+def structural_equal(first: Any, second: Any, exact_numbers: bool = False) -> bool:
+    """
+    Whether two values are structurally equal. Unlike Python's equality,
+    primitive values must be of the same JSON type (at any depth, so e.g.
+    [1] and [true] are not equal). JSON objects (which may be compared to
+    raw JSON objects) are only equal to JSON objects of the same type.
+
+    :param first:           The first value.
+    :param second:          The second value.
+    :param exact_numbers:   Whether integers and floats are never equal. Otherwise
+                            numbers are equal if their values are (as JSON numbers).
+    :return:                True if the values are equal.
+    """
+    if first is second:
+        return True
+
+    first_structured = hasattr(first, "_structural_contents")
+    second_structured = hasattr(second, "_structural_contents")
+
+    # JSON objects of different types are never equal
+    if (first_structured and second_structured
+            and (hasattr(first, "_property_values") or hasattr(second, "_property_values"))
+            and type(first) is not type(second)):
+        return False
+
+    # Cached hashes can quickly rule out equality
+    if (first_structured and second_structured and first._is_view == second._is_view
+            and first._structural_hash() != second._structural_hash()):
+        return False
+
+    # Compare the contents of JSON objects and proxies
+    if first_structured:
+        first = first._structural_contents()
+    if second_structured:
+        second = second._structural_contents()
+
+    # Containers are compared element-by-element
+    if isinstance(first, dict) or isinstance(second, dict):
+        if not (isinstance(first, dict) and isinstance(second, dict)) or first.keys() != second.keys():
+            return False
+        return all(structural_equal(value, second[key], exact_numbers) for key, value in first.items())
+    elif isinstance(first, (list, tuple)) or isinstance(second, (list, tuple)):
+        if not (isinstance(first, (list, tuple)) and isinstance(second, (list, tuple))) or len(first) != len(second):
+            return False
+        return all(structural_equal(first_value, second_value, exact_numbers)
+                   for first_value, second_value in zip(first, second))
+
+    # Primitives must be of the same type (bools are ints in Python, so aren't numbers here)
+    if type(first) is not type(second) and (exact_numbers or not (is_number(first) and is_number(second))):
+        return False
+
+    return first == second
+
+
+def is_number(value: Any) -> bool:
+    """
+    Whether a primitive value is a JSON number.
+
+    :param value:   The value.
+    :return:        True if the value is an integer or float (but not a bool).
+    """
+    return type(value) in (int, float)
+
+
+def cached_hash(obj: Any, calculate) -> int:
+    """
+    Gets the cached structural hash of a JSON object or proxy,
+    calculating and caching it if it is missing or out-of-date.
+
+    :param obj:         The JSON object or proxy.
+    :param calculate:   Function which calculates the hash.
+    :return:            The hash.
+    """
+    # Record the object's hash version before calculating, so that any
+    # modification of it (or its contents) during calculation invalidates the result
+    attributes = obj.__dict__
+    version = attributes.get("_hash_version", 0)
+
+    # Return the cached value if it's still valid
+    cached = attributes.get("_cached_hash", None)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    value = calculate()
+    attributes["_cached_hash"] = (version, value)
+
+    return value
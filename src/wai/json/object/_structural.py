@@ -0,0 +1,289 @@
+"""
+Module for helper functions which create updated copies of JSON
+structures (JSON objects, proxies and raw JSON) that share all
+unchanged sub-structure with the original.
+"""
+from typing import Any, Callable, Sequence, Union
+
+from ..error import JSONPathError, JSONPropertyError
+from ..pointer import JSONPointer
+from ._typing import Absent
+from .property.proxies import ArrayProxy
+
+# The type of a single step in a path into a JSON structure
+PathKey = Union[str, int]
+
+# The type of a path into a JSON structure
+Path = Sequence[PathKey]
+
+# The types which can specify a path (sequences of keys or JSON pointers)
+PathLike = Union[Path, str, JSONPointer]
+
+
+def as_path(path: PathLike) -> Path:
+    """
+    Converts a JSON pointer (string or compiled) into a path, passing
+    paths through unchanged. Pointer strings are compiled via the cache
+    in JSONPointer.compile.
+
+    :param path:    The path or JSON pointer.
+    :return:        The path.
+    """
+    if isinstance(path, str):
+        return JSONPointer.compile(path).tokens
+    elif isinstance(path, JSONPointer):
+        return path.tokens
+
+    return path
+
+
+def is_structured(node: Any) -> bool:
+    """
+    Checks if the given node is a JSON object or proxy (as opposed
+    to raw JSON).
+
+    :param node:    The node to check.
+    :return:        True if the node is a JSON object or proxy.
+    """
+    return hasattr(node, "_replace_child")
+
+
+def resolve_key(node: Any, key: PathKey, allow_end: bool = False) -> PathKey:
+    """
+    Checks that the given key can index the given node, converting
+    string keys into array indices where necessary (as found in
+    JSON pointers).
+
+    :param node:        The node being indexed.
+    :param key:         The key.
+    :param allow_end:   Whether the key "-" is allowed for arrays, in which
+                        case it resolves to the index one past the end.
+    :return:            The resolved key.
+    """
+    # Arrays are indexed by integers, everything else by strings
+    if isinstance(node, (list, tuple, ArrayProxy)):
+        if isinstance(key, str):
+            if allow_end and key == "-":
+                return len(node)
+            elif key.isdigit() and key.isascii() and (key == "0" or not key.startswith("0")):
+                return int(key)
+        elif isinstance(key, int) and not isinstance(key, bool):
+            return key
+        raise JSONPathError(f"Arrays must be indexed by integers, got {key!r}")
+    elif isinstance(key, str):
+        if not (isinstance(node, dict) or is_structured(node)):
+            raise JSONPathError(f"Can't index into {type(node).__name__} with key {key!r}")
+        return key
+
+    raise JSONPathError(f"Objects must be indexed by strings, got {key!r}")
+
+
+def get_child(node: Any, key: PathKey) -> Any:
+    """
+    Gets the child of a node in a JSON structure.
+
+    :param node:    The parent node.
+    :param key:     The key of the child in the parent.
+    :return:        The child.
+    """
+    # Make sure the key is correct for the node
+    key = resolve_key(node, key)
+
+    try:
+        child = node[key]
+    except (KeyError, IndexError, JSONPropertyError) as e:
+        raise JSONPathError(f"No value at key {key!r}") from e
+
+    # JSON objects return Absent instead of raising for missing values
+    if child is Absent:
+        raise JSONPathError(f"No value at key {key!r}")
+
+    return child
+
+
+def has_child(node: Any, key: PathKey) -> bool:
+    """
+    Checks if a node has a value for the given (resolved) key.
+
+    :param node:    The parent node.
+    :param key:     The key of the child in the parent.
+    :return:        True if the node has a value for the key.
+    """
+    if isinstance(node, (list, tuple, ArrayProxy)):
+        return 0 <= key < len(node)
+    elif hasattr(node, "has_property"):
+        return node.has_property(key, require_value=True)
+
+    return key in node
+
+
+def set_child(node: Any, key: PathKey, value: Any):
+    """
+    Sets the child of a node in a JSON structure, in-place. Setting
+    the index one past the end of an array appends the value.
+
+    :param node:    The parent node.
+    :param key:     The (resolved) key of the child in the parent.
+    :param value:   The value to set.
+    """
+    if isinstance(node, (list, ArrayProxy)):
+        if key == len(node):
+            node.append(value)
+            return
+        elif not has_child(node, key):
+            raise JSONPathError(f"Array index {key} out of range")
+
+    node[key] = value
+
+
+def remove_child(node: Any, key: PathKey):
+    """
+    Removes the child of a node in a JSON structure, in-place.
+
+    :param node:    The parent node.
+    :param key:     The (resolved) key of the child in the parent.
+    """
+    if not has_child(node, key):
+        raise JSONPathError(f"No value at key {key!r}")
+    elif isinstance(node, (list, ArrayProxy)):
+        node.pop(key)
+    else:
+        del node[key]
+
+
+def get_at_path(node: Any, path: Path) -> Any:
+    """
+    Gets the value at the given path in a JSON structure.
+
+    :param node:    The root node of the structure.
+    :param path:    The path to the value.
+    :return:        The value.
+    """
+    for key in path:
+        node = get_child(node, key)
+
+    return node
+
+
+def shallow_copy(node: Any) -> Any:
+    """
+    Creates a copy of a node in a JSON structure which shares
+    its children with the original.
+
+    :param node:    The node to copy.
+    :return:        The copy.
+    """
+    if is_structured(node):
+        return node._shallow_copy()
+    elif isinstance(node, dict):
+        return dict(node)
+    elif isinstance(node, (list, tuple)):
+        return list(node)
+
+    raise JSONPathError(f"Can't descend into {type(node).__name__}")
+
+
+def update_path(node: Any,
+                path: Path,
+                update: Callable[[Any, PathKey], None],
+                allow_end: bool = False) -> Any:
+    """
+    Creates a copy of the given node where the update function has
+    been applied at the given path. Only the nodes on the path are
+    copied, everything else is shared with the original.
+
+    :param node:        The root node of the structure.
+    :param path:        The path to the node to update.
+    :param update:      Function which modifies a copy of the parent of the final
+                        path element in-place, given the final key.
+    :param allow_end:   Whether the final key can be "-", referring to the
+                        end of an array.
+    :return:            The updated copy of the root node.
+    """
+    # Can't update the root itself
+    if len(path) == 0:
+        raise JSONPathError("Path must contain at least one key")
+
+    # Get the key into this node
+    key = resolve_key(node, path[0], allow_end and len(path) == 1)
+
+    # Copy this node
+    copy = shallow_copy(node)
+
+    # If this is the last key, update the copy directly
+    if len(path) == 1:
+        update(copy, key)
+        return copy
+
+    # Otherwise update the child
+    child = get_child(node, key)
+    updated_child = update_path(child, path[1:], update, allow_end)
+
+    # Structured children are still of the type their parent validated,
+    # so they can be replaced without validation. Raw children are
+    # validated by the parent.
+    if is_structured(child):
+        copy._replace_child(key, updated_child)
+    else:
+        copy[key] = updated_child
+
+    return copy
+
+
+def update_in_place(node: Any,
+                    path: Path,
+                    update: Callable[[Any, PathKey], None],
+                    allow_end: bool = False):
+    """
+    Applies the update function at the given path, modifying the
+    structure in-place. Structured nodes on the path are modified
+    directly, so only the updated value is validated. Raw JSON nodes are
+    not modified; instead an updated copy of the raw JSON is set back on
+    the nearest structured node, which validates it.
+
+    :param node:        The root node of the structure.
+    :param path:        The path to the node to update.
+    :param update:      Function which modifies the parent of the final
+                        path element in-place, given the final key.
+    :param allow_end:   Whether the final key can be "-", referring to the
+                        end of an array.
+    """
+    # Can't update the root itself
+    if len(path) == 0:
+        raise JSONPathError("Path must contain at least one key")
+
+    # Descend while the nodes are structured
+    for index in range(len(path) - 1):
+        key = resolve_key(node, path[index])
+        child = get_child(node, key)
+
+        # Absent properties return a copy of their default, so set it
+        # on the object first, otherwise the update would be lost
+        if not has_child(node, key):
+            node[key] = child
+            child = get_child(node, key)
+
+        # Raw JSON is updated by copying, and set back on its owner
+        if not is_structured(child):
+            node[key] = update_path(child, path[index + 1:], update, allow_end)
+            return
+
+        node = child
+
+    update(node, resolve_key(node, path[-1], allow_end))
+
+
+def replace_at_path(node: Any, path: Path, value: Any) -> Any:
+    """
+    Creates a copy of the given node with the value at the given
+    path replaced.
+
+    :param node:    The root node of the structure.
+    :param path:    The path to the value to replace.
+    :param value:   The new value.
+    :return:        The updated copy of the root node.
+    """
+    def replace(parent: Any, key: PathKey):
+        parent[key] = value
+
+    return update_path(node, path, replace)
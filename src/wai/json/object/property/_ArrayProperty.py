@@ -1,5 +1,6 @@
 from typing import Optional, Any
 
+from ...serialise import InterningPool
 from .._typing import PropertyValueType, Absent, OptionallyPresent
 from .proxies import ArrayProxy
 from ._Property import Property
@@ -30,7 +31,15 @@ class ArrayProperty(ProxyProperty):
             default=default
         )
 
+    def get_validator(self):
+        # Share the validator of the (shared) array proxy-type, as the schema is the same
+        return self.proxy_type.get_validator()
+
     def _validate_value(self, value: Any) -> PropertyValueType:
+        # Raw lists/tuples are deserialised, so they can be interned if required
+        if isinstance(value, (list, tuple)) and InterningPool.active() is not None:
+            return self.proxy_type.from_raw_json(value, False)
+
         # Convert other proxy-arrays and raw lists/tuples to our proxy-type
         if ((isinstance(value, ArrayProxy) and not isinstance(value, self.proxy_type))
                 or isinstance(value, list)
@@ -1,5 +1,6 @@
-from typing import Type, Optional
+from typing import Type, Optional, Union, Callable, Hashable
 
+from ...schema import JSONSchema
 from .._typing import PropertyValueType, Absent, OptionallyPresent
 from ._ProxyProperty import ProxyProperty
 
@@ -7,10 +8,14 @@ from ._ProxyProperty import ProxyProperty
 class JSONObjectProperty(ProxyProperty):
     """
     Property which validates a sub-configuration (essentially an object).
+    The object type can be given as a function returning the type (e.g. a
+    lambda), which is called when the type is first needed. This allows
+    properties to take types which aren't yet defined, such as the type
+    of the object the property is defined on.
     """
     def __init__(self,
                  name: Optional[str] = None,
-                 object_type: Optional[Type['JSONObject']] = None,
+                 object_type: Union[Type['JSONObject'], Callable[[], Type['JSONObject']], None] = None,
                  *,
                  optional: bool = False,
                  default: OptionallyPresent[PropertyValueType] = Absent):
@@ -21,6 +26,12 @@ class JSONObjectProperty(ProxyProperty):
         if object_type is None:
             object_type = JSONObject
 
+        # Defer resolving the object type if given as a function
+        self._object_type_function: Optional[Callable[[], Type[JSONObject]]] = None
+        if not isinstance(object_type, type):
+            self._object_type_function = object_type
+            object_type = JSONObject
+
         super().__init__(
             name,
             proxy=object_type,
@@ -28,9 +39,35 @@ class JSONObjectProperty(ProxyProperty):
             default=default
         )
 
+    @property
+    def proxy_type(self) -> Type['JSONObject']:
+        # Resolve the object type on first use
+        if self._object_type_function is not None:
+            self._type = self._object_type_function()
+            self._object_type_function = None
+
+        return self._type
+
     @property
     def object_type(self) -> Type['JSONObject']:
         """
         Gets the type of JSON object this property takes.
         """
         return self.proxy_type
+
+    def _specification(self) -> Hashable:
+        # Properties with unresolved object types are determined by the function
+        if self._object_type_function is not None:
+            return self._common_specification() + (self._object_type_function,)
+
+        return super()._specification()
+
+    def __getstate__(self):
+        # Resolve the object type, as the function may not be picklable
+        self.proxy_type
+
+        return super().__getstate__()
+
+    def _get_json_validation_schema(self) -> JSONSchema:
+        # Refer to the object type's definition, rather than including its schema directly
+        return self.object_type.get_json_reference_schema()
@@ -1,5 +1,6 @@
 from typing import Optional, Any
 
+from ...serialise import InterningPool
 from .._typing import PropertyValueType, Absent, OptionallyPresent
 from .proxies import MapProxy
 from ._Property import Property
@@ -24,7 +25,15 @@ class MapProperty(ProxyProperty):
             default=default
         )
 
+    def get_validator(self):
+        # Share the validator of the (shared) map proxy-type, as the schema is the same
+        return self.proxy_type.get_validator()
+
     def _validate_value(self, value: Any) -> PropertyValueType:
+        # Raw dictionaries are deserialised, so they can be interned if required
+        if isinstance(value, dict) and InterningPool.active() is not None:
+            return self.proxy_type.from_raw_json(value, False)
+
         # Convert other map-proxies and raw dictionaries to our proxy-type
         if ((isinstance(value, MapProxy) and not isinstance(value, self.proxy_type))
                 or isinstance(value, dict)):
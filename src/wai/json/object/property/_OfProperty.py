@@ -1,5 +1,5 @@
 from abc import abstractmethod, ABC
-from typing import Tuple, List, Iterable, Callable, Optional, Any
+from typing import Tuple, List, Iterable, Callable, Optional, Any, Hashable
 
 from ...error import JSONPropertyError, OptionalDisallowed, OfPropertySelectionError
 from ...schema import JSONSchema
@@ -48,6 +48,13 @@ class OfProperty(Property, ABC):
             )
         )
 
+    def _specification(self) -> Hashable:
+        # Of properties are determined by their sub-properties
+        return self._common_specification() + (
+            self._schema_function,
+            tuple(sub_property._specification() for sub_property in self._sub_properties)
+        )
+
     def _validate_value(self, value: Any) -> PropertyValueType:
         # Find the properties this value is valid for
         values = []
@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Optional, Hashable, Tuple
 
 from ...error import JSONPropertyError
-from ...raw import deep_copy, RawJSONElement
+from ...raw import deep_copy, RawJSONElement, canonical_dumps
 from ...serialise import JSONValidatedBiserialisable
 from ...validator import StaticJSONValidator
 from .._typing import PropertyValueType, Absent, OptionallyPresent
@@ -172,6 +172,43 @@ class Property(StaticJSONValidator, ABC):
 
         return self._validate_value(value)
 
+    def view_value(self, raw_json: RawJSONElement) -> PropertyValueType:
+        """
+        Gets the value to present for an already-validated raw JSON value
+        of this property, as part of a read-only view (see JSONObject.view).
+        By default performs full validation.
+
+        :param raw_json:    The raw JSON value.
+        :return:            The value to present.
+        """
+        return self.validate_value(raw_json)
+
+    def _specification(self) -> Hashable:
+        """
+        Gets a key which is equal for properties which validate and present
+        values identically, so that proxy-types for equivalent properties
+        can be shared (see ArrayProxy.specify). Sub-classes whose behaviour
+        is fully determined by their state should override this; by default
+        properties are only equivalent to themselves.
+
+        :return:    The specification key.
+        """
+        return self
+
+    def _common_specification(self) -> Tuple:
+        """
+        Gets the part of the specification key common to all properties
+        (the property type, optionality and default value). The name is
+        not included, as it doesn't affect validation.
+
+        :return:    The common specification key.
+        """
+        return (
+            type(self),
+            self._optional,
+            canonical_dumps(self.default_as_raw_json) if self.has_default else None
+        )
+
     @abstractmethod
     def _validate_value(self, value: Any) -> PropertyValueType:
         """
@@ -1,9 +1,10 @@
 from abc import ABC
-from typing import Type, Optional, Any
+from typing import Type, Optional, Any, Hashable
 
 from wai.common.abc import is_abstract_class
 
 from ...error import JSONPropertyError
+from ...raw import RawJSONElement
 from ...schema import JSONSchema
 from ...serialise import JSONValidatedBiserialisable
 from .._typing import PropertyValueType, Absent, OptionallyPresent
@@ -43,16 +44,29 @@ class ProxyProperty(Property, ABC):
 
     def _get_json_validation_schema(self) -> JSONSchema:
         # Use the value-type's schema
-        return self._type.get_json_validation_schema()
+        return self.proxy_type.get_json_validation_schema()
+
+    def _specification(self) -> Hashable:
+        # Proxy properties are determined by their proxy-type
+        return self._common_specification() + (self._type,)
+
+    def view_value(self, raw_json: RawJSONElement) -> PropertyValueType:
+        # Wrap the raw JSON in a view if the proxy type supports it
+        proxy_type = self.proxy_type
+        if hasattr(proxy_type, "view"):
+            return proxy_type.view(raw_json, False)
+
+        return proxy_type.from_raw_json(raw_json, False)
 
     def _validate_value(self, value: Any) -> PropertyValueType:
         # Must be an instance of the correct type, or JSON deserialisable to the correct type
-        if not isinstance(value, self._type):
+        proxy_type = self.proxy_type
+        if not isinstance(value, proxy_type):
             try:
                 if isinstance(value, str):
-                    return self._type.from_json_string(value)
+                    return proxy_type.from_json_string(value)
                 else:
-                    return self._type.from_raw_json(value)
+                    return proxy_type.from_raw_json(value)
             except Exception as e:
                 raise JSONPropertyError(f"Error validating proxy value: {e}") from e
 
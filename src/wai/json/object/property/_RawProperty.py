@@ -1,6 +1,7 @@
-from typing import Optional, Any
+from typing import Optional, Any, Hashable
 
-from ...schema import JSONSchema, TRIVIALLY_FAIL_SCHEMA
+from ...raw import RawJSONElement
+from ...schema import JSONSchema, TRIVIALLY_FAIL_SCHEMA, fingerprint
 from .._typing import PropertyValueType, Absent, OptionallyPresent
 from ._Property import Property
 
@@ -22,6 +23,14 @@ class RawProperty(Property):
     def _get_json_validation_schema(self) -> JSONSchema:
         return self._schema
 
+    def _specification(self) -> Hashable:
+        # Raw properties are determined by their schema
+        return self._common_specification() + (fingerprint(self._schema),)
+
+    def view_value(self, raw_json: RawJSONElement) -> PropertyValueType:
+        # Raw values are presented as-is
+        return raw_json
+
     def _validate_value(self, value: Any) -> PropertyValueType:
         # Perform schema validation
         self.validate_raw_json(value)
@@ -1,13 +1,15 @@
-from typing import Optional
+from typing import Optional, Any, Pattern
 
-from ...schema import string_schema
+from ...schema import string_schema, compile_pattern, anchor_pattern, get_format_checker
 from .._typing import PropertyValueType, Absent, OptionallyPresent
 from ._RawProperty import RawProperty
 
 
 class StringProperty(RawProperty):
     """
-    Configuration property which validates a string.
+    Configuration property which validates a string. The pattern (if any)
+    is compiled when the property is defined, and strings are checked
+    directly against it rather than via the schema validator.
     """
     def __init__(self,
                  name: Optional[str] = None,
@@ -15,17 +17,63 @@ class StringProperty(RawProperty):
                  min_length: Optional[int] = None,
                  max_length: Optional[int] = None,
                  pattern: Optional[str] = None,
+                 anchored: bool = False,
                  format: Optional[str] = None,
+                 check_format: bool = True,
                  optional: bool = False,
                  default: OptionallyPresent[PropertyValueType] = Absent):
+        # Anchor the pattern if it must match the whole string
+        if pattern is not None and anchored:
+            pattern = anchor_pattern(pattern)
+
+        self._min_length: Optional[int] = min_length
+        self._max_length: Optional[int] = max_length
+        self._format: Optional[str] = format
+
+        # Compile the pattern now, so invalid patterns are caught early
+        self._pattern: Optional[Pattern] = compile_pattern(pattern) if pattern is not None else None
+
         super().__init__(
             name,
             schema=string_schema(
                 min_length,
                 max_length,
                 pattern,
-                format
+                format,
+                check_format
             ),
             optional=optional,
             default=default
         )
+
+    def _validate_value(self, value: Any) -> PropertyValueType:
+        # Strings can be checked without the schema validator
+        if isinstance(value, str) and self._is_acceptable_string(value):
+            self.perform_special_json_validation(value)
+            return value
+
+        # Otherwise perform schema validation (which also
+        # produces the error for unacceptable strings)
+        return super()._validate_value(value)
+
+    def _is_acceptable_string(self, value: str) -> bool:
+        """
+        Checks a string against the length, pattern and format
+        restrictions of this property.
+
+        :param value:   The string.
+        :return:        True if the string is acceptable.
+        """
+        # Check the length
+        if self._min_length is not None and len(value) < self._min_length:
+            return False
+        if self._max_length is not None and len(value) > self._max_length:
+            return False
+
+        # Check the pattern
+        if self._pattern is not None and self._pattern.search(value) is None:
+            return False
+
+        # Check the format (if registered)
+        checker = get_format_checker(self._format) if self._format is not None else None
+        return checker is None or checker(value)
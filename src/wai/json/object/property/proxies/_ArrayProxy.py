@@ -1,20 +1,36 @@
+import copyreg
 from abc import ABC, abstractmethod
 from sys import maxsize
-from typing import Iterable, Optional, List, Callable, Any, Iterator, Type
+from threading import Lock
+from typing import Iterable, Optional, List, Callable, Any, Iterator, Type, Dict, Hashable
 
-from ....error import JSONError, OptionalDisallowed
+from ....error import JSONError, OptionalDisallowed, ModificationDisallowed
 from ....raw import RawJSONElement
 from ....serialise import JSONValidatedBiserialisable
 from ....schema import JSONSchema, regular_array
 from ....validator import StaticJSONValidator
+from ..._hashing import note_modification, cached_hash, sequence_hash, structural_equal
 from ..._typing import PropertyValueType
 from .._Property import Property
+from ._SpecifiedProxyType import SpecifiedProxyType
+
+# The array proxy-types created by ArrayProxy.specify, by specification
+_specified_types: Dict[Hashable, Type['ArrayProxy']] = {}
+
+# Lock protecting the specified types
+_specified_types_lock: Lock = Lock()
 
 
 class ArrayProxy(StaticJSONValidator, JSONValidatedBiserialisable['ArrayProxy'], ABC):
     """
     Class which acts like an array, but validates its elements using a property.
     """
+    # Whether instances can be modified (see freeze)
+    _frozen: bool = False
+
+    # Whether instances are read-only views over raw JSON (see view)
+    _is_view: bool = False
+
     def __init__(self, initial_values: Optional[Iterable] = None):
         # The list values
         self._values: List[PropertyValueType] = []
@@ -67,7 +83,8 @@ class ArrayProxy(StaticJSONValidator, JSONValidatedBiserialisable['ArrayProxy'],
                 max_elements: Optional[int] = None,
                 unique_elements: bool = False) -> Type['ArrayProxy']:
         """
-        Creates a specific array proxy-type.
+        Creates a specific array proxy-type. Calls with equivalent specifications
+        (see Property._specification) return the same type.
 
         :param element_property:    The property to use to validate array elements.
         :param min_elements:        The minimum number of elements allowed in the array.
@@ -75,26 +92,169 @@ class ArrayProxy(StaticJSONValidator, JSONValidatedBiserialisable['ArrayProxy'],
         :param unique_elements:     Whether array elements have to be unique.
         :return:                    The array proxy-type matching the specification.
         """
-        # Create the proxy-type as a closure
-        class ClosureArrayProxy(ArrayProxy):
-            @staticmethod
-            def element_property() -> Property:
-                return element_property
+        # Proxy-types with the same specification are shared (along with their validators)
+        specification = (element_property._specification(), min_elements, max_elements, unique_elements)
+        with _specified_types_lock:
+            if specification in _specified_types:
+                return _specified_types[specification]
 
-            @staticmethod
-            def min_elements() -> int:
-                return min_elements
+            # Create the proxy-type as a closure
+            class ClosureArrayProxy(ArrayProxy, metaclass=SpecifiedProxyType):
+                @staticmethod
+                def element_property() -> Property:
+                    return element_property
 
-            @staticmethod
-            def max_elements() -> Optional[int]:
-                return max_elements
+                @staticmethod
+                def min_elements() -> int:
+                    return min_elements
 
-            @staticmethod
-            def unique_elements() -> bool:
-                return unique_elements
+                @staticmethod
+                def max_elements() -> Optional[int]:
+                    return max_elements
+
+                @staticmethod
+                def unique_elements() -> bool:
+                    return unique_elements
+
+            # Record how to recreate the type when unpickled
+            ClosureArrayProxy._specify_function = ArrayProxy.specify
+            ClosureArrayProxy._specify_arguments = (element_property, min_elements, max_elements, unique_elements)
+
+            _specified_types[specification] = ClosureArrayProxy
 
         return ClosureArrayProxy
 
+    @classmethod
+    def view(cls, raw_json: RawJSONElement, validate: bool = True) -> 'ArrayProxy':
+        """
+        Creates a read-only view of the given raw JSON array, without
+        copying it. Elements are wrapped in views of their own as they
+        are accessed. The raw JSON must not be modified while the view
+        is in use.
+
+        :param raw_json:    The raw JSON array.
+        :param validate:    Whether to validate the raw JSON.
+        :return:            The view.
+        """
+        # Validate the raw JSON if requested
+        if validate:
+            cls.validate_raw_json(raw_json)
+
+        # Create the view over the raw JSON
+        view = cls.__new__(cls)
+        view._values = raw_json
+        view._frozen = True
+        view._is_view = True
+
+        return view
+
+    @property
+    def is_view(self) -> bool:
+        """
+        Whether this array is a read-only view over raw JSON (see view).
+        """
+        return self._is_view
+
+    @property
+    def is_frozen(self) -> bool:
+        """
+        Whether this array is frozen (can't be modified).
+        """
+        return self._frozen
+
+    def freeze(self) -> 'ArrayProxy':
+        """
+        Freezes this array and all JSON objects and proxies it contains,
+        so that they can no longer be modified. Raw JSON values are not
+        frozen, and should not be modified in-place.
+
+        :return:    This array.
+        """
+        if not self._frozen:
+            self._frozen = True
+            for value in self._values:
+                if hasattr(value, "freeze"):
+                    value.freeze()
+
+        return self
+
+    def __reduce__(self):
+        # Pickle the type and state only, so unpickling skips __init__ (and validation)
+        return copyreg.__newobj__, (type(self),), self.__getstate__()
+
+    def __getstate__(self):
+        # Views share their (read-only) raw JSON, otherwise the copy shares the elements
+        values = self._values if self._is_view else list(self._values)
+
+        return values, self._frozen, self._is_view
+
+    def __setstate__(self, state):
+        self._values, frozen, is_view = state
+
+        # Only set the flags on the instance if they differ from the class defaults
+        if frozen:
+            self._frozen = True
+        if is_view:
+            self._is_view = True
+
+    def _shallow_copy(self) -> 'ArrayProxy':
+        """
+        Creates a copy of this array which shares its elements with this array.
+
+        :return:    The copy.
+        """
+        copy = type(self).__new__(type(self))
+        copy._values = list(self._values) if not self._is_view else list(self)
+        return copy
+
+    def _replace_child(self, index: int, value: PropertyValueType):
+        """
+        Replaces an element of this array without validation. Only for use
+        where the value is known to be valid for the element property.
+
+        :param index:   The index of the element.
+        :param value:   The new element.
+        """
+        self._before_modification()
+        self._values[index] = value
+
+    def _before_modification(self):
+        """
+        Checks that this array can be modified, and records that it
+        is about to be.
+        """
+        if self._frozen:
+            raise ModificationDisallowed(f"Can't modify frozen {type(self).__name__}")
+
+        note_modification(self)
+
+    def _structural_contents(self):
+        """
+        Gets the elements of this array, for structural equality.
+
+        :return:    The elements (raw JSON if this array is a view).
+        """
+        return self._values
+
+    def _structural_hash(self) -> int:
+        """
+        Gets the structural hash of this array's elements. The hash
+        is cached until this array, or any JSON object or proxy it
+        contains, is modified.
+
+        :return:    The hash.
+        """
+        return cached_hash(self, lambda: sequence_hash(self._values, self))
+
+    def _elements(self) -> List[PropertyValueType]:
+        """
+        Gets the list of elements of this array, wrapping them
+        if this array is a view.
+
+        :return:    The elements.
+        """
+        return self._values if not self._is_view else list(self)
+
     def _serialise_to_raw_json(self) -> RawJSONElement:
         return [value.to_raw_json(False) if isinstance(value, JSONValidatedBiserialisable) else value
                 for value in self._values]
@@ -136,6 +296,7 @@ class ArrayProxy(StaticJSONValidator, JSONValidatedBiserialisable['ArrayProxy'],
         if self.unique_elements() and value in self:
             raise JSONError(f"Attempted to add non-unique element")
 
+        self._before_modification()
         self._values.append(self.element_property().validate_value(value))
 
     def clear(self):
@@ -145,6 +306,7 @@ class ArrayProxy(StaticJSONValidator, JSONValidatedBiserialisable['ArrayProxy'],
                             f"({self.min_elements()}) is greater than zero")
 
         # Clear the key-list
+        self._before_modification()
         self._values.clear()
 
     def copy(self):
@@ -153,7 +315,7 @@ class ArrayProxy(StaticJSONValidator, JSONValidatedBiserialisable['ArrayProxy'],
     def count(self, value) -> int:
         try:
             value = self.element_property().validate_value(value)
-            return self._values.count(value)
+            return self._elements().count(value)
         except Exception:
             return 0
 
@@ -163,7 +325,7 @@ class ArrayProxy(StaticJSONValidator, JSONValidatedBiserialisable['ArrayProxy'],
 
     def index(self, value, start: int = 0, stop: int = maxsize) -> int:
         value = self.element_property().validate_value(value)
-        return self._values.index(value, start, stop)
+        return self._elements().index(value, start, stop)
 
     def insert(self, index: int, value):
         # Make sure we're not already at max length
@@ -174,6 +336,7 @@ class ArrayProxy(StaticJSONValidator, JSONValidatedBiserialisable['ArrayProxy'],
         if self.unique_elements() and value in self:
             raise JSONError(f"Attempted to insert non-unique element")
 
+        self._before_modification()
         self._values.insert(index, self.element_property().validate_value(value))
 
     def pop(self, index: int = -1):
@@ -181,34 +344,55 @@ class ArrayProxy(StaticJSONValidator, JSONValidatedBiserialisable['ArrayProxy'],
         if len(self._values) == self.min_elements():
             raise JSONError(f"Tried to pop from list already of minimum size ({self.min_elements()})")
 
+        self._before_modification()
         return self._values.pop(index)
 
     def remove(self, value):
         self.pop(self.index(value))
 
     def reverse(self):
+        self._before_modification()
         self._values.reverse()
 
     def sort(self, *,
              key: Optional[Callable[[Any], Any]] = None,
              reverse: bool = False):
+        self._before_modification()
         self._values.sort(key=key, reverse=reverse)
 
     def __add__(self, x: List) -> List:
         return self[:] + x
 
     def __contains__(self, value) -> bool:
-        return self.element_property().validate_value(value) in self._values
+        return self.element_property().validate_value(value) in self._elements()
 
     def __delitem__(self, *args, **kwargs):
         # TODO: Implement
         raise NotImplementedError(ArrayProxy.__delitem__.__qualname__)
 
-    def __eq__(self, *args, **kwargs):
-        # TODO: Implement
-        raise NotImplementedError(ArrayProxy.__eq__.__qualname__)
+    def __eq__(self, other) -> bool:
+        # Arrays are always equal to themselves
+        if other is self:
+            return True
+
+        # Can only compare to raw arrays and other array proxies
+        if not isinstance(other, (list, tuple, ArrayProxy)):
+            return NotImplemented
+
+        return structural_equal(self, other)
+
+    def __hash__(self) -> int:
+        # Hashed consistently with equality, so modifying arrays changes their hash
+        return self._structural_hash()
 
     def __getitem__(self, y):
+        # Wrap elements if we are a view
+        if self._is_view:
+            element_property = self.element_property()
+            if isinstance(y, slice):
+                return [element_property.view_value(value) for value in self._values[y]]
+            return element_property.view_value(self._values[y])
+
         return self._values[y]
 
     def __ge__(self, *args, **kwargs):
@@ -229,6 +413,10 @@ class ArrayProxy(StaticJSONValidator, JSONValidatedBiserialisable['ArrayProxy'],
         raise NotImplementedError(ArrayProxy.__imul__.__qualname__)
 
     def __iter__(self) -> Iterator:
+        # Wrap elements if we are a view
+        if self._is_view:
+            return map(self.element_property().view_value, self._values)
+
         return iter(self._values)
 
     def __len__(self) -> int:
@@ -246,15 +434,20 @@ class ArrayProxy(StaticJSONValidator, JSONValidatedBiserialisable['ArrayProxy'],
         # TODO: Implement
         raise NotImplementedError(ArrayProxy.__mul__.__qualname__)
 
-    def __ne__(self, *args, **kwargs):
-        # TODO: Implement
-        raise NotImplementedError(ArrayProxy.__ne__.__qualname__)
+    def __ne__(self, other) -> bool:
+        equal = self.__eq__(other)
+
+        return equal if equal is NotImplemented else not equal
 
     def __repr__(self):
         # TODO: Implement
         raise NotImplementedError(ArrayProxy.__repr__.__qualname__)
 
     def __reversed__(self):
+        # Wrap elements if we are a view
+        if self._is_view:
+            return map(self.element_property().view_value, reversed(self._values))
+
         return reversed(self._values)
 
     def __rmul__(self, *args, **kwargs):
@@ -269,6 +462,7 @@ class ArrayProxy(StaticJSONValidator, JSONValidatedBiserialisable['ArrayProxy'],
         if self.unique_elements() and value in self._values and self._values[index] != value:
             raise JSONError(f"Attempted to set element to non-unique element")
 
+        self._before_modification()
         self._values[index] = value
 
     def __str__(self):
@@ -1,18 +1,34 @@
+import copyreg
 from abc import abstractmethod, ABC
-from typing import Iterable, Optional, Dict, Union, Mapping, Type
+from threading import Lock
+from typing import Iterable, Optional, Dict, Union, Mapping, Type, Hashable
 
-from ....error import OptionalDisallowed
+from ....error import OptionalDisallowed, ModificationDisallowed
 from ....serialise import JSONValidatedBiserialisable
 from ....schema import JSONSchema, standard_object
 from ....validator import StaticJSONValidator
+from ..._hashing import note_modification, cached_hash, mapping_hash, structural_equal
 from ..._typing import RawJSONElement, PropertyValueType
 from .._Property import Property
+from ._SpecifiedProxyType import SpecifiedProxyType
+
+# The map proxy-types created by MapProxy.specify, by specification
+_specified_types: Dict[Hashable, Type['MapProxy']] = {}
+
+# Lock protecting the specified types
+_specified_types_lock: Lock = Lock()
 
 
 class MapProxy(StaticJSONValidator, JSONValidatedBiserialisable['MapProxy'], ABC):
     """
     Class which acts like a map, but validates its elements using a property.
     """
+    # Whether instances can be modified (see freeze)
+    _frozen: bool = False
+
+    # Whether instances are read-only views over raw JSON (see view)
+    _is_view: bool = False
+
     def __init__(self,
                  initial_values: Optional[Union[Iterable, Mapping]] = None,
                  **kwargs):
@@ -33,19 +49,154 @@ class MapProxy(StaticJSONValidator, JSONValidatedBiserialisable['MapProxy'], ABC
     @staticmethod
     def specify(value_property: Property) -> Type['MapProxy']:
         """
-        Creates a specific map proxy-type.
+        Creates a specific map proxy-type. Calls with equivalent specifications
+        (see Property._specification) return the same type.
 
         :param value_property:      The property to use to validate map values.
         :return:                    The map proxy-type matching the specification.
         """
-        # Create the proxy-type as a closure
-        class ClosureMapProxy(MapProxy):
-            @staticmethod
-            def value_property() -> Property:
-                return value_property
+        # Proxy-types with the same specification are shared (along with their validators)
+        specification = value_property._specification()
+        with _specified_types_lock:
+            if specification in _specified_types:
+                return _specified_types[specification]
+
+            # Create the proxy-type as a closure
+            class ClosureMapProxy(MapProxy, metaclass=SpecifiedProxyType):
+                @staticmethod
+                def value_property() -> Property:
+                    return value_property
+
+            # Record how to recreate the type when unpickled
+            ClosureMapProxy._specify_function = MapProxy.specify
+            ClosureMapProxy._specify_arguments = (value_property,)
+
+            _specified_types[specification] = ClosureMapProxy
 
         return ClosureMapProxy
 
+    @classmethod
+    def view(cls, raw_json: RawJSONElement, validate: bool = True) -> 'MapProxy':
+        """
+        Creates a read-only view of the given raw JSON object, without
+        copying it. Values are wrapped in views of their own as they
+        are accessed. The raw JSON must not be modified while the view
+        is in use.
+
+        :param raw_json:    The raw JSON object.
+        :param validate:    Whether to validate the raw JSON.
+        :return:            The view.
+        """
+        # Validate the raw JSON if requested
+        if validate:
+            cls.validate_raw_json(raw_json)
+
+        # Create the view over the raw JSON
+        view = cls.__new__(cls)
+        view._values = raw_json
+        view._frozen = True
+        view._is_view = True
+
+        return view
+
+    @property
+    def is_view(self) -> bool:
+        """
+        Whether this map is a read-only view over raw JSON (see view).
+        """
+        return self._is_view
+
+    @property
+    def is_frozen(self) -> bool:
+        """
+        Whether this map is frozen (can't be modified).
+        """
+        return self._frozen
+
+    def freeze(self) -> 'MapProxy':
+        """
+        Freezes this map and all JSON objects and proxies it contains,
+        so that they can no longer be modified. Raw JSON values are not
+        frozen, and should not be modified in-place.
+
+        :return:    This map.
+        """
+        if not self._frozen:
+            self._frozen = True
+            for value in self._values.values():
+                if hasattr(value, "freeze"):
+                    value.freeze()
+
+        return self
+
+    def __reduce__(self):
+        # Pickle the type and state only, so unpickling skips __init__ (and validation)
+        return copyreg.__newobj__, (type(self),), self.__getstate__()
+
+    def __getstate__(self):
+        # Views share their (read-only) raw JSON, otherwise the copy shares the elements
+        values = self._values if self._is_view else dict(self._values)
+
+        return values, self._frozen, self._is_view
+
+    def __setstate__(self, state):
+        self._values, frozen, is_view = state
+
+        # Only set the flags on the instance if they differ from the class defaults
+        if frozen:
+            self._frozen = True
+        if is_view:
+            self._is_view = True
+
+    def _shallow_copy(self) -> 'MapProxy':
+        """
+        Creates a copy of this map which shares its values with this map.
+
+        :return:    The copy.
+        """
+        copy = type(self).__new__(type(self))
+        copy._values = dict(self._values) if not self._is_view else dict(self.items())
+        return copy
+
+    def _replace_child(self, key: str, value: PropertyValueType):
+        """
+        Replaces a value in this map without validation. Only for use
+        where the value is known to be valid for the value property.
+
+        :param key:     The key of the value.
+        :param value:   The new value.
+        """
+        self._before_modification()
+        self._values[key] = value
+
+    def _before_modification(self):
+        """
+        Checks that this map can be modified, and records that it
+        is about to be.
+        """
+        if self._frozen:
+            raise ModificationDisallowed(f"Can't modify frozen {type(self).__name__}")
+
+        note_modification(self)
+
+    def _structural_contents(self):
+        """
+        Gets the values of this map, for structural equality.
+
+        :return:    The values (raw JSON if this map is a view).
+        """
+        return self._values
+
+    def _structural_hash(self) -> int:
+        """
+        Gets the structural hash of this map's values. The hash
+        is cached until this map, or any JSON object or proxy it
+        contains, is modified.
+
+        :return:    The hash.
+        """
+        return cached_hash(self, lambda: mapping_hash(self._values.items(), self))
+
     def _serialise_to_raw_json(self) -> RawJSONElement:
         return {key: value.to_raw_json(False) if isinstance(value, JSONValidatedBiserialisable) else value
                 for key, value in self._values.items()}
@@ -70,6 +221,7 @@ class MapProxy(StaticJSONValidator, JSONValidatedBiserialisable['MapProxy'], ABC
     # ------------ #
 
     def clear(self):
+        self._before_modification()
         self._values.clear()
 
     def copy(self):
@@ -81,18 +233,29 @@ class MapProxy(StaticJSONValidator, JSONValidatedBiserialisable['MapProxy'], ABC
         raise NotImplementedError(MapProxy.fromkeys.__qualname__)
 
     def get(self, k: str, default=None):
+        # Wrap values if we are a view
+        if self._is_view and k in self._values:
+            return self.value_property().view_value(self._values[k])
+
         return self._values.get(k, default)
 
     def items(self):
+        # Wrap values if we are a view
+        if self._is_view:
+            value_property = self.value_property()
+            return ((key, value_property.view_value(value)) for key, value in self._values.items())
+
         return self._values.items()
 
     def keys(self):
         return self._values.keys()
 
     def pop(self, k, d=None):
+        self._before_modification()
         return self._values.pop(k, d)
 
     def popitem(self):
+        self._before_modification()
         return self._values.popitem()
 
     def setdefault(self, key, default):
@@ -114,19 +277,39 @@ class MapProxy(StaticJSONValidator, JSONValidatedBiserialisable['MapProxy'], ABC
             self[k] = F[k]
 
     def values(self):
+        # Wrap values if we are a view
+        if self._is_view:
+            return map(self.value_property().view_value, self._values.values())
+
         return self._values.values()
 
     def __contains__(self, key: str) -> bool:
         return key in self._values
 
     def __delitem__(self, key: str):
+        self._before_modification()
         del self._values[key]
 
-    def __eq__(self, *args, **kwargs):
-        # TODO: Implement
-        raise NotImplementedError(MapProxy.__eq__.__qualname__)
+    def __eq__(self, other) -> bool:
+        # Maps are always equal to themselves
+        if other is self:
+            return True
+
+        # Can only compare to raw objects and other map proxies
+        if not isinstance(other, (dict, MapProxy)):
+            return NotImplemented
+
+        return structural_equal(self, other)
+
+    def __hash__(self) -> int:
+        # Hashed consistently with equality, so modifying maps changes their hash
+        return self._structural_hash()
 
     def __getitem__(self, y):
+        # Wrap values if we are a view
+        if self._is_view:
+            return self.value_property().view_value(self._values[y])
+
         return self._values[y]
 
     def __ge__(self, *args, **kwargs):
@@ -151,16 +334,19 @@ class MapProxy(StaticJSONValidator, JSONValidatedBiserialisable['MapProxy'], ABC
         # TODO: Implement
         raise NotImplementedError(MapProxy.__lt__.__qualname__)
 
-    def __ne__(self, *args, **kwargs):
-        # TODO: Implement
-        raise NotImplementedError(MapProxy.__ne__.__qualname__)
+    def __ne__(self, other) -> bool:
+        equal = self.__eq__(other)
+
+        return equal if equal is NotImplemented else not equal
 
     def __repr__(self):
         # TODO: Implement
         raise NotImplementedError(MapProxy.__repr__.__qualname__)
 
     def __setitem__(self, key: str, value):
-        self._values[key] = self.value_property().validate_value(value)
+        value = self.value_property().validate_value(value)
+        self._before_modification()
+        self._values[key] = value
 
     def __str__(self):
         return str(self._values)
@@ -0,0 +1,20 @@
+import copyreg
+from abc import ABCMeta
+from typing import Callable, Tuple, Any
+
+
+class SpecifiedProxyType(ABCMeta):
+    """
+    Meta-class of the proxy types created by ArrayProxy.specify and
+    MapProxy.specify. These types aren't defined at module level, so
+    are pickled by their specification instead of by name, and are
+    recreated (or found, as specify shares types between identical
+    specifications) when unpickled.
+    """
+    def __reduce__(cls) -> Tuple[Callable, Tuple[Any, ...]]:
+        return cls._specify_function, cls._specify_arguments
+
+
+# Pickle dispatches on the exact type of the pickled object, and would otherwise
+# pickle classes by name regardless of their meta-class's __reduce__
+copyreg.pickle(SpecifiedProxyType, SpecifiedProxyType.__reduce__)
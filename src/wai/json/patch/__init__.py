@@ -0,0 +1,6 @@
+"""
+Package for creating and applying JSON patches (RFC 6902) to
+JSON objects.
+"""
+from ._apply import apply_patch
+from ._diff import diff
@@ -0,0 +1,159 @@
+from typing import Any, Tuple
+
+from ..error import JSONPatchError, JSONPathError
+from ..object import JSONObject
+from ..object._hashing import structural_equal
+from ..object._structural import PathKey, get_at_path, has_child, remove_child, update_path
+from ..pointer import JSONPointer
+from ..raw import RawJSONArray, RawJSONElement, RawJSONObject, deep_copy
+from ._util import is_array, to_raw_json
+
+# The operations which can appear in a patch, and the members they require
+OPERATIONS = {
+    "add": ("path", "value"),
+    "remove": ("path",),
+    "replace": ("path", "value"),
+    "move": ("from", "path"),
+    "copy": ("from", "path"),
+    "test": ("path", "value")
+}
+
+
+def apply_patch(obj: JSONObject, patch: RawJSONArray) -> JSONObject:
+    """
+    Applies a JSON patch (RFC 6902) to a JSON object. The object itself
+    is not modified; instead an updated copy is returned which shares all
+    unchanged sub-structure with the original (see JSONObject.evolve).
+    Only the values touched by the patch are validated. If any operation
+    fails, the error is raised and no changes are made.
+
+    :param obj:     The JSON object to patch.
+    :param patch:   The patch, as a list of raw JSON operations.
+    :return:        The patched copy of the object.
+    """
+    # The patch must be a list of operations
+    if not isinstance(patch, (list, tuple)):
+        raise JSONPatchError(f"Patch must be an array of operations, got {type(patch).__name__}")
+
+    for operation in patch:
+        obj = apply_operation(obj, operation)
+
+    return obj
+
+
+def apply_operation(obj: JSONObject, operation: RawJSONObject) -> JSONObject:
+    """
+    Applies a single patch operation to a JSON object.
+
+    :param obj:         The JSON object to patch.
+    :param operation:   The raw JSON operation.
+    :return:            The patched copy of the object.
+    """
+    # Check the operation is well-formed
+    if not isinstance(operation, dict):
+        raise JSONPatchError(f"Patch operations must be objects, got {type(operation).__name__}")
+    op = operation.get("op", None)
+    if not isinstance(op, str) or op not in OPERATIONS:
+        raise JSONPatchError(f"Unknown patch operation {op!r}")
+    for member in OPERATIONS[op]:
+        if member not in operation:
+            raise JSONPatchError(f"Patch operation '{op}' is missing '{member}'")
+
+        # Paths are JSON pointer strings
+        if member in ("path", "from") and not isinstance(operation[member], str):
+            raise JSONPatchError(f"Patch operation '{op}' member '{member}' must be a string, "
+                                 f"got {type(operation[member]).__name__}")
+
+    path = JSONPointer.compile(operation["path"]).tokens
+
+    if op == "add":
+        return add(obj, path, deep_copy(operation["value"]))
+    elif op == "remove":
+        return remove(obj, path)
+    elif op == "replace":
+        return replace(obj, path, deep_copy(operation["value"]))
+    elif op == "test":
+        # Values must have the same JSON types, not just be equal in Python (RFC 6902 4.6)
+        if not structural_equal(get_at_path(obj, path), operation["value"]):
+            raise JSONPatchError(f"Test failed for path '{operation['path']}'")
+        return obj
+
+    # Move and copy take a value from elsewhere in the object
+    from_path = JSONPointer.compile(operation["from"]).tokens
+    value = to_raw_json(get_at_path(obj, from_path))
+
+    if op == "move":
+        # Can't move a value into one of its own children
+        if path[:len(from_path)] == from_path and len(path) > len(from_path):
+            raise JSONPatchError(f"Can't move '{operation['from']}' into its own child '{operation['path']}'")
+        obj = remove(obj, from_path)
+
+    return add(obj, path, value)
+
+
+def replace_root(obj: JSONObject, value: RawJSONElement) -> JSONObject:
+    """
+    Replaces an entire JSON object with one deserialised from raw JSON.
+
+    :param obj:     The object being replaced.
+    :param value:   The raw JSON of the replacement.
+    :return:        The replacement object.
+    """
+    return type(obj).from_raw_json(value)
+
+
+def add(obj: JSONObject, path: Tuple[str, ...], value: RawJSONElement) -> JSONObject:
+    """
+    Adds a value at the given path, inserting it if the parent is an array.
+
+    :param obj:     The JSON object to patch.
+    :param path:    The reference tokens of the path.
+    :param value:   The raw JSON value to add.
+    :return:        The patched copy of the object.
+    """
+    if len(path) == 0:
+        return replace_root(obj, value)
+
+    def update(parent: Any, key: PathKey):
+        if is_array(parent):
+            if key > len(parent):
+                raise JSONPathError(f"Array index {key} out of range")
+            parent.insert(key, value)
+        else:
+            parent[key] = value
+
+    return update_path(obj, path, update, allow_end=True)
+
+
+def remove(obj: JSONObject, path: Tuple[str, ...]) -> JSONObject:
+    """
+    Removes the value at the given path.
+
+    :param obj:     The JSON object to patch.
+    :param path:    The reference tokens of the path.
+    :return:        The patched copy of the object.
+    """
+    if len(path) == 0:
+        raise JSONPatchError("Can't remove the root of a JSON object")
+
+    return update_path(obj, path, remove_child)
+
+
+def replace(obj: JSONObject, path: Tuple[str, ...], value: RawJSONElement) -> JSONObject:
+    """
+    Replaces the existing value at the given path.
+
+    :param obj:     The JSON object to patch.
+    :param path:    The reference tokens of the path.
+    :param value:   The raw JSON replacement value.
+    :return:        The patched copy of the object.
+    """
+    if len(path) == 0:
+        return replace_root(obj, value)
+
+    def update(parent: Any, key: PathKey):
+        if not has_child(parent, key):
+            raise JSONPathError(f"No value at key {key!r}")
+        parent[key] = value
+
+    return update_path(obj, path, update)
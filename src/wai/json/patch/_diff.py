@@ -0,0 +1,127 @@
+from typing import Any, List
+
+from ..error import JSONPatchError
+from ..object import JSONObject
+from ..object._hashing import structural_equal
+from ..pointer import escape_token
+from ..raw import RawJSONArray, RawJSONObject
+from ._util import is_mapping, is_array, mapping_items, to_raw_json
+
+
+def diff(source: JSONObject, target: JSONObject) -> RawJSONArray:
+    """
+    Creates a JSON patch (RFC 6902) which transforms one JSON object
+    into another of the same type. Sub-structure which is shared between
+    the two objects (e.g. as created by JSONObject.evolve) is skipped
+    without being compared, so diffing an object against an updated copy
+    of itself is proportional to the size of the update.
+
+    :param source:  The object to transform from.
+    :param target:  The object to transform to.
+    :return:        The patch, as a list of raw JSON operations.
+    """
+    # Can only diff objects of the same type
+    if type(source) is not type(target):
+        raise JSONPatchError(f"Can't diff {type(source).__name__} against {type(target).__name__}")
+
+    operations: List[RawJSONObject] = []
+    diff_node(source, target, "", operations)
+
+    return operations
+
+
+def diff_node(source: Any, target: Any, pointer: str, operations: List[RawJSONObject]):
+    """
+    Adds the operations which transform the source node into the
+    target node to the list of operations.
+
+    :param source:      The source node.
+    :param target:      The target node.
+    :param pointer:     The JSON pointer to the source node.
+    :param operations:  The list of operations to add to.
+    """
+    # Shared sub-structure is always unchanged
+    if source is target:
+        return
+
+    # JSON objects of different types can't be diffed
+    if isinstance(source, JSONObject) and isinstance(target, JSONObject) and type(source) is not type(target):
+        operations.append({"op": "replace", "path": pointer, "value": to_raw_json(target)})
+    elif is_mapping(source) and is_mapping(target):
+        diff_mapping(source, target, pointer, operations)
+    elif is_array(source) and is_array(target):
+        diff_array(source, target, pointer, operations)
+    elif is_mapping(source) or is_array(source) or type(source) is not type(target) or source != target:
+        operations.append({"op": "replace", "path": pointer, "value": to_raw_json(target)})
+
+
+def diff_mapping(source: Any, target: Any, pointer: str, operations: List[RawJSONObject]):
+    """
+    Adds the operations which transform one mapping node into another.
+
+    :param source:      The source mapping.
+    :param target:      The target mapping.
+    :param pointer:     The JSON pointer to the source mapping.
+    :param operations:  The list of operations to add to.
+    """
+    source_items = mapping_items(source)
+    target_items = mapping_items(target)
+
+    # Remove keys which aren't in the target
+    for key in source_items:
+        if key not in target_items:
+            operations.append({"op": "remove", "path": f"{pointer}/{escape_token(key)}"})
+
+    # Add new keys and diff existing keys
+    for key, value in target_items.items():
+        child_pointer = f"{pointer}/{escape_token(key)}"
+        if key in source_items:
+            diff_node(source_items[key], value, child_pointer, operations)
+        else:
+            operations.append({"op": "add", "path": child_pointer, "value": to_raw_json(value)})
+
+
+def diff_array(source: Any, target: Any, pointer: str, operations: List[RawJSONObject]):
+    """
+    Adds the operations which transform one array node into another.
+    Elements common to the start and end of both arrays are kept, and
+    the remaining elements are diffed pairwise, with any excess removed
+    from or added to the source.
+
+    :param source:      The source array.
+    :param target:      The target array.
+    :param pointer:     The JSON pointer to the source array.
+    :param operations:  The list of operations to add to.
+    """
+    source = list(source)
+    target = list(target)
+
+    # Find the length of the common prefix
+    prefix = 0
+    limit = min(len(source), len(target))
+    while prefix < limit and structural_equal(source[prefix], target[prefix], exact_numbers=True):
+        prefix += 1
+
+    # Find the length of the common suffix (if the lengths differ)
+    suffix = 0
+    if len(source) != len(target):
+        limit -= prefix
+        while suffix < limit and structural_equal(source[-1 - suffix], target[-1 - suffix], exact_numbers=True):
+            suffix += 1
+
+    # Diff the differing middle sections pairwise
+    source_middle = source[prefix:len(source) - suffix]
+    target_middle = target[prefix:len(target) - suffix]
+    common = min(len(source_middle), len(target_middle))
+    for index in range(common):
+        diff_node(source_middle[index], target_middle[index], f"{pointer}/{prefix + index}", operations)
+
+    # Remove excess source elements (each removal shifts the next into place)
+    for _ in range(len(source_middle) - common):
+        operations.append({"op": "remove", "path": f"{pointer}/{prefix + common}"})
+
+    # Add excess target elements
+    for index in range(common, len(target_middle)):
+        operations.append({"op": "add",
+                           "path": f"{pointer}/{prefix + index}",
+                           "value": to_raw_json(target_middle[index])})
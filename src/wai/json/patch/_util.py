@@ -0,0 +1,57 @@
+"""
+Helper functions shared by the patch functions.
+"""
+from typing import Any, Dict
+
+from ..object import JSONObject
+from ..object.property.proxies import ArrayProxy, MapProxy
+from ..raw import RawJSONElement, deep_copy
+from ..serialise import JSONValidatedBiserialisable
+
+
+def is_mapping(node: Any) -> bool:
+    """
+    Whether the given node is a JSON object, map proxy or raw
+    JSON object.
+
+    :param node:    The node.
+    :return:        True if the node maps keys to values.
+    """
+    return isinstance(node, (JSONObject, MapProxy, dict))
+
+
+def is_array(node: Any) -> bool:
+    """
+    Whether the given node is an array proxy or raw JSON array.
+
+    :param node:    The node.
+    :return:        True if the node is an array.
+    """
+    return isinstance(node, (ArrayProxy, list, tuple))
+
+
+def mapping_items(node: Any) -> Dict[str, Any]:
+    """
+    Gets the key/value pairs of a mapping node. For JSON objects,
+    only properties with values are included.
+
+    :param node:    The mapping node.
+    :return:        The key/value pairs.
+    """
+    if isinstance(node, JSONObject):
+        return {name: node.get_property(name) for name in node._property_values}
+
+    return dict(node.items())
+
+
+def to_raw_json(value: Any) -> RawJSONElement:
+    """
+    Gets an independent raw JSON copy of a value.
+
+    :param value:   The value.
+    :return:        The raw JSON.
+    """
+    if isinstance(value, JSONValidatedBiserialisable):
+        value = value.to_raw_json(False)
+
+    return deep_copy(value)
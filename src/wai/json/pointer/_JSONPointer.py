@@ -0,0 +1,72 @@
+from functools import lru_cache
+from typing import Tuple, Iterator, Optional
+
+from ..error import JSONPathError
+from ._functions import parse_pointer, format_pointer
+
+
+class JSONPointer:
+    """
+    A compiled JSON pointer (RFC 6901). Holds the unescaped reference
+    tokens of the pointer so that it doesn't need to be re-parsed each
+    time it is used. Use JSONPointer.compile to take advantage of the
+    cache of previously-compiled pointers.
+    """
+    __slots__ = ("_tokens", "_string")
+
+    def __init__(self, tokens: Tuple[str, ...], string: Optional[str] = None):
+        # The unescaped reference tokens
+        self._tokens: Tuple[str, ...] = tuple(tokens)
+
+        # The string form of the pointer
+        self._string: str = string if string is not None else format_pointer(self._tokens)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def compile(pointer: str) -> 'JSONPointer':
+        """
+        Compiles a JSON pointer string, reusing a previous compilation
+        of the same string if available.
+
+        :param pointer:     The JSON pointer string.
+        :return:            The compiled pointer.
+        """
+        return JSONPointer(parse_pointer(pointer), pointer)
+
+    @property
+    def tokens(self) -> Tuple[str, ...]:
+        """
+        The unescaped reference tokens of this pointer.
+        """
+        return self._tokens
+
+    @property
+    def parent(self) -> 'JSONPointer':
+        """
+        The pointer to the parent of the value this pointer refers to.
+        """
+        if len(self._tokens) == 0:
+            raise JSONPathError("The root pointer has no parent")
+
+        return JSONPointer(self._tokens[:-1])
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tokens)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, JSONPointer):
+            return NotImplemented
+
+        return self._tokens == other._tokens
+
+    def __hash__(self) -> int:
+        return hash(self._tokens)
+
+    def __str__(self) -> str:
+        return self._string
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._string!r})"
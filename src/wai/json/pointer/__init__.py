@@ -0,0 +1,11 @@
+"""
+Package for working with JSON pointers (RFC 6901), which identify
+values within a JSON document.
+"""
+from ._JSONPointer import JSONPointer
+from ._functions import (
+    escape_token,
+    unescape_token,
+    parse_pointer,
+    format_pointer
+)
@@ -0,0 +1,56 @@
+"""
+Functions for converting between JSON pointer strings and
+sequences of reference tokens.
+"""
+from typing import Tuple, Iterable
+
+from ..error import JSONPathError
+
+
+def escape_token(token: str) -> str:
+    """
+    Escapes a reference token for inclusion in a JSON pointer.
+
+    :param token:   The reference token.
+    :return:        The escaped token.
+    """
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def unescape_token(token: str) -> str:
+    """
+    Unescapes a reference token from a JSON pointer.
+
+    :param token:   The escaped token.
+    :return:        The reference token.
+    """
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def parse_pointer(pointer: str) -> Tuple[str, ...]:
+    """
+    Parses a JSON pointer into its reference tokens.
+
+    :param pointer:     The JSON pointer, e.g. "/a/b/3/c".
+    :return:            The reference tokens, e.g. ("a", "b", "3", "c").
+    """
+    # The empty pointer refers to the whole document
+    if pointer == "":
+        return tuple()
+
+    # All other pointers must start with a slash
+    if not pointer.startswith("/"):
+        raise JSONPathError(f"JSON pointers must be empty or start with '/', got '{pointer}'")
+
+    return tuple(unescape_token(token) for token in pointer[1:].split("/"))
+
+
+def format_pointer(tokens: Iterable) -> str:
+    """
+    Formats a sequence of reference tokens (or array indices)
+    as a JSON pointer.
+
+    :param tokens:  The reference tokens.
+    :return:        The JSON pointer.
+    """
+    return "".join(f"/{escape_token(str(token))}" for token in tokens)
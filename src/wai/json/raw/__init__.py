@@ -13,8 +13,15 @@ Number      <->     int, float
 Boolean     <->     bool
 Null        <->     None
 """
+from ._canonical import (
+    canonical_dumps,
+    canonical_number,
+    content_hash
+)
 from ._deep_copy import deep_copy
 from ._dynamic import (
+    RawJSONProblem,
+    check_raw_json,
     is_raw_json_object,
     is_raw_json_array,
     is_raw_json_string,
@@ -25,6 +32,12 @@ from ._dynamic import (
     is_raw_json_element,
     is_raw_json_element_type
 )
+from ._frozen import FrozenRawJSONObject
+from ._measure import (
+    RawJSONMeasurements,
+    measure
+)
+from ._shared import SharedNumericArray
 from ._typing import (
     RawJSONObject,
     RawJSONArray,
@@ -0,0 +1,310 @@
+"""
+Module for the canonical encoding of raw JSON, based on the JSON
+Canonicalization Scheme (RFC 8785): object keys are sorted, there is
+no whitespace, strings are minimally escaped and numbers are written
+as ECMAScript would (so 1 and 1.0 encode the same). Integers are
+written exactly, rather than via floating-point. An exact variant of
+the encoding (which isn't JSON) also distinguishes values which encode
+the same canonically, such as 1 and 1.0, or arrays and tuples.
+"""
+import hashlib
+import math
+from json.encoder import encode_basestring
+from itertools import chain, repeat
+from typing import Iterator, List, Any, Tuple, Dict, Callable
+
+from ..error import JSONSerialisationError
+from ._dynamic import PRIMITIVE_TYPES
+from ._typing import RawJSONElement, RawJSONNumber
+
+# The number of pieces of encoded text to collect before yielding them as a chunk
+CHUNK_PARTS: int = 4096
+
+# Magnitude from which ECMAScript writes numbers in exponential form
+EXPONENTIAL_THRESHOLD: int = 10 ** 21
+
+
+def canonical_number(number: RawJSONNumber) -> str:
+    """
+    Encodes a number canonically, as ECMAScript's Number.toString would.
+
+    :param number:  The number.
+    :return:        The encoded number.
+    """
+    # Integers are written exactly if ECMAScript wouldn't use exponential form
+    if isinstance(number, int):
+        if -EXPONENTIAL_THRESHOLD < number < EXPONENTIAL_THRESHOLD:
+            return int.__repr__(number)
+        number = float(number)
+
+    if not math.isfinite(number):
+        raise JSONSerialisationError(f"Can't encode non-finite number {number!r} as JSON")
+
+    # Most floats are written the same by Python, so check that first
+    representation = float.__repr__(number)
+    if "e" not in representation and not representation.endswith(".0"):
+        return representation
+
+    # Zero (including negative zero)
+    if number == 0:
+        return "0"
+
+    sign = "-" if number < 0 else ""
+
+    # Get the shortest round-trip digits and their exponent from repr
+    mantissa, _, exponent = representation.lstrip("-").partition("e")
+    integer_part, _, fraction_part = mantissa.partition(".")
+    digits = integer_part + fraction_part
+    stripped = digits.lstrip("0")
+
+    # The position of the decimal point relative to the first significant digit
+    point = len(integer_part) + int(exponent or 0) - (len(digits) - len(stripped))
+    digits = stripped.rstrip("0")
+
+    # Integers below the threshold
+    if len(digits) <= point <= 21:
+        return sign + digits + "0" * (point - len(digits))
+
+    # Decimals with a non-zero integer part
+    if 0 < point <= 21:
+        return sign + digits[:point] + "." + digits[point:]
+
+    # Small decimals
+    if -6 < point <= 0:
+        return sign + "0." + "0" * -point + digits
+
+    # Exponential form
+    exponent = point - 1
+    return (sign
+            + digits[0]
+            + ("." + digits[1:] if len(digits) > 1 else "")
+            + ("e+" if exponent > 0 else "e-")
+            + str(abs(exponent)))
+
+
+def exact_number(number: RawJSONNumber) -> str:
+    """
+    Encodes a number exactly, distinguishing integers from floats.
+
+    :param number:  The number.
+    :return:        The encoded number.
+    """
+    if isinstance(number, int):
+        return int.__repr__(number)
+
+    if not math.isfinite(number):
+        raise JSONSerialisationError(f"Can't encode non-finite number {number!r} as JSON")
+
+    return float.__repr__(number)
+
+
+# The canonical encoders for primitives, by exact type
+PRIMITIVE_ENCODERS: Dict[type, Callable[[Any], str]] = {
+    str: encode_basestring,
+    int: canonical_number,
+    float: canonical_number,
+    bool: lambda value: "true" if value else "false",
+    type(None): lambda value: "null"
+}
+
+# The exact encoders for primitives, by exact type
+EXACT_PRIMITIVE_ENCODERS: Dict[type, Callable[[Any], str]] = {
+    **PRIMITIVE_ENCODERS,
+    int: exact_number,
+    float: exact_number
+}
+
+
+def canonical_key(key: str) -> bytes:
+    """
+    Gets the sort key for an object key, as RFC 8785 sorts keys
+    by their UTF-16 code units.
+
+    :param key:     The object key.
+    :return:        The sort key.
+    """
+    return key.encode("utf-16-be", "surrogatepass")
+
+
+def canonical_primitive(value: Any, exact: bool = False) -> str:
+    """
+    Encodes a primitive value (or empty container) canonically.
+
+    :param value:   The value.
+    :param exact:   Whether to use the exact encoding.
+    :return:        The encoded value.
+    """
+    # Use the encoder for the exact type if there is one
+    encoder = (EXACT_PRIMITIVE_ENCODERS if exact else PRIMITIVE_ENCODERS).get(type(value), None)
+    if encoder is not None:
+        return encoder(value)
+
+    # Check bool before int, as it's a sub-class
+    if value is None:
+        return "null"
+    elif value is True:
+        return "true"
+    elif value is False:
+        return "false"
+    elif isinstance(value, str):
+        return encode_basestring(value)
+    elif isinstance(value, (int, float)):
+        return exact_number(value) if exact else canonical_number(value)
+    elif isinstance(value, dict) and len(value) == 0:
+        return "{}"
+    elif isinstance(value, (list, tuple)) and len(value) == 0:
+        return "()" if exact and isinstance(value, tuple) else "[]"
+
+    raise JSONSerialisationError(f"Can't encode non-JSON value {value!r}")
+
+
+def canonical_items(container: Any, opening: str) -> Iterator[Tuple[str, Any]]:
+    """
+    Gets the contents of a non-empty container for encoding, each value
+    paired with the text that precedes it (bracket/separator, and key
+    for objects).
+
+    :param container:   The container.
+    :param opening:     The opening bracket for arrays.
+    :return:            An iterator over (preceding text, value) pairs.
+    """
+    if isinstance(container, dict):
+        keys = sorted(container)
+        if not all(map(str.isascii, keys)):
+            keys.sort(key=canonical_key)
+        texts = ["," + encode_basestring(key) + ":" for key in keys]
+        texts[0] = "{" + texts[0][1:]
+        return zip(texts, [container[key] for key in keys])
+
+    return zip(chain((opening,), repeat(",")), container)
+
+
+def iter_canonical(raw_json: RawJSONElement, exact: bool = False) -> Iterator[str]:
+    """
+    Iterates over chunks of the canonical encoding of raw JSON,
+    without creating the whole encoding.
+
+    :param raw_json:    The raw JSON.
+    :param exact:       Whether to use the exact encoding, which writes numbers
+                        as Python does (so integers are always exact, and differ
+                        from floats) and tuples in parentheses. This isn't JSON.
+    :return:            An iterator over the chunks of the encoding.
+    """
+    # Primitives (and empty containers) are encoded in one piece
+    if not is_non_empty_container(raw_json):
+        yield canonical_primitive(raw_json, exact)
+        return
+
+    # The encoded text not yet yielded
+    parts: List[str] = []
+
+    # The containers being encoded, innermost last, as (contents, closing bracket,
+    # ID) frames, and the IDs of those containers for detecting cycles
+    stack: List[Tuple[Iterator[Tuple[str, Any]], str, int]] = []
+    on_path = set()
+
+    # Encode iteratively, starting with the root container
+    get_encoder = (EXACT_PRIMITIVE_ENCODERS if exact else PRIMITIVE_ENCODERS).get
+    push_container(raw_json, stack, on_path, exact)
+    while len(stack) > 0:
+        contents, closing, container_id = stack[-1]
+        for text, value in contents:
+            parts.append(text)
+
+            # Primitives are encoded by exact type first, as it's the most common case
+            encoder = get_encoder(type(value), None)
+            if encoder is not None:
+                parts.append(encoder(value))
+
+            # Start encoding nested containers
+            elif is_non_empty_container(value):
+                push_container(value, stack, on_path, exact)
+                break
+
+            else:
+                parts.append(canonical_primitive(value, exact))
+
+        # Finished encoding a container
+        else:
+            stack.pop()
+            on_path.remove(container_id)
+            parts.append(closing)
+
+        # Yield the encoding in chunks
+        if len(parts) >= CHUNK_PARTS:
+            yield "".join(parts)
+            parts.clear()
+
+    yield "".join(parts)
+
+
+def is_non_empty_container(value: Any) -> bool:
+    """
+    Whether a value is a non-empty raw JSON container.
+
+    :param value:   The value.
+    :return:        True if the value is a non-empty object or array.
+    """
+    return type(value) not in PRIMITIVE_TYPES and isinstance(value, (dict, list, tuple)) and len(value) > 0
+
+
+def push_container(container: Any, stack: list, on_path: set, exact: bool):
+    """
+    Starts encoding a container by adding a frame for it to the stack.
+
+    :param container:   The container.
+    :param stack:       The stack of frames.
+    :param on_path:     The IDs of the containers currently being encoded.
+    :param exact:       Whether to use the exact encoding.
+    """
+    # Can't encode a container that contains itself
+    container_id = id(container)
+    if container_id in on_path:
+        raise JSONSerialisationError("Can't encode raw JSON which contains itself")
+    on_path.add(container_id)
+
+    # Object keys must be strings
+    if isinstance(container, dict):
+        for key in container:
+            if not isinstance(key, str):
+                raise JSONSerialisationError(f"Can't encode non-string object key {key!r}")
+
+    # Tuples are bracketed differently in the exact encoding
+    if isinstance(container, dict):
+        opening, closing = "{", "}"
+    elif exact and isinstance(container, tuple):
+        opening, closing = "(", ")"
+    else:
+        opening, closing = "[", "]"
+
+    stack.append((canonical_items(container, opening), closing, container_id))
+
+
+def canonical_dumps(raw_json: RawJSONElement) -> str:
+    """
+    Encodes raw JSON canonically, so that equal raw JSON (regardless of
+    key order, or whether numbers are ints or floats) has equal encodings.
+
+    :param raw_json:    The raw JSON.
+    :return:            The canonical encoding.
+    """
+    return "".join(iter_canonical(raw_json))
+
+
+def content_hash(raw_json: RawJSONElement, algorithm: str = "sha256", exact: bool = False) -> str:
+    """
+    Gets a digest of the (UTF-8) canonical encoding of raw JSON,
+    without creating the whole encoding.
+
+    :param raw_json:    The raw JSON.
+    :param algorithm:   The name of the hashlib algorithm to use.
+    :param exact:       Whether to digest the exact encoding (see iter_canonical),
+                        so that raw JSON which only differs in ways the canonical
+                        encoding ignores has different digests.
+    :return:            The digest, as a hex string.
+    """
+    digest = hashlib.new(algorithm)
+    for chunk in iter_canonical(raw_json, exact):
+        digest.update(chunk.encode("utf-8", "surrogatepass"))
+
+    return digest.hexdigest()
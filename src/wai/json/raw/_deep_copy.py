@@ -1,16 +1,155 @@
+from typing import Dict, List, Tuple, Any, Optional
+
+from ..error import JSONError
+from ._dynamic import PRIMITIVE_TYPES
+from ._frozen import FrozenRawJSONObject
 from ._typing import RawJSONElement
 
+# The kind of container (dict, list or tuple) each container type is copied as
+CONTAINER_KINDS: Dict[type, type] = {
+    dict: dict,
+    FrozenRawJSONObject: dict,
+    list: list,
+    tuple: tuple
+}
+
+# The maximum depth to which plain copies are made recursively
+RECURSION_LIMIT: int = 64
+
+
+def deep_copy(json: RawJSONElement,
+              preserve_sharing: bool = False,
+              freeze: bool = False) -> RawJSONElement:
+    """
+    Creates a deep-copy of the given raw JSON element. Arrays are
+    copied to the same type (list/tuple), and objects to dictionaries.
 
-def deep_copy(json: RawJSONElement) -> RawJSONElement:
+    :param json:                The raw JSON element to copy.
+    :param preserve_sharing:    Whether containers which appear more than once in
+                                the element should be copied once and shared in the
+                                copy (otherwise each appearance is copied separately).
+    :param freeze:              Whether to create a copy which can't be modified
+                                (arrays are copied to tuples, and objects to
+                                FrozenRawJSONObjects).
+    :return:                    The copy.
     """
-    Creates a deep-copy of the given raw JSON element.
+    # Primitives are immutable, so don't need copying
+    if type(json) in PRIMITIVE_TYPES:
+        return json
+
+    # Plain copies are made recursively near the root, which is faster
+    if not preserve_sharing and not freeze:
+        return copy_recursively(json, 0)
+
+    return copy_iteratively(json, preserve_sharing, freeze)
+
+
+def copy_recursively(json: RawJSONElement, depth: int) -> RawJSONElement:
+    """
+    Creates a plain deep-copy of a raw JSON element recursively, switching
+    to copying iteratively for sub-classes of the container types and for
+    elements nested deeper than RECURSION_LIMIT.
 
     :param json:    The raw JSON element to copy.
+    :param depth:   The depth of the element below the element being copied.
     :return:        The copy.
     """
-    if isinstance(json, dict):
-        return {key: deep_copy(value) for key, value in json.items()}
-    elif isinstance(json, list):
-        return [deep_copy(array_element) for array_element in json]
+    json_type = type(json)
+    if depth >= RECURSION_LIMIT or json_type not in CONTAINER_KINDS or json_type is FrozenRawJSONObject:
+        return copy_iteratively(json, False, False)
+
+    depth += 1
+    if json_type is dict:
+        return {key: value if type(value) in PRIMITIVE_TYPES else copy_recursively(value, depth)
+                for key, value in json.items()}
+    elif json_type is list:
+        return [value if type(value) in PRIMITIVE_TYPES else copy_recursively(value, depth)
+                for value in json]
     else:
-        return json
+        return tuple([value if type(value) in PRIMITIVE_TYPES else copy_recursively(value, depth)
+                      for value in json])
+
+
+def copy_iteratively(json: RawJSONElement, preserve_sharing: bool, freeze: bool) -> RawJSONElement:
+    """
+    Creates a deep-copy of a raw JSON element without recursion,
+    so there is no limit to the depth of the element.
+
+    :param json:                The raw JSON element to copy.
+    :param preserve_sharing:    Whether to copy shared containers once.
+    :param freeze:              Whether to create a copy which can't be modified.
+    :return:                    The copy.
+    """
+    # Holder for the copy of the root element
+    root: List[RawJSONElement] = [json]
+
+    # Copies of containers already copied, by ID of the original (if preserving sharing)
+    memo: Dict[int, RawJSONElement] = {}
+
+    # The IDs of the containers currently being copied, for detecting cycles
+    on_path = set()
+
+    # Copy iteratively. Each entry is a container to copy and where to place the
+    # copy (container, parent, key), or a marker that a container's contents have
+    # all been copied (container ID, None, copy to convert or None). Copies are made
+    # as lists/dicts, and those which should be tuples/frozen are converted when their
+    # marker is reached, as by then everything they contain has been converted
+    to_copy: List[Tuple[Any, Optional[Any], Any]] = [(json, root, 0)]
+    pop, push = to_copy.pop, to_copy.append
+    while len(to_copy) > 0:
+        source, parent, key = pop()
+
+        # Finished copying a container's contents, so convert its copy if required
+        if parent is None:
+            on_path.remove(source)
+            if key is not None:
+                copy, copy_parent, copy_key = key
+                converted = tuple(copy) if isinstance(copy, list) else FrozenRawJSONObject(copy)
+                copy_parent[copy_key] = converted
+                if preserve_sharing:
+                    memo[source] = converted
+            continue
+
+        # Can't copy a container that contains itself
+        source_id = id(source)
+        if source_id in on_path:
+            raise JSONError("Can't copy raw JSON which contains itself")
+
+        # Shared containers use the existing copy (which is complete, as anything
+        # reached while a container is being copied is contained in it)
+        if preserve_sharing and source_id in memo:
+            parent[key] = memo[source_id]
+            continue
+
+        # Get the kind of container (sub-classes are copied as their base type)
+        kind = CONTAINER_KINDS.get(type(source), None)
+        if kind is None:
+            kind = next((kind for container_type, kind in CONTAINER_KINDS.items()
+                         if isinstance(source, container_type)),
+                        None)
+
+        # Anything else is not copied
+        if kind is None:
+            parent[key] = source
+            continue
+
+        # Make a shallow copy, and place it
+        if kind is dict:
+            copy = dict(source)
+            children = copy.items()
+        else:
+            copy = list(source)
+            children = enumerate(copy)
+        parent[key] = copy
+
+        if preserve_sharing:
+            memo[source_id] = copy
+
+        # Copy the contained containers (primitives are already copied)
+        on_path.add(source_id)
+        push((source_id, None, (copy, parent, key) if freeze or kind is tuple else None))
+        for child_key, child in children:
+            if type(child) not in PRIMITIVE_TYPES:
+                push((child, copy, child_key))
+
+    return root[0]
@@ -2,13 +2,16 @@
 Module containing functions for checking if Python objects
 are raw JSON elements at run-time.
 """
-from typing import Set, Any
+from typing import Set, Any, NamedTuple, Tuple, Union, Optional, Dict, Iterable
 
-from wai.common.iterate import all_meet_predicate
+from ..pointer import format_pointer
 
 # The types of raw JSON elements
 RAW_JSON_ELEMENT_TYPES: Set[type] = {dict, list, tuple, float, int, str, bool, None}
 
+# The exact types of raw JSON primitives
+PRIMITIVE_TYPES: Set[type] = {float, int, str, bool, type(None)}
+
 
 def is_raw_json_object(py_obj: Any) -> bool:
     """
@@ -18,20 +21,8 @@ def is_raw_json_object(py_obj: Any) -> bool:
     :return:        True if the Python object is a raw JSON object,
                     False if not.
     """
-    # Must be a dictionary
-    if not isinstance(py_obj, dict):
-        return False
-
-    # All keys must be strings
-    if not all(isinstance(key, str) for key in py_obj.keys()):
-        return False
-
-    # All values must be raw JSON elements
-    if not all_meet_predicate(py_obj.values(), is_raw_json_element):
-        return False
-
-    # All checks passed
-    return True
+    # Must be a dictionary of raw JSON
+    return isinstance(py_obj, dict) and check_raw_json(py_obj) is None
 
 
 def is_raw_json_array(py_obj: Any) -> bool:
@@ -42,16 +33,8 @@ def is_raw_json_array(py_obj: Any) -> bool:
     :return:        True if the Python object is a raw JSON array,
                     False if not.
     """
-    # Must be a list
-    if not isinstance(py_obj, (tuple, list)):
-        return False
-
-    # All elements must be raw JSON elements
-    if not all_meet_predicate(py_obj, is_raw_json_element):
-        return False
-
-    # All checks passed
-    return True
+    # Must be a list/tuple of raw JSON
+    return isinstance(py_obj, (tuple, list)) and check_raw_json(py_obj) is None
 
 
 def is_raw_json_string(py_obj: Any) -> bool:
@@ -121,17 +104,128 @@ def is_raw_json_primitive(py_obj: Any) -> bool:
 
 def is_raw_json_element(py_obj: Any) -> bool:
     """
-    Checks if the given Python object is any raw JSON element.
+    Checks if the given Python object is any raw JSON element. Containers
+    which contain themselves are not raw JSON. See check_raw_json.
 
     :param py_obj:  The Python object to check.
     :return:        True if the Python object is a raw JSON element,
                     False if not.
     """
-    return (
-            is_raw_json_primitive(py_obj) or
-            is_raw_json_array(py_obj) or
-            is_raw_json_object(py_obj)
-    )
+    return check_raw_json(py_obj) is None
+
+
+class RawJSONProblem(NamedTuple):
+    """
+    Description of why a Python object is not raw JSON.
+    """
+    # The path to the offending value, as object keys and array indices
+    path: Tuple[Union[str, int], ...]
+
+    # Why the value isn't raw JSON
+    reason: str
+
+    # The offending value
+    value: Any
+
+    @property
+    def pointer(self) -> str:
+        """
+        Gets the path to the offending value as a JSON pointer.
+        """
+        return format_pointer(self.path)
+
+
+def check_raw_json(py_obj: Any, max_depth: Optional[int] = None) -> Optional[RawJSONProblem]:
+    """
+    Checks if the given Python object is a raw JSON element, in a single
+    pass. Works iteratively, so is not limited by the recursion limit,
+    and visits each container only once, even if it appears in several
+    places. Containers which contain themselves are not raw JSON.
+
+    :param py_obj:      The Python object to check.
+    :param max_depth:   The maximum nesting depth of containers, if limited
+                        (a top-level array has depth 1).
+    :return:            None if the object is raw JSON, otherwise the
+                        first problem found.
+    """
+    # Objects still to check, the containers on the current path (by ID, outermost
+    # first), and the depths at which containers have already been checked (by ID)
+    to_check = [py_obj]
+    on_path: Dict[int, Any] = {}
+    checked: Dict[int, int] = {}
+
+    while len(to_check) > 0:
+        item = to_check.pop()
+
+        # Primitives are checked by exact type first, as it's the most common case
+        item_type = type(item)
+        if item_type in PRIMITIVE_TYPES:
+            continue
+
+        # Finished checking a container's contents
+        if item_type is _ContainerExit:
+            checked[item.id] = len(on_path)
+            del on_path[item.id]
+            continue
+
+        # Containers are checked once (unless they now appear deeper),
+        # and mustn't contain themselves or be too deep
+        if isinstance(item, (dict, list, tuple)):
+            item_id = id(item)
+            if item_id in checked and (max_depth is None or checked[item_id] > len(on_path)):
+                continue
+            if item_id in on_path:
+                return RawJSONProblem(find_path(on_path.values(), item), "container contains itself", item)
+            if max_depth is not None and len(on_path) >= max_depth:
+                return RawJSONProblem(find_path(on_path.values(), item), f"exceeds the maximum depth of {max_depth}", item)
+
+            # Object keys must be strings
+            if isinstance(item, dict):
+                for key in item:
+                    if not isinstance(key, str):
+                        return RawJSONProblem(find_path(on_path.values(), item), f"object key {key!r} is not a string", item)
+                children = item.values()
+            else:
+                children = item
+
+            on_path[item_id] = item
+            to_check.append(_ContainerExit(item_id))
+            to_check.extend(children)
+
+        # Sub-classes of primitive types are also primitives
+        elif not isinstance(item, (str, int, float)):
+            return RawJSONProblem(find_path(on_path.values(), item), f"{item_type.__name__} is not a raw JSON type", item)
+
+    return None
+
+
+def find_path(containers: Iterable[Any], item: Any) -> Tuple[Union[str, int], ...]:
+    """
+    Finds the path to an item through a sequence of nested containers.
+    Only used when reporting problems, so the keys aren't tracked while
+    checking.
+
+    :param containers:  The containers, outermost first.
+    :param item:        The item in the innermost container.
+    :return:            The keys/indices of the path to the item.
+    """
+    containers = tuple(containers)
+    path = []
+    for container, child in zip(containers, (*containers[1:], item)):
+        items = container.items() if isinstance(container, dict) else enumerate(container)
+        path.append(next(key for key, value in items if value is child))
+
+    return tuple(path)
+
+
+class _ContainerExit:
+    """
+    Marker for when all of a container's contents have been checked.
+    """
+    __slots__ = ("id",)
+
+    def __init__(self, container_id: int):
+        self.id: int = container_id
 
 
 def is_raw_json_element_type(py_type: type) -> bool:
@@ -0,0 +1,36 @@
+"""
+Module for immutable raw JSON objects.
+"""
+from ..error import ModificationDisallowed
+
+
+class FrozenRawJSONObject(dict):
+    """
+    Raw JSON object (dictionary) which can't be modified after creation.
+    Frozen raw JSON arrays are represented by tuples.
+    """
+    __slots__ = ()
+
+    def _disallow(self, *args, **kwargs):
+        raise ModificationDisallowed("Can't modify a frozen raw JSON object")
+
+    __setitem__ = _disallow
+    __delitem__ = _disallow
+    __ior__ = _disallow
+    clear = _disallow
+    pop = _disallow
+    popitem = _disallow
+    setdefault = _disallow
+    update = _disallow
+
+    def __hash__(self):
+        return hash(frozenset(self.items()))
+
+    def __copy__(self):
+        return self
+
+    def __reduce__(self):
+        return FrozenRawJSONObject, (dict(self),)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict.__repr__(self)})"
@@ -0,0 +1,141 @@
+"""
+Module for measuring the size of raw JSON elements without
+serialising them.
+"""
+import math
+import sys
+from json.encoder import encode_basestring_ascii
+from typing import NamedTuple, Dict
+
+from ..error import JSONError
+from ._dynamic import _ContainerExit
+from ._typing import RawJSONElement
+
+# The serialised representations of non-finite floats
+NON_FINITE_FLOAT_SIZES: Dict[float, int] = {
+    math.inf: len("Infinity"),
+    -math.inf: len("-Infinity")
+}
+
+
+class RawJSONMeasurements(NamedTuple):
+    """
+    Measurements of a raw JSON element.
+    """
+    # The number of each type of value (counting each appearance of a shared value)
+    objects: int
+    arrays: int
+    strings: int
+    numbers: int
+    bools: int
+    nulls: int
+
+    # The maximum nesting depth of containers (a top-level array has depth 1)
+    max_depth: int
+
+    # The length of the compact serialised JSON (with ASCII-escaped strings)
+    serialised_size: int
+
+    # The approximate memory used by the Python objects (counting shared
+    # containers and their contents once), in bytes
+    heap_size: int
+
+    @property
+    def nodes(self) -> int:
+        """
+        The total number of values in the element.
+        """
+        return self.objects + self.arrays + self.strings + self.numbers + self.bools + self.nulls
+
+
+def measure(raw_json: RawJSONElement) -> RawJSONMeasurements:
+    """
+    Measures a raw JSON element in a single iterative pass.
+
+    :param raw_json:    The raw JSON element.
+    :return:            The measurements.
+    """
+    objects = arrays = strings = numbers = bools = nulls = 0
+    max_depth = serialised_size = heap_size = 0
+
+    # The IDs of the containers on the current path, and of those already measured
+    on_path = set()
+    measured = set()
+
+    # Measure iteratively. Each entry is a (value, depth of its container, whether
+    # its memory is yet to be counted), or a marker that a container's contents
+    # have all been measured
+    to_measure = [(raw_json, 0, True)]
+    while len(to_measure) > 0:
+        entry = to_measure.pop()
+
+        # Finished measuring a container's contents
+        if type(entry) is _ContainerExit:
+            on_path.remove(entry.id)
+            continue
+
+        value, depth, count_heap = entry
+
+        # Primitives (bool before int, as it's a sub-class)
+        if value is None:
+            nulls += 1
+            serialised_size += 4
+            continue
+        elif isinstance(value, bool):
+            bools += 1
+            serialised_size += 4 if value else 5
+            continue
+        elif isinstance(value, str):
+            strings += 1
+            serialised_size += len(encode_basestring_ascii(value))
+            heap_size += sys.getsizeof(value) if count_heap else 0
+            continue
+        elif isinstance(value, int):
+            numbers += 1
+            serialised_size += len(int.__repr__(value))
+            heap_size += sys.getsizeof(value) if count_heap else 0
+            continue
+        elif isinstance(value, float):
+            numbers += 1
+            serialised_size += (len(float.__repr__(value)) if math.isfinite(value) else
+                                NON_FINITE_FLOAT_SIZES.get(value, len("NaN")))
+            heap_size += sys.getsizeof(value) if count_heap else 0
+            continue
+
+        # Objects' keys and colons
+        if isinstance(value, dict):
+            objects += 1
+            for key in value:
+                if not isinstance(key, str):
+                    raise JSONError(f"Can't measure non-JSON object key {key!r}")
+                serialised_size += len(encode_basestring_ascii(key)) + 1
+            children = value.values()
+        elif isinstance(value, (list, tuple)):
+            arrays += 1
+            children = value
+        else:
+            raise JSONError(f"Can't measure non-JSON value {value!r}")
+
+        # Can't measure a container which contains itself
+        value_id = id(value)
+        if value_id in on_path:
+            raise JSONError("Can't measure raw JSON which contains itself")
+
+        # Brackets and commas
+        serialised_size += 2 + max(len(value) - 1, 0)
+
+        # Shared containers (and their contents) only use memory once
+        count_heap = count_heap and value_id not in measured
+        if count_heap:
+            measured.add(value_id)
+            heap_size += sys.getsizeof(value)
+
+        depth += 1
+        max_depth = max(max_depth, depth)
+
+        on_path.add(value_id)
+        to_measure.append(_ContainerExit(value_id))
+        to_measure.extend((child, depth, count_heap) for child in children)
+
+    return RawJSONMeasurements(objects, arrays, strings, numbers, bools, nulls, max_depth, serialised_size, heap_size)
+
@@ -0,0 +1,141 @@
+"""
+Module for passing large raw JSON arrays of numbers between processes
+via shared memory, instead of pickling each number.
+"""
+from array import array
+from typing import Iterable, List, Optional, Any
+
+from ..error import JSONError
+from ._typing import RawJSONNumber
+
+# The array type-codes for integer and float elements
+INTEGER_TYPECODE: str = "q"
+FLOAT_TYPECODE: str = "d"
+
+
+def attach_shared_memory(name: str) -> Any:
+    """
+    Attaches to an existing block of shared memory, without the resource
+    tracker taking ownership of it where possible. Processes started by
+    multiprocessing share the creating process's resource tracker, so the
+    block is still only destroyed by its owner.
+
+    :param name:    The name of the block.
+    :return:        The SharedMemory object.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    # Python 3.13+ can disable tracking directly
+    try:
+        return SharedMemory(name, track=False)
+    except TypeError:
+        return SharedMemory(name)
+
+
+class SharedNumericArray:
+    """
+    Raw JSON array of numbers held in a block of shared memory. Pickling
+    only includes the name of the block, so the array can be sent to worker
+    processes cheaply. The process which creates the array owns the block,
+    and must close it (using a with-statement, or close) once the workers
+    are done with it; other processes only detach from it.
+
+    Arrays of integers are stored as 64-bit integers. Arrays containing
+    floats (or larger integers) are stored as doubles, so all of their
+    elements are read back as floats.
+    """
+    def __init__(self, values: Iterable[RawJSONNumber]):
+        from multiprocessing.shared_memory import SharedMemory
+
+        # Pack the numbers, as 64-bit integers if possible, otherwise doubles
+        values = values if isinstance(values, (list, tuple)) else list(values)
+        for value in values:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise JSONError(f"Shared numeric arrays can only contain numbers, got {value!r}")
+        try:
+            packed = array(INTEGER_TYPECODE, values)
+        except (TypeError, OverflowError):
+            packed = array(FLOAT_TYPECODE, values)
+
+        # Copy the packed numbers into shared memory (blocks can't be empty)
+        self._typecode: str = packed.typecode
+        self._length: int = len(packed)
+        self._shared_memory = SharedMemory(create=True, size=max(len(packed) * packed.itemsize, 1))
+        self._shared_memory.buf[:len(packed) * packed.itemsize] = packed.tobytes()
+        self._owner: bool = True
+
+    @classmethod
+    def _attach(cls, name: str, typecode: str, length: int) -> 'SharedNumericArray':
+        """
+        Recreates an array in another process by attaching to its block.
+
+        :param name:        The name of the block.
+        :param typecode:    The array type-code of the elements.
+        :param length:      The number of elements.
+        :return:            The array.
+        """
+        shared = cls.__new__(cls)
+        shared._typecode = typecode
+        shared._length = length
+        shared._shared_memory = attach_shared_memory(name)
+        shared._owner = False
+        return shared
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the block of shared memory holding the array.
+        """
+        return self._shared_memory.name
+
+    def to_list(self) -> List[RawJSONNumber]:
+        """
+        Copies the numbers out of shared memory into a raw JSON array.
+
+        :return:    The raw JSON array.
+        """
+        return self.to_array().tolist()
+
+    def to_array(self) -> array:
+        """
+        Copies the numbers out of shared memory into an array.
+
+        :return:    The array.
+        """
+        packed = array(self._typecode)
+        packed.frombytes(self._shared_memory.buf[:self._length * packed.itemsize])
+        return packed
+
+    def close(self):
+        """
+        Detaches from the block of shared memory, destroying it if this
+        process created it.
+        """
+        if self._shared_memory is None:
+            return
+
+        self._shared_memory.close()
+        if self._owner:
+            self._shared_memory.unlink()
+        self._shared_memory = None
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __reduce__(self):
+        if self._shared_memory is None:
+            raise JSONError("Can't pickle a closed shared numeric array")
+
+        return SharedNumericArray._attach, (self.name, self._typecode, self._length)
+
+    def __enter__(self) -> 'SharedNumericArray':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        # Detach (but don't destroy) if never closed
+        shared_memory: Optional[Any] = getattr(self, "_shared_memory", None)
+        if shared_memory is not None:
+            shared_memory.close()
@@ -8,6 +8,7 @@ from ._definitions import (
     IS_JSON_REFEREND,
     extract_definitions,
     consolidate_definitions,
+    separate_definitions,
     reference_schema,
     reference_string
 )
@@ -22,6 +23,22 @@ from ._dynamic import (
     any_of,
     all_of
 )
+from ._fingerprint import (
+    canonical_encoding,
+    canonical_schema,
+    fingerprint
+)
+from ._formats import (
+    FormatChecker,
+    register_format,
+    get_format_checker,
+    is_format_registered
+)
+from ._patterns import (
+    compile_pattern,
+    anchor_pattern
+)
+from ._simplify import simplify
 from ._static import (
     TRIVIALLY_SUCCEED_SCHEMA,
     TRIVIALLY_FAIL_SCHEMA,
@@ -38,5 +55,6 @@ from ._static import (
 from ._typing import (
     JSONSchema,
     JSONDefinitions,
+    check_schema,
     is_schema
 )
@@ -2,9 +2,12 @@
 Module for reusable JSON schema definitions and references to them.
 Also provides tools for relative JSON pointer syntax.
 """
+from typing import Tuple, List
+
 from ..error import SchemaDefinitionRedefined
 from .constants import *
 from ._static import NULL_SCHEMA, BOOL_SCHEMA, FLOAT_SCHEMA, STRING_SCHEMA
+from ._fingerprint import fingerprint
 from ._typing import JSONSchema, JSONDefinitions
 
 
@@ -67,13 +70,36 @@ def consolidate_definitions(*schemata: JSONSchema, pop: bool = False) -> JSONDef
     for schema in schemata:
         extracted_definitions = extract_definitions(schema, pop)
         for definition_name, definition in extracted_definitions.items():
-            if definition_name in consolidated_definitions and consolidated_definitions[definition_name] != definition:
-                raise SchemaDefinitionRedefined(definition_name, consolidated_definitions[definition_name], definition)
+            existing_definition = consolidated_definitions.get(definition_name, definition)
+            if existing_definition is not definition and fingerprint(existing_definition) != fingerprint(definition):
+                raise SchemaDefinitionRedefined(definition_name, existing_definition, definition)
             consolidated_definitions[definition_name] = definition
 
     return consolidated_definitions
 
 
+def separate_definitions(*schemata: JSONSchema) -> Tuple[List[JSONSchema], JSONDefinitions]:
+    """
+    Separates the definitions from a number of schemata, without
+    modifying them. Schemata with definitions are shallow-copied
+    without them; all other (sub-)schemata are shared.
+
+    :param schemata:    The schemas to separate definitions from.
+    :return:            The schemas without their definitions, and
+                        the consolidated definitions.
+    """
+    # Consolidate the definitions without removing them
+    definitions = consolidate_definitions(*schemata)
+
+    # Copy schemata which have definitions, leaving out the definitions
+    separated = [{key: value for key, value in schema.items() if key != DEFINITIONS_KEYWORD}
+                 if isinstance(schema, dict) and DEFINITIONS_KEYWORD in schema
+                 else schema
+                 for schema in schemata]
+
+    return separated, definitions
+
+
 # Definition of a schema which validates any JSON
 IS_JSON_REFERENCE: str = "is-json"
 IS_JSON_REFEREND: str = reference_string(IS_JSON_REFERENCE)
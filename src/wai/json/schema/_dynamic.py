@@ -2,31 +2,33 @@
 Methods for creating some common JSON-validation schema,
 based on some parameters.
 """
-from typing import Dict, Set, Optional, Union
+from typing import Dict, Optional, Union
 
 from ..error import JSONSchemaError
-from ..raw import deep_copy, RawJSONPrimitive, RawJSONNumber
+from ..raw import RawJSONPrimitive, RawJSONNumber
 from ._typing import JSONSchema
 from .constants import *
-from ._definitions import consolidate_definitions, JSONDefinitions
+from ._definitions import separate_definitions
+from ._fingerprint import canonical_encoding
+from ._formats import is_format_registered
 
 
 def string_schema(min_length: Optional[int] = None,
                   max_length: Optional[int] = None,
                   pattern: Optional[str] = None,
-                  format: Optional[str] = None) -> JSONSchema:
+                  format: Optional[str] = None,
+                  check_format: bool = True) -> JSONSchema:
     """
     Creates a schema which validates a string.
 
-    TODO: Format strings are only optionally enforced by validators. Add check
-          to ensure that the given format string will be enforced, and possibly
-          a flag to skip this check if unnecessary.
-
-    :param min_length:  The minimum length of the string.
-    :param max_length:  The maximum length of the string.
-    :param pattern:     A regex to validate against.
-    :param format:      The format type to validate against.
-    :return:            The schema.
+    :param min_length:      The minimum length of the string.
+    :param max_length:      The maximum length of the string.
+    :param pattern:         A regex to validate against.
+    :param format:          The format type to validate against.
+    :param check_format:    Whether to check that the format is registered (see
+                            register_format), as validators only enforce
+                            registered formats.
+    :return:                The schema.
     """
     # Create the base schema
     schema: JSONSchema = {
@@ -51,6 +53,8 @@ def string_schema(min_length: Optional[int] = None,
 
     # Add the format if given
     if format is not None:
+        if check_format and not is_format_registered(format):
+            raise JSONSchemaError(f"Format '{format}' is not registered, so wouldn't be enforced")
         schema[FORMAT_KEYWORD] = format
 
     return schema
@@ -79,21 +83,14 @@ def standard_object(required_properties: Optional[Dict[str, JSONSchema]] = None,
         if key in optional_properties:
             raise JSONSchemaError(f"Property '{key}' can't be both required and optional")
 
-    # Copy all schema
-    required_properties = deep_copy(required_properties)
-    optional_properties = deep_copy(optional_properties)
-    additional_properties = deep_copy(additional_properties)
-
-    # Extract any definitions
-    definitions: JSONDefinitions = consolidate_definitions(*required_properties.values(),
-                                                           *optional_properties.values(),
-                                                           additional_properties,
-                                                           pop=True)
+    # Extract any definitions (sub-schema are shared rather than copied)
+    separated, definitions = separate_definitions(*required_properties.values(),
+                                                  *optional_properties.values(),
+                                                  additional_properties)
+    additional_properties = separated.pop()
 
     # Combine the required and optional properties
-    combined_properties = {}
-    combined_properties.update(required_properties)
-    combined_properties.update(optional_properties)
+    combined_properties = dict(zip((*required_properties, *optional_properties), separated))
 
     # Create the schema
     schema = {
@@ -130,9 +127,10 @@ def enum(*values: RawJSONPrimitive) -> JSONSchema:
     :param values:  The set of allowed values.
     :return:        The schema.
     """
-    unique_values: Set[RawJSONPrimitive] = set(values)
+    # Remove duplicates, and sort for a stable order
+    unique_values: Dict[str, RawJSONPrimitive] = {canonical_encoding(value): value for value in values}
 
-    return {ENUMERATION_KEYWORD: list(unique_values)}
+    return {ENUMERATION_KEYWORD: [unique_values[encoding] for encoding in sorted(unique_values)]}
 
 
 def number(minimum: Optional[RawJSONNumber] = None,
@@ -193,11 +191,8 @@ def regular_array(element_schema: JSONSchema,
     if max_elements is not None and max_elements < min_elements:
         raise JSONSchemaError("max_elements can't be less than min_elements")
 
-    # Copy the element schema
-    element_schema = deep_copy(element_schema)
-
     # Extract any definitions
-    definitions: JSONDefinitions = consolidate_definitions(element_schema, pop=True)
+    (element_schema,), definitions = separate_definitions(element_schema)
 
     # Create the schema with the array type and element schema
     schema: JSONSchema = {
@@ -266,11 +261,8 @@ def _of(*schema: JSONSchema, keyword: str) -> JSONSchema:
     if len(schema) < 2:
         raise JSONSchemaError(f"Can't use {keyword} with fewer than 2 sub-schema")
 
-    # Copy the schema into a list
-    schema = deep_copy(list(schema))
-
     # Extract any definitions
-    definitions: JSONDefinitions = consolidate_definitions(*schema, pop=True)
+    schema, definitions = separate_definitions(*schema)
 
     return {
         keyword: schema,
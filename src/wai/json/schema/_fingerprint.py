@@ -0,0 +1,75 @@
+"""
+Module for canonicalising and fingerprinting JSON schema, so that
+schema can be compared and used as cache keys regardless of
+incidental differences such as key order.
+"""
+import json
+from hashlib import sha256
+from typing import Any
+
+from ..error import JSONSchemaError
+from ..raw import RawJSONElement
+from .constants import ENUMERATION_KEYWORD, CONSTANT_KEYWORD
+from ._typing import JSONSchema
+
+
+def canonical_encoding(raw_json: RawJSONElement) -> str:
+    """
+    Encodes raw JSON as a string which is equal for equal raw JSON,
+    regardless of the order of object keys.
+
+    :param raw_json:    The raw JSON.
+    :return:            The encoding.
+    """
+    try:
+        return json.dumps(raw_json, sort_keys=True, separators=(",", ":"), allow_nan=False)
+    except (TypeError, ValueError) as e:
+        raise JSONSchemaError(f"Can't encode {raw_json!r} as JSON: {e}") from e
+
+
+def canonical_schema(schema: JSONSchema) -> JSONSchema:
+    """
+    Gets the canonical form of a schema, where the values of enum
+    keywords are sorted by their canonical encodings. Key order is
+    not canonicalised (see canonical_encoding).
+
+    :param schema:  The schema.
+    :return:        The canonical form of the schema.
+    """
+    if isinstance(schema, dict):
+        return {key: canonical_value(key, value) for key, value in schema.items()}
+    elif isinstance(schema, (list, tuple)):
+        return [canonical_schema(value) for value in schema]
+
+    return schema
+
+
+def canonical_value(keyword: str, value: Any) -> Any:
+    """
+    Gets the canonical form of the value of a schema keyword.
+
+    :param keyword:     The keyword.
+    :param value:       The value of the keyword.
+    :return:            The canonical form of the value.
+    """
+    # Enumerated values are unordered
+    if keyword == ENUMERATION_KEYWORD and isinstance(value, (list, tuple)):
+        return sorted(value, key=canonical_encoding)
+
+    # Constant values aren't schema
+    elif keyword == CONSTANT_KEYWORD:
+        return value
+
+    return canonical_schema(value)
+
+
+def fingerprint(schema: JSONSchema) -> str:
+    """
+    Gets a stable digest of a schema. Schema which differ only in the
+    order of object keys, or the order of enum values, have the same
+    fingerprint.
+
+    :param schema:  The schema.
+    :return:        The fingerprint, as a hex string.
+    """
+    return sha256(canonical_encoding(canonical_schema(schema)).encode("utf-8")).hexdigest()
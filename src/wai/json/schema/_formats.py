@@ -0,0 +1,183 @@
+"""
+Module for the registry of string formats which validators enforce
+for the format keyword. Built-in formats are checked with precompiled
+matchers, and custom formats can be added with register_format.
+"""
+import re
+from datetime import date, datetime
+from ipaddress import IPv6Address
+from typing import Callable, Dict, Optional, Any
+
+from ..error import JSONSchemaError
+
+# The type of a function which checks if a value conforms to a format
+FormatChecker = Callable[[Any], bool]
+
+# Matchers for the built-in formats
+DATE_MATCHER = re.compile(r"(\d{4})-(\d{2})-(\d{2})", re.ASCII).fullmatch
+DATE_TIME_MATCHER = re.compile(r"(\d{4})-(\d{2})-(\d{2})[Tt ](\d{2}):(\d{2}):(\d{2})(\.\d+)?([Zz]|[+-]\d{2}:\d{2})", re.ASCII).fullmatch
+UUID_MATCHER = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}").fullmatch
+IPV4_MATCHER = re.compile(r"(?:(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)\.){3}(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)", re.ASCII).fullmatch
+EMAIL_MATCHER = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s.]+").fullmatch
+URI_MATCHER = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*:[^\s]*").fullmatch
+
+
+def is_date(value: Any) -> bool:
+    """
+    Checks a value is a full-date (RFC 3339).
+
+    :param value:   The value to check.
+    :return:        True if the value isn't a string, or is a date.
+    """
+    if not isinstance(value, str):
+        return True
+
+    match = DATE_MATCHER(value)
+    if match is None:
+        return False
+
+    # Check the date exists
+    try:
+        date(*map(int, match.groups()))
+    except ValueError:
+        return False
+
+    return True
+
+
+def is_date_time(value: Any) -> bool:
+    """
+    Checks a value is a date-time (RFC 3339).
+
+    :param value:   The value to check.
+    :return:        True if the value isn't a string, or is a date-time.
+    """
+    if not isinstance(value, str):
+        return True
+
+    match = DATE_TIME_MATCHER(value)
+    if match is None:
+        return False
+
+    # Check the date and time exist (allowing leap seconds)
+    year, month, day, hour, minute, second = map(int, match.groups()[:6])
+    try:
+        datetime(year, month, day, hour, minute, min(second, 59))
+    except ValueError:
+        return False
+
+    # Check the offset
+    offset = match.group(8)
+    if len(offset) > 1 and (int(offset[1:3]) > 23 or int(offset[4:6]) > 59):
+        return False
+
+    return second <= 60
+
+
+def is_uuid(value: Any) -> bool:
+    """
+    Checks a value is a UUID (RFC 4122).
+
+    :param value:   The value to check.
+    :return:        True if the value isn't a string, or is a UUID.
+    """
+    return not isinstance(value, str) or UUID_MATCHER(value) is not None
+
+
+def is_ipv4(value: Any) -> bool:
+    """
+    Checks a value is an IPv4 address in dotted-quad notation.
+
+    :param value:   The value to check.
+    :return:        True if the value isn't a string, or is an IPv4 address.
+    """
+    return not isinstance(value, str) or IPV4_MATCHER(value) is not None
+
+
+def is_ipv6(value: Any) -> bool:
+    """
+    Checks a value is an IPv6 address (RFC 4291).
+
+    :param value:   The value to check.
+    :return:        True if the value isn't a string, or is an IPv6 address.
+    """
+    if not isinstance(value, str):
+        return True
+
+    # Scoped addresses aren't allowed
+    if "%" in value:
+        return False
+
+    try:
+        IPv6Address(value)
+    except ValueError:
+        return False
+
+    return True
+
+
+def is_email(value: Any) -> bool:
+    """
+    Checks a value looks like an email address.
+
+    :param value:   The value to check.
+    :return:        True if the value isn't a string, or is an email address.
+    """
+    return not isinstance(value, str) or EMAIL_MATCHER(value) is not None
+
+
+def is_uri(value: Any) -> bool:
+    """
+    Checks a value looks like an absolute URI (RFC 3986).
+
+    :param value:   The value to check.
+    :return:        True if the value isn't a string, or is a URI.
+    """
+    return not isinstance(value, str) or URI_MATCHER(value) is not None
+
+
+# The registered format checkers, by format name
+_format_checkers: Dict[str, FormatChecker] = {
+    "date": is_date,
+    "date-time": is_date_time,
+    "uuid": is_uuid,
+    "ipv4": is_ipv4,
+    "ipv6": is_ipv6,
+    "email": is_email,
+    "uri": is_uri
+}
+
+
+def register_format(name: str, checker: FormatChecker, replace: bool = False):
+    """
+    Registers a custom format for validators to enforce. The checker is
+    given every value validated against the format (not just strings).
+
+    :param name:        The name of the format.
+    :param checker:     Function which returns whether a value conforms to the format.
+    :param replace:     Whether to allow replacing an already-registered format.
+    """
+    if name in _format_checkers and not replace:
+        raise JSONSchemaError(f"Format '{name}' is already registered")
+
+    _format_checkers[name] = checker
+
+
+def get_format_checker(name: str) -> Optional[FormatChecker]:
+    """
+    Gets the checker for a registered format.
+
+    :param name:    The name of the format.
+    :return:        The checker, or None if the format isn't registered.
+    """
+    return _format_checkers.get(name, None)
+
+
+def is_format_registered(name: str) -> bool:
+    """
+    Whether a format is registered, and so will be enforced by validators.
+
+    :param name:    The name of the format.
+    :return:        True if the format is registered.
+    """
+    return name in _format_checkers
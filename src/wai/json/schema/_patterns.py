@@ -0,0 +1,41 @@
+"""
+Module for compiling the regular-expression patterns of string
+schema, with a process-wide cache so that each distinct pattern is
+only compiled once.
+"""
+import re
+from functools import lru_cache
+from typing import Pattern
+
+from ..error import JSONSchemaError
+
+# The maximum number of compiled patterns to keep
+PATTERN_CACHE_SIZE: int = 1024
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_pattern(pattern: str) -> Pattern:
+    """
+    Compiles a string-schema pattern. Patterns match anywhere in
+    the string (as per JSON schema), unless anchored.
+
+    :param pattern:     The regex pattern.
+    :return:            The compiled pattern.
+    """
+    try:
+        return re.compile(pattern)
+    except re.error as e:
+        raise JSONSchemaError(f"Invalid pattern {pattern!r}: {e}") from e
+
+
+def anchor_pattern(pattern: str) -> str:
+    """
+    Anchors a pattern so that it must match the entire string. The end
+    is anchored with a negative look-ahead rather than $ (which Python
+    also matches before a trailing newline) or \\Z (which isn't valid
+    in ECMA 262 regular expressions, as used by JSON schema).
+
+    :param pattern:     The regex pattern.
+    :return:            The anchored pattern.
+    """
+    return f"^(?:{pattern})(?![\\s\\S])"
@@ -0,0 +1,345 @@
+"""
+Module for simplifying JSON schema before they are used for validation.
+Simplification produces a schema which validates exactly the same JSON
+as the original, but with less nesting for the validator to traverse.
+"""
+from typing import List, Dict, Set, Optional
+
+from ..pointer import unescape_token
+from .constants import *
+from ._fingerprint import fingerprint
+from ._static import TRIVIALLY_SUCCEED_SCHEMA, TRIVIALLY_FAIL_SCHEMA
+from ._typing import JSONSchema, JSONDefinitions
+
+# The prefix of references to definitions
+DEFINITION_REFERENCE_PREFIX: str = f"#/{DEFINITIONS_KEYWORD}/"
+
+
+def simplify(schema: JSONSchema) -> JSONSchema:
+    """
+    Simplifies a schema, without changing what it validates. Nested
+    allOf/anyOf are flattened, trivial branches are removed or folded,
+    duplicate branches are removed, empty and unused definitions are
+    removed, and definitions which are referenced only once are inlined.
+    The given schema is not modified, but the result may share
+    sub-schemas with it.
+
+    :param schema:  The schema to simplify.
+    :return:        The simplified schema.
+    """
+    schema = simplify_sub_schema(schema)
+
+    # Inline definitions referenced only once, and simplify again
+    # to take advantage of the newly-inlined schema
+    inlined = inline_definitions(schema)
+    if inlined is not schema:
+        schema = simplify_sub_schema(inlined)
+
+    return schema
+
+
+def simplify_sub_schema(schema: JSONSchema) -> JSONSchema:
+    """
+    Simplifies a schema and all its sub-schemas (but doesn't inline
+    definitions).
+
+    :param schema:  The schema to simplify.
+    :return:        The simplified schema.
+    """
+    # Boolean schema are as simple as they get
+    if not isinstance(schema, dict):
+        return schema
+
+    # Simplify all sub-schemas
+    result = {}
+    for keyword, value in schema.items():
+        if keyword in SUB_SCHEMA_LIST_KEYWORDS and isinstance(value, list):
+            value = [simplify_sub_schema(sub_schema) for sub_schema in value]
+        elif keyword in SUB_SCHEMA_KEYWORDS:
+            value = simplify_sub_schema(value)
+        elif keyword in SUB_SCHEMA_MAP_KEYWORDS and isinstance(value, dict):
+            value = {name: simplify_sub_schema(sub_schema) for name, sub_schema in value.items()}
+        result[keyword] = value
+
+    # Remove empty definitions
+    if DEFINITIONS_KEYWORD in result and len(result[DEFINITIONS_KEYWORD]) == 0:
+        del result[DEFINITIONS_KEYWORD]
+
+    # All-of fails if any branch fails, and ignores branches that always succeed
+    if ALL_OF_KEYWORD in result:
+        branches = flatten(result[ALL_OF_KEYWORD], ALL_OF_KEYWORD)
+        if any(branch is TRIVIALLY_FAIL_SCHEMA for branch in branches):
+            return TRIVIALLY_FAIL_SCHEMA
+        branches = deduplicate([branch for branch in branches if not trivially_succeeds(branch)])
+        result = replace_branches(result, ALL_OF_KEYWORD, branches)
+        if not isinstance(result, dict):
+            return result
+
+    # Any-of succeeds if any branch succeeds, and ignores branches that always fail
+    if ANY_OF_KEYWORD in result:
+        branches = flatten(result[ANY_OF_KEYWORD], ANY_OF_KEYWORD)
+        if any(trivially_succeeds(branch) for branch in branches):
+            branches = [TRIVIALLY_SUCCEED_SCHEMA]
+        branches = deduplicate([branch for branch in branches if branch is not TRIVIALLY_FAIL_SCHEMA])
+        if len(branches) == 0:
+            return TRIVIALLY_FAIL_SCHEMA
+        result = replace_branches(result, ANY_OF_KEYWORD, branches)
+        if not isinstance(result, dict):
+            return result
+
+    # One-of ignores branches that always fail (but duplicates matter)
+    if ONE_OF_KEYWORD in result:
+        branches = [branch for branch in result[ONE_OF_KEYWORD] if branch is not TRIVIALLY_FAIL_SCHEMA]
+        if len(branches) == 0:
+            return TRIVIALLY_FAIL_SCHEMA
+        result = replace_branches(result, ONE_OF_KEYWORD, branches)
+
+    return result
+
+
+def trivially_succeeds(schema: JSONSchema) -> bool:
+    """
+    Whether a schema validates all JSON.
+
+    :param schema:  The schema.
+    :return:        True if the schema always succeeds.
+    """
+    return schema is TRIVIALLY_SUCCEED_SCHEMA or schema == {}
+
+
+def flatten(branches: List[JSONSchema], keyword: str) -> List[JSONSchema]:
+    """
+    Flattens branches which consist only of the same combining keyword
+    into their parent's branches.
+
+    :param branches:    The branches of the combining keyword.
+    :param keyword:     The combining keyword (allOf/anyOf).
+    :return:            The flattened branches.
+    """
+    flattened = []
+    for branch in branches:
+        if isinstance(branch, dict) and len(branch) == 1 and keyword in branch:
+            flattened.extend(flatten(branch[keyword], keyword))
+        else:
+            flattened.append(branch)
+
+    return flattened
+
+
+def deduplicate(branches: List[JSONSchema]) -> List[JSONSchema]:
+    """
+    Removes duplicate branches, keeping the first of each.
+
+    :param branches:    The branches.
+    :return:            The unique branches.
+    """
+    seen: Set[str] = set()
+    unique = []
+    for branch in branches:
+        key = fingerprint(branch)
+        if key not in seen:
+            seen.add(key)
+            unique.append(branch)
+
+    return unique
+
+
+def replace_branches(schema: Dict, keyword: str, branches: List[JSONSchema]) -> JSONSchema:
+    """
+    Replaces the branches of a combining keyword in a schema, removing
+    the keyword if there are no branches, and replacing the schema with
+    the branch if it is the schema's only keyword and there is only one
+    branch.
+
+    :param schema:      The schema.
+    :param keyword:     The combining keyword.
+    :param branches:    The new branches.
+    :return:            The updated schema.
+    """
+    if len(branches) == 0:
+        del schema[keyword]
+    elif len(branches) == 1 and len(schema) == 1:
+        return branches[0]
+    else:
+        schema[keyword] = branches
+
+    return schema
+
+
+def definition_referend(schema: JSONSchema) -> Optional[str]:
+    """
+    Gets the name of the definition a reference schema refers to.
+
+    :param schema:  The schema.
+    :return:        The definition name, or None if the schema isn't a reference.
+    """
+    if not isinstance(schema, dict) or REFERENCE_KEYWORD not in schema:
+        return None
+
+    reference = schema[REFERENCE_KEYWORD]
+    if not isinstance(reference, str) or not reference.startswith(DEFINITION_REFERENCE_PREFIX):
+        return ""
+
+    name = reference[len(DEFINITION_REFERENCE_PREFIX):]
+    if "/" in name:
+        return ""
+
+    return unescape_token(name)
+
+
+def collect_references(schema: JSONSchema, references: List[JSONSchema]):
+    """
+    Collects all reference schemas within a schema.
+
+    :param schema:      The schema.
+    :param references:  The list to add the references to.
+    """
+    if isinstance(schema, dict):
+        if REFERENCE_KEYWORD in schema:
+            references.append(schema)
+        for keyword, value in schema.items():
+            if keyword in SUB_SCHEMA_LIST_KEYWORDS and isinstance(value, list):
+                for sub_schema in value:
+                    collect_references(sub_schema, references)
+            elif keyword in SUB_SCHEMA_KEYWORDS:
+                collect_references(value, references)
+            elif keyword in SUB_SCHEMA_MAP_KEYWORDS and isinstance(value, dict):
+                for sub_schema in value.values():
+                    collect_references(sub_schema, references)
+
+
+def count_all_references(value) -> int:
+    """
+    Counts the reference schemas anywhere within a value, including under
+    keywords which aren't known to contain sub-schemas (e.g. dependencies).
+
+    :param value:   The value (schema, or part of one).
+    :return:        The number of objects containing the reference keyword.
+    """
+    count = 0
+    to_scan = [value]
+    while len(to_scan) > 0:
+        value = to_scan.pop()
+        if isinstance(value, dict):
+            if REFERENCE_KEYWORD in value:
+                count += 1
+            to_scan.extend(value.values())
+        elif isinstance(value, list):
+            to_scan.extend(value)
+
+    return count
+
+
+def inline_definitions(schema: JSONSchema) -> JSONSchema:
+    """
+    Inlines definitions which are referenced only once (and not
+    recursively), and removes definitions which aren't referenced.
+
+    :param schema:  The (simplified) schema.
+    :return:        The schema with definitions inlined, or the
+                    same schema if there was nothing to inline.
+    """
+    # Only root definitions are considered
+    if not isinstance(schema, dict) or DEFINITIONS_KEYWORD not in schema:
+        return schema
+    definitions: JSONDefinitions = schema[DEFINITIONS_KEYWORD]
+
+    # Find all references, giving up if any can't be understood
+    references: List[JSONSchema] = []
+    collect_references(schema, references)
+
+    # Leave the definitions alone if there are references under keywords
+    # that aren't walked, as their uses can't all be found (or substituted)
+    if count_all_references(schema) != len(references):
+        return schema
+
+    referends = [definition_referend(reference) for reference in references]
+    if any(referend not in definitions for referend in referends):
+        return schema
+
+    # Count the uses of each definition
+    uses: Dict[str, int] = {name: 0 for name in definitions}
+    for referend in referends:
+        uses[referend] += 1
+
+    # Find the definitions each definition refers to
+    dependencies: Dict[str, Set[str]] = {}
+    for name, definition in definitions.items():
+        definition_references = []
+        collect_references(definition, definition_references)
+        dependencies[name] = {definition_referend(reference) for reference in definition_references}
+
+    # Inline definitions used once by a bare reference, and not recursively
+    bare_referends = {referend for reference, referend in zip(references, referends) if len(reference) == 1}
+    inlined = {name for name, count in uses.items()
+               if count == 1 and name in bare_referends and not is_recursive(name, dependencies)}
+
+    # The root itself may be a reference to a definition
+    root_referend = definition_referend(schema)
+    if (root_referend in definitions
+            and uses[root_referend] == 1
+            and set(schema) == {REFERENCE_KEYWORD, DEFINITIONS_KEYWORD}
+            and isinstance(definitions[root_referend], dict)
+            and DEFINITIONS_KEYWORD not in definitions[root_referend]
+            and not is_recursive(root_referend, dependencies)):
+        inlined.add(root_referend)
+    else:
+        root_referend = None
+
+    # Nothing to do if all definitions are in use and none can be inlined
+    unused = {name for name, count in uses.items() if count == 0}
+    if len(inlined) == 0 and len(unused) == 0:
+        return schema
+
+    # Inline the definitions
+    def substitute(sub_schema: JSONSchema) -> JSONSchema:
+        if not isinstance(sub_schema, dict):
+            return sub_schema
+        if len(sub_schema) == 1 and definition_referend(sub_schema) in inlined:
+            return substitute(definitions[definition_referend(sub_schema)])
+        result = {}
+        for keyword, value in sub_schema.items():
+            if keyword in SUB_SCHEMA_LIST_KEYWORDS and isinstance(value, list):
+                value = [substitute(item) for item in value]
+            elif keyword in SUB_SCHEMA_KEYWORDS:
+                value = substitute(value)
+            elif keyword in SUB_SCHEMA_MAP_KEYWORDS and isinstance(value, dict) and keyword != DEFINITIONS_KEYWORD:
+                value = {name: substitute(item) for name, item in value.items()}
+            result[keyword] = value
+        return result
+
+    remaining = {name: substitute(definition)
+                 for name, definition in definitions.items()
+                 if name not in inlined and name not in unused}
+
+    # Replace a root reference with its definition
+    if root_referend is not None:
+        result = substitute(definitions[root_referend])
+    else:
+        result = substitute({keyword: value for keyword, value in schema.items() if keyword != DEFINITIONS_KEYWORD})
+
+    if len(remaining) > 0:
+        result[DEFINITIONS_KEYWORD] = remaining
+
+    return result
+
+
+def is_recursive(name: str, dependencies: Dict[str, Set[str]]) -> bool:
+    """
+    Whether a definition refers to itself, directly or indirectly.
+
+    :param name:            The definition name.
+    :param dependencies:    The definitions each definition refers to.
+    :return:                True if the definition is recursive.
+    """
+    visited: Set[str] = set()
+    to_visit = list(dependencies[name])
+    while len(to_visit) > 0:
+        dependency = to_visit.pop()
+        if dependency == name:
+            return True
+        if dependency not in visited:
+            visited.add(dependency)
+            to_visit.extend(dependencies.get(dependency, ()))
+
+    return False
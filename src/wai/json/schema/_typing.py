@@ -1,11 +1,13 @@
 """
 Module for static and dynamic typing of JSON schema.
 """
+from collections import OrderedDict
+from threading import Lock
 from typing import Union, Dict
 
-import jsonschema
 from wai.common.meta import does_not_raise
 
+from ..error import JSONSchemaError
 from ..raw import RawJSONObject
 
 # The type of a schema (boolean schema are trivial)
@@ -14,6 +16,86 @@ JSONSchema = Union[RawJSONObject, bool]
 # The type of a definition
 JSONDefinitions = Dict[str, JSONSchema]
 
+# The maximum number of meta-validation results to remember
+CHECK_SCHEMA_CACHE_SIZE: int = 1024
+
+# The results of previous meta-validations, by schema fingerprint (None for valid
+# schema, or the details of the error raised for invalid schema, from which a new
+# error is raised each time, so the cache doesn't keep tracebacks alive)
+_check_schema_cache: OrderedDict = OrderedDict()
+
+# Lock protecting the meta-validation cache
+_check_schema_lock: Lock = Lock()
+
+
+def check_schema(schema):
+    """
+    Checks the given object is a valid schema, raising the jsonschema
+    SchemaError if not. The result is remembered, so that each distinct
+    schema is only checked once (up to CHECK_SCHEMA_CACHE_SIZE schema).
+
+    :param schema:  The schema to check.
+    """
+    # Have to local-import fingerprint to avoid circular reference
+    from ._fingerprint import fingerprint
+
+    # jsonschema is slow to import, so only import it when first needed
+    import jsonschema
+
+    # Look for a previous result (non-JSON schema are never cached)
+    try:
+        key = fingerprint(schema)
+    except JSONSchemaError:
+        key = None
+
+    if key is not None:
+        with _check_schema_lock:
+            cached = key in _check_schema_cache
+            if cached:
+                _check_schema_cache.move_to_end(key)
+                details = _check_schema_cache[key]
+
+        if cached:
+            if details is not None:
+                raise jsonschema.SchemaError(**details)
+            return
+
+    # Check the schema against the standard it declares (or the latest)
+    error = None
+    try:
+        jsonschema.validators.validator_for(schema).check_schema(schema)
+    except jsonschema.SchemaError as e:
+        error = e
+
+    # Remember the result
+    if key is not None:
+        with _check_schema_lock:
+            _check_schema_cache[key] = schema_error_details(error) if error is not None else None
+            if len(_check_schema_cache) > CHECK_SCHEMA_CACHE_SIZE:
+                _check_schema_cache.popitem(last=False)
+
+    if error is not None:
+        raise error
+
+
+def schema_error_details(error) -> Dict:
+    """
+    Gets the details of a jsonschema SchemaError, from which
+    an equivalent error can be created.
+
+    :param error:   The error.
+    :return:        The keyword arguments for creating the error.
+    """
+    return {
+        "message": error.message,
+        "validator": error.validator,
+        "path": tuple(error.path),
+        "validator_value": error.validator_value,
+        "instance": error.instance,
+        "schema": error.schema,
+        "schema_path": tuple(error.schema_path)
+    }
+
 
 def is_schema(schema):
     """
@@ -23,5 +105,4 @@ def is_schema(schema):
     :return:        True if it is a schema,
                     False if not.
     """
-    # Get JSONSchema to check the schema against the latest standard
-    return does_not_raise(jsonschema.validators.validator_for(schema).check_schema, schema)
+    return does_not_raise(check_schema, schema)
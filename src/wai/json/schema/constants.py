@@ -35,3 +35,33 @@ OBJECT_TYPE: str = "object"
 STRING_TYPE: str = "string"
 BOOL_TYPE: str = "boolean"
 NULL_TYPE: str = "null"
+
+# Keywords whose values are a single sub-schema
+SUB_SCHEMA_KEYWORDS: tuple = (
+    ADDITIONAL_PROPERTIES_KEYWORD,
+    ITEMS_KEYWORD,
+    "not",
+    "contains",
+    "propertyNames",
+    "additionalItems",
+    "if",
+    "then",
+    "else"
+)
+
+# Keywords whose values map names to sub-schemas
+SUB_SCHEMA_MAP_KEYWORDS: tuple = (
+    PROPERTIES_KEYWORD,
+    DEFINITIONS_KEYWORD,
+    "patternProperties",
+    "dependentSchemas"
+)
+
+# Keywords whose values are lists of sub-schemas
+SUB_SCHEMA_LIST_KEYWORDS: tuple = (
+    ALL_OF_KEYWORD,
+    ANY_OF_KEYWORD,
+    ONE_OF_KEYWORD,
+    ITEMS_KEYWORD,
+    "prefixItems"
+)
@@ -0,0 +1,201 @@
+from collections import OrderedDict
+from contextvars import ContextVar
+from threading import Lock
+from typing import Optional, Dict, Any, Tuple, Type
+
+from ..raw import RawJSONElement
+from ..validator import JSONValidator
+
+# The pool in use by the current context, if any
+_active_pool: ContextVar[Optional['InterningPool']] = ContextVar("_active_pool", default=None)
+
+# The tokens for restoring previously-active pools in the current context
+_pool_tokens: ContextVar[Tuple] = ContextVar("_pool_tokens", default=())
+
+# The canonical keys of raw JSON containers seen during the current
+# top-level deserialisation, by id
+_load_keys: ContextVar[Optional[Dict[int, Any]]] = ContextVar("_load_keys", default=None)
+
+
+class CanonicalKey:
+    """
+    Hashable key representing the canonical form of a raw JSON
+    container. Keys for sub-containers are nested, and the hash is
+    calculated once on creation, so keys can be built bottom-up
+    in time linear in the size of the raw JSON.
+    """
+    __slots__ = ("_items", "_hash")
+
+    def __init__(self, items: Tuple):
+        self._items: Tuple = items
+        self._hash: int = hash(items)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        if other is self:
+            return True
+
+        if not isinstance(other, CanonicalKey):
+            return NotImplemented
+
+        return self._hash == other._hash and self._items == other._items
+
+
+class InterningPool:
+    """
+    Pool of shared, frozen instances deserialised from raw JSON.
+    While the pool is active (using a with-statement), deserialising
+    raw JSON which is identical to previously-deserialised raw JSON
+    returns the same instance, instead of creating a new one. Only
+    types which can be frozen are interned.
+
+    The pool can either be scoped to a single with-block, or reused
+    across several, in which case max_size can be used to bound the
+    number of instances held (least-recently-used are discarded first).
+    A pool can be shared between threads, but must be activated in each.
+    """
+    def __init__(self, max_size: Optional[int] = None):
+        # The maximum number of instances to hold
+        self._max_size: Optional[int] = max_size
+
+        # The interned instances, and whether their raw JSON has been validated
+        self._instances: OrderedDict = OrderedDict()
+
+        # Lock protecting the instances
+        self._lock: Lock = Lock()
+
+        # Statistics
+        self._hits: int = 0
+        self._misses: int = 0
+
+    @staticmethod
+    def active() -> Optional['InterningPool']:
+        """
+        Gets the interning pool active in the current context.
+
+        :return:    The pool, or None if there is no pool active.
+        """
+        return _active_pool.get()
+
+    @property
+    def max_size(self) -> Optional[int]:
+        """
+        The maximum number of instances this pool holds.
+        """
+        return self._max_size
+
+    @property
+    def hits(self) -> int:
+        """
+        The number of times an existing instance was returned.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        The number of times a new instance was created.
+        """
+        return self._misses
+
+    def clear(self):
+        """
+        Removes all instances from the pool.
+        """
+        with self._lock:
+            self._instances.clear()
+
+    def intern(self, cls: Type, raw_json: RawJSONElement, validate: bool = True):
+        """
+        Gets the shared instance of the given type for the given raw JSON,
+        deserialising a new instance if there is none.
+
+        :param cls:         The type to deserialise.
+        :param raw_json:    The raw JSON element.
+        :param validate:    Whether to validate the raw JSON.
+        :return:            The shared instance.
+        """
+        # Start a new set of canonical keys if this is a top-level call
+        keys = _load_keys.get()
+        token = _load_keys.set({}) if keys is None else None
+
+        try:
+            key = (cls, self.canonical_key(raw_json))
+
+            # Look for an existing instance
+            with self._lock:
+                entry = self._instances.get(key, None)
+                if entry is not None:
+                    self._instances.move_to_end(key)
+                    self._hits += 1
+
+            # Validate existing instances if they haven't been already
+            if entry is not None:
+                if validate and not entry[1] and issubclass(cls, JSONValidator):
+                    cls.validate_raw_json(raw_json)
+                    entry[1] = True
+
+                return entry[0]
+
+            # Otherwise create a new instance
+            if validate and issubclass(cls, JSONValidator):
+                cls.validate_raw_json(raw_json)
+            instance = cls._deserialise_from_raw_json(raw_json).freeze()
+
+            # Add it to the pool
+            with self._lock:
+                self._misses += 1
+                self._instances[key] = [instance, validate]
+                if self._max_size is not None and len(self._instances) > self._max_size:
+                    self._instances.popitem(last=False)
+
+            return instance
+
+        finally:
+            if token is not None:
+                _load_keys.reset(token)
+
+    @staticmethod
+    def canonical_key(raw_json: RawJSONElement) -> Any:
+        """
+        Gets a hashable key for the given raw JSON. Raw JSON elements
+        have equal keys only if they are identical (including the types
+        of numbers).
+
+        :param raw_json:    The raw JSON element.
+        :return:            The key.
+        """
+        # Primitives are keyed by their value and type (to distinguish 1, 1.0 and True)
+        if not isinstance(raw_json, (dict, list, tuple)):
+            return type(raw_json), raw_json
+
+        # Reuse the keys of containers already seen in this deserialisation
+        keys = _load_keys.get()
+        if keys is not None and id(raw_json) in keys:
+            return keys[id(raw_json)][0]
+
+        if isinstance(raw_json, dict):
+            key = CanonicalKey((dict, frozenset((name, InterningPool.canonical_key(value))
+                                                for name, value in raw_json.items())))
+        else:
+            key = CanonicalKey((list, tuple(InterningPool.canonical_key(value) for value in raw_json)))
+
+        # Remember the key (keeping the container alive so its id isn't reused)
+        if keys is not None:
+            keys[id(raw_json)] = (key, raw_json)
+
+        return key
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def __enter__(self) -> 'InterningPool':
+        _pool_tokens.set(_pool_tokens.get() + (_active_pool.set(self),))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        tokens = _pool_tokens.get()
+        _pool_tokens.set(tokens[:-1])
+        _active_pool.reset(tokens[-1])
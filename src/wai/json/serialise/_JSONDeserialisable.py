@@ -1,12 +1,20 @@
 import json
 from abc import abstractmethod
-from typing import TypeVar, Generic, IO
+from typing import TYPE_CHECKING, TypeVar, Generic, IO, Optional, Union, Iterable, Iterator
 
 from wai.common.decorator import ensure_error_type
 
 from ..error import JSONSerialisationError
 from ..raw import RawJSONElement
 from ..validator import JSONValidator
+from ._async import run_in_executor, async_ensure_error_type
+from ._InterningPool import InterningPool
+from ._load_many import LoadResult, resolve_paths, iter_load_many
+
+# asyncio is slow to import, so is only imported for type-checking
+if TYPE_CHECKING:
+    from asyncio import StreamReader
+    from concurrent.futures import Executor
 
 # The type of the object that is deserialised
 SelfType = TypeVar("SelfType", bound="JSONDeserialisable")
@@ -37,6 +45,11 @@ class JSONDeserialisable(Generic[SelfType]):
         :param validate:    Whether to validate the JSON before deserialisation.
         :return:            The object instance.
         """
+        # Use the shared instance if interning
+        pool = InterningPool.active()
+        if pool is not None and hasattr(cls, "freeze"):
+            return pool.intern(cls, raw_json, validate)
+
         # Validate the raw JSON if we are capable
         if validate and issubclass(cls, JSONValidator):
             cls.validate_raw_json(raw_json)
@@ -82,3 +95,81 @@ class JSONDeserialisable(Generic[SelfType]):
         """
         with open(filename, 'r') as file:
             return cls.read_json_from_stream(file, validate)
+
+    @classmethod
+    @async_ensure_error_type(JSONSerialisationError, "Error reading JSON from stream: {0}")
+    async def read_json_from_stream_async(cls,
+                                          stream: 'StreamReader',
+                                          validate: bool = True,
+                                          encoding: str = "utf-8",
+                                          executor: Optional['Executor'] = None) -> SelfType:
+        """
+        Instantiates an object of this type from the given asyncio stream,
+        reading until the end of the stream. Parsing, validation and
+        deserialisation are performed on an executor.
+
+        :param stream:      The stream to read from.
+        :param validate:    Whether to validate the JSON before deserialisation.
+        :param encoding:    The encoding of the stream's bytes.
+        :param executor:    The executor to use, or None for the default
+                            (see set_default_executor).
+        :return:            The object instance.
+        """
+        data = await stream.read()
+
+        return await run_in_executor(cls.from_json_string, data.decode(encoding), validate, executor=executor)
+
+    @classmethod
+    @async_ensure_error_type(JSONSerialisationError, "Error loading JSON from file '{filename}': {0}")
+    async def load_json_from_file_async(cls,
+                                        filename: str,
+                                        validate: bool = True,
+                                        executor: Optional['Executor'] = None) -> SelfType:
+        """
+        Loads an instance of this class from the given file, performing the
+        file I/O, parsing, validation and deserialisation on an executor.
+
+        :param filename:    The name of the file to load from.
+        :param validate:    Whether to validate the JSON before deserialisation.
+        :param executor:    The executor to use, or None for the default
+                            (see set_default_executor).
+        :return:            The instance.
+        """
+        return await run_in_executor(cls.load_json_from_file, filename, validate, executor=executor)
+
+    @classmethod
+    @ensure_error_type(JSONSerialisationError, "Error loading JSON from files {paths}: {0}")
+    def load_many(cls,
+                  paths: Union[str, Iterable[str]],
+                  validate: bool = True,
+                  workers: Optional[int] = None,
+                  executor: Union[str, 'Executor'] = "thread",
+                  ordered: bool = False) -> Iterator[LoadResult]:
+        """
+        Loads instances of this class from many files in parallel. Errors
+        loading individual files are collected in the results rather than
+        raised, so one bad file doesn't stop the others from loading.
+
+        Thread workers share the GIL, so "process" is faster when parsing and
+        validation dominate. Process workers only read, parse and validate the
+        JSON, so this class must be importable by the workers (i.e. defined at
+        module level).
+
+        :param paths:       A glob pattern (which can use ** to match directories
+                            recursively), or the names of the files to load.
+        :param validate:    Whether to validate the JSON before deserialisation.
+        :param workers:     The number of workers, or None for the number of CPUs.
+                            If an executor is given, the number of its workers
+                            (used to limit the loads in progress at once), or None
+                            to take it from the executor where possible.
+        :param executor:    The kind of workers to create ("thread" or "process"),
+                            or an existing executor to use (which isn't shut down).
+        :param ordered:     Whether to produce results in the order of the files,
+                            rather than as they finish loading.
+        :return:            An iterator over the results for each file.
+        """
+        # Check the executor before starting
+        if isinstance(executor, str) and executor not in ("thread", "process"):
+            raise JSONSerialisationError(f"Executor must be 'thread', 'process' or an Executor, got {executor!r}")
+
+        return iter_load_many(cls, resolve_paths(paths), validate, workers, executor, ordered)
@@ -1,12 +1,18 @@
 import json
 from abc import abstractmethod
-from typing import IO, Optional
+from typing import TYPE_CHECKING, IO, Optional
 
 from wai.common.decorator import ensure_error_type
 
 from ..error import JSONSerialisationError
-from ..raw import RawJSONElement
+from ..raw import RawJSONElement, content_hash
 from ..validator import JSONValidator
+from ._async import run_in_executor, async_ensure_error_type
+
+# asyncio is slow to import, so is only imported for type-checking
+if TYPE_CHECKING:
+    from asyncio import StreamWriter
+    from concurrent.futures import Executor
 
 
 class JSONSerialisable:
@@ -57,6 +63,17 @@ class JSONSerialisable:
                           indent=indent,
                           separators=(',', ':') if indent is None else None)
 
+    @ensure_error_type(JSONSerialisationError, "Error hashing {self.__class__.__qualname__}: {0}")
+    def content_hash(self, algorithm: str = "sha256") -> str:
+        """
+        Gets a digest of the canonical encoding of this object's raw JSON,
+        which is equal for objects with equal JSON (see raw.content_hash).
+
+        :param algorithm:   The name of the hashlib algorithm to use.
+        :return:            The digest, as a hex string.
+        """
+        return content_hash(self.to_raw_json(False), algorithm)
+
     @ensure_error_type(JSONSerialisationError, "Error writing {self.__class__.__qualname__} to stream: {0}")
     def write_json_to_stream(self, stream: IO[str], indent: Optional[int] = None, validate: bool = True) -> None:
         """
@@ -88,3 +105,47 @@ class JSONSerialisable:
         """
         with open(filename, 'w') as file:
             self.write_json_to_stream(file, indent, validate)
+
+    @async_ensure_error_type(JSONSerialisationError, "Error writing {self.__class__.__qualname__} to stream: {0}")
+    async def write_json_to_stream_async(self,
+                                         stream: 'StreamWriter',
+                                         indent: Optional[int] = None,
+                                         validate: bool = True,
+                                         encoding: str = "utf-8",
+                                         executor: Optional['Executor'] = None) -> None:
+        """
+        Writes this object as JSON to an asyncio stream, waiting until the
+        stream has drained. Serialisation and validation are performed on
+        an executor.
+
+        :param stream:      The stream to write to.
+        :param indent:      The indent level to use for pretty-printing, or
+                            None for compact representation.
+        :param validate:    Whether to validate the serialised JSON if possible.
+        :param encoding:    The encoding to write the JSON in.
+        :param executor:    The executor to use, or None for the default
+                            (see set_default_executor).
+        """
+        json_string = await run_in_executor(self.to_json_string, indent, validate, executor=executor)
+
+        stream.write(json_string.encode(encoding))
+        await stream.drain()
+
+    @async_ensure_error_type(JSONSerialisationError, "Error saving {self.__class__.__qualname__} to '{filename}': {0}")
+    async def save_json_to_file_async(self,
+                                      filename: str,
+                                      indent: Optional[int] = None,
+                                      validate: bool = True,
+                                      executor: Optional['Executor'] = None) -> None:
+        """
+        Saves this object to the given file, performing the serialisation,
+        validation and file I/O on an executor.
+
+        :param filename:    The name of the file to save to.
+        :param indent:      The indent level to use for pretty-printing, or
+                            None for compact representation.
+        :param validate:    Whether to validate the serialised JSON if possible.
+        :param executor:    The executor to use, or None for the default
+                            (see set_default_executor).
+        """
+        await run_in_executor(self.save_json_to_file, filename, indent, validate, executor=executor)
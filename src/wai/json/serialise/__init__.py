@@ -1,7 +1,10 @@
 """
 Package for interfaces supporting JSON serialisation.
 """
+from ._async import set_default_executor, get_default_executor
+from ._InterningPool import InterningPool
 from ._JSONBiserialisable import JSONBiserialisable
 from ._JSONDeserialisable import JSONDeserialisable
 from ._JSONSerialisable import JSONSerialisable
 from ._JSONValidatedBiserialisable import JSONValidatedBiserialisable
+from ._load_many import LoadResult
@@ -0,0 +1,104 @@
+"""
+Module supporting the asynchronous serialisation methods, which perform
+file I/O, parsing and validation on an executor rather than on the event loop.
+"""
+import sys
+from contextvars import copy_context
+from functools import wraps, partial
+from typing import TYPE_CHECKING, Optional, Type, Callable, TypeVar
+
+from wai.common.meta import all_as_kwargs
+
+# asyncio and the executors are slow to import, so are only imported when first needed
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+# The type returned by functions run on the executor
+ResultType = TypeVar("ResultType")
+
+# The executor to use when none is given, or None for the event loop's default executor
+_default_executor: Optional['Executor'] = None
+
+
+def set_default_executor(executor: Optional['Executor']):
+    """
+    Sets the executor the asynchronous serialisation methods use when
+    none is given to them.
+
+    :param executor:    The executor, or None to use the event loop's default executor.
+    """
+    global _default_executor
+    _default_executor = executor
+
+
+def get_default_executor() -> Optional['Executor']:
+    """
+    Gets the executor the asynchronous serialisation methods use when
+    none is given to them.
+
+    :return:    The executor, or None if the event loop's default executor is used.
+    """
+    return _default_executor
+
+
+async def run_in_executor(function: Callable[..., ResultType],
+                          *args,
+                          executor: Optional['Executor'] = None) -> ResultType:
+    """
+    Runs a function on an executor from within the running event loop.
+    Functions run on threads see the current context (so an active
+    InterningPool or ValidationCache still applies).
+
+    :param function:    The function to run.
+    :param args:        The positional arguments to the function.
+    :param executor:    The executor to run the function on, or None for the default.
+    :return:            The function's result.
+    """
+    import asyncio
+
+    if executor is None:
+        executor = _default_executor
+
+    call = partial(function, *args)
+
+    # Contexts can't be sent to other processes
+    if not is_process_pool(executor):
+        call = partial(copy_context().run, call)
+
+    return await asyncio.get_running_loop().run_in_executor(executor, call)
+
+
+def is_process_pool(executor: Optional['Executor']) -> bool:
+    """
+    Whether an executor runs functions in other processes.
+
+    :param executor:    The executor.
+    :return:            True if the executor is a process pool.
+    """
+    # Only check if the process pool module has been imported (otherwise it can't be one)
+    process = sys.modules.get("concurrent.futures.process", None)
+    return process is not None and isinstance(executor, process.ProcessPoolExecutor)
+
+
+def async_ensure_error_type(error_type: Type[Exception], format_message: str):
+    """
+    Equivalent of wai.common's ensure_error_type decorator for coroutine functions.
+
+    :param error_type:      The type of error to ensure.
+    :param format_message:  The message to format if an exception of another type occurs.
+    :return:                The decorator function.
+    """
+    def decorator(function):
+        @wraps(function)
+        async def with_ensured_error_type(*args, **kwargs):
+            try:
+                return await function(*args, **kwargs)
+            except error_type:
+                raise
+            except Exception as e:
+                all_kwargs = all_as_kwargs(function, *args, **kwargs)
+                raise error_type(format_message.format(e, **all_kwargs)) from e
+
+        return with_ensured_error_type
+
+    return decorator
@@ -0,0 +1,209 @@
+"""
+Module supporting JSONDeserialisable.load_many, which loads many files
+in parallel on a pool of worker threads or processes.
+"""
+import json
+import os
+from contextvars import copy_context
+from glob import glob
+from typing import TYPE_CHECKING, Any, Iterator, NamedTuple, Optional, Type, Union, Iterable, List, Dict
+
+from wai.common.decorator import ensure_error_type
+
+from ..error import JSONSerialisationError
+from ..raw import RawJSONElement
+from ..validator import JSONValidator
+from ._async import is_process_pool
+
+# The executors are slow to import, so are only imported when first needed
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+# The number of loads to keep in progress per worker, so results
+# can be streamed without holding every file in memory
+LOADS_PER_WORKER: int = 4
+
+
+class LoadResult(NamedTuple):
+    """
+    The result of loading one of the files given to load_many.
+    """
+    # The name of the file
+    filename: str
+
+    # The loaded instance, or None if loading failed
+    instance: Optional[Any]
+
+    # The error that occurred loading the file, or None if loading succeeded
+    error: Optional[Exception]
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        Whether the file was loaded successfully.
+        """
+        return self.error is None
+
+
+def resolve_paths(paths: Union[str, Iterable[str]]) -> List[str]:
+    """
+    Gets the filenames to load from a glob pattern or iterable of filenames.
+
+    :param paths:   A glob pattern (which can use ** to match directories
+                    recursively), or the filenames.
+    :return:        The filenames, in order (glob matches are sorted).
+    """
+    if isinstance(paths, str):
+        return sorted(glob(paths, recursive=True))
+
+    return list(paths)
+
+
+@ensure_error_type(JSONSerialisationError, "Error loading JSON from file '{filename}': {0}")
+def load_raw_json(cls: Type, filename: str, validate: bool) -> RawJSONElement:
+    """
+    Reads, parses and validates the raw JSON in a file. This is what
+    process workers perform, as raw JSON is cheap to send back to
+    the main process.
+
+    :param cls:         The type the raw JSON is for.
+    :param filename:    The name of the file.
+    :param validate:    Whether to validate the raw JSON.
+    :return:            The raw JSON.
+    """
+    with open(filename, 'r') as file:
+        raw_json = json.load(file)
+
+    if validate and issubclass(cls, JSONValidator):
+        cls.validate_raw_json(raw_json)
+
+    return raw_json
+
+
+def create_executor(executor: str, workers: Optional[int]) -> 'Executor':
+    """
+    Creates a pool of workers to load files on.
+
+    :param executor:    The kind of workers, "thread" or "process".
+    :param workers:     The number of workers, or None for the number of CPUs.
+    :return:            The executor.
+    """
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+    if executor == "thread":
+        return ThreadPoolExecutor(workers)
+    elif executor == "process":
+        return ProcessPoolExecutor(workers)
+
+    raise JSONSerialisationError(f"Executor must be 'thread', 'process' or an Executor, got {executor!r}")
+
+
+def iter_load_many(cls: Type,
+                   filenames: List[str],
+                   validate: bool,
+                   workers: Optional[int],
+                   executor: Union[str, 'Executor'],
+                   ordered: bool) -> Iterator[LoadResult]:
+    """
+    Loads files in parallel, yielding the result for each.
+
+    :param cls:         The type to load.
+    :param filenames:   The names of the files to load.
+    :param validate:    Whether to validate the JSON before deserialisation.
+    :param workers:     The number of workers, or None for the number of CPUs
+                        (or the size of the given executor).
+    :param executor:    The kind of workers to create, or an executor to use.
+    :param ordered:     Whether to yield results in the order of the filenames,
+                        rather than as they complete.
+    :return:            An iterator over the results.
+    """
+    from concurrent.futures import wait, FIRST_COMPLETED
+
+    if len(filenames) == 0:
+        return
+
+    # Create the executor (which we're responsible for shutting down) if not given one
+    owned = isinstance(executor, str)
+    pool = create_executor(executor, workers) if owned else executor
+
+    # Process workers only read, parse and validate the raw JSON, which is deserialised
+    # here. Thread workers see the current context (so an active InterningPool or
+    # ValidationCache still applies), and return the instance
+    in_other_process = is_process_pool(pool)
+
+    # The maximum number of loads in progress at once
+    max_pending = LOADS_PER_WORKER * count_workers(pool, workers)
+
+    try:
+        # The loads in progress, in the order they were submitted, mapped to their filenames
+        to_submit = iter(filenames)
+        pending: Dict[Any, str] = {}
+        while True:
+            # Keep the workers busy
+            for filename in to_submit:
+                if in_other_process:
+                    future = pool.submit(load_raw_json, cls, filename, validate)
+                else:
+                    future = pool.submit(copy_context().run, cls.load_json_from_file, filename, validate)
+                pending[future] = filename
+                if len(pending) >= max_pending:
+                    break
+
+            if len(pending) == 0:
+                return
+
+            # Get the next result to yield
+            if ordered:
+                future = next(iter(pending))
+            else:
+                future = next(iter(wait(pending, return_when=FIRST_COMPLETED).done))
+
+            yield complete_load(cls, pending.pop(future), future, in_other_process)
+
+    finally:
+        if owned:
+            pool.shutdown(cancel_futures=True)
+
+
+def count_workers(executor: 'Executor', workers: Optional[int]) -> int:
+    """
+    Gets the number of workers an executor has.
+
+    :param executor:    The executor.
+    :param workers:     The number of workers, if known.
+    :return:            The number of workers (the number of CPUs if
+                        it can't be determined from the executor).
+    """
+    if workers is not None:
+        return workers
+
+    # The standard executors don't make their size public
+    max_workers = getattr(executor, "_max_workers", None)
+    if isinstance(max_workers, int) and max_workers > 0:
+        return max_workers
+
+    return os.cpu_count() or 1
+
+
+def complete_load(cls: Type, filename: str, future: Any, in_other_process: bool) -> LoadResult:
+    """
+    Gets the result of loading a file, collecting any error.
+
+    :param cls:                 The type being loaded.
+    :param filename:            The name of the file.
+    :param future:              The future for the load.
+    :param in_other_process:    Whether only the raw JSON was loaded (in another process).
+    :return:                    The result.
+    """
+    try:
+        instance = future.result()
+        if in_other_process:
+            instance = cls.from_raw_json(instance, False)
+    except JSONSerialisationError as e:
+        return LoadResult(filename, None, e)
+    except Exception as e:
+        error = JSONSerialisationError(f"Error loading JSON from file '{filename}': {e}")
+        error.__cause__ = e
+        return LoadResult(filename, None, error)
+
+    return LoadResult(filename, instance, None)
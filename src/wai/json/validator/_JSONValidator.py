@@ -3,13 +3,14 @@ from abc import ABC, abstractmethod
 from functools import wraps
 from typing import Callable, Any
 
-import jsonschema
 from wai.common.decorator import ensure_error_type
 from wai.common.meta import does_not_raise, instanceoptionalmethod
 
 from ..error import JSONValidationError
 from ..raw import RawJSONElement, deep_copy
-from ..schema import JSONSchema
+from ..schema import JSONSchema, check_schema
+from ._native import native_validator_type, use_native_keywords
+from ._ValidationCache import ValidationCache
 
 
 class JSONValidator(ABC):
@@ -43,6 +44,21 @@ class JSONValidator(ABC):
         Validates the raw JSON using this object's validation methods
         (schema, special).
 
+        :param self:        The validator instance/class.
+        :param raw_json:    The raw JSON to validate.
+        """
+        # Skip validating content already validated, if caching
+        cache = ValidationCache.active()
+        if cache is not None:
+            cache.validate(self, raw_json, self._validate_raw_json)
+        else:
+            self._validate_raw_json(raw_json)
+
+    @instanceoptionalmethod
+    def _validate_raw_json(self, raw_json: RawJSONElement):
+        """
+        Performs the actual validation of raw JSON.
+
         :param self:        The validator instance/class.
         :param raw_json:    The raw JSON to validate.
         """
@@ -135,18 +151,34 @@ class JSONValidator(ABC):
         :param self:    The validator instance/class.
         :return:        The jsonschema validator.
         """
+        # jsonschema is slow to import, so only import it when first needed
+        import jsonschema.validators
+
         # Get our schema
-        schema: JSONSchema = self.get_json_validation_schema()
+        schema: JSONSchema = self._get_validator_schema()
 
-        # Get the validator class
-        validator_type = jsonschema.validators.validator_for(schema)
+        # Get the validator class (with support for native keywords)
+        validator_type = native_validator_type(jsonschema.validators.validator_for(schema))
 
-        # Check the schema is valid
-        validator_type.check_schema(schema)
+        # Check the schema is valid (only checks each distinct schema once)
+        check_schema(schema)
 
         # Create the instance
         return validator_type(schema)
 
+    @instanceoptionalmethod
+    def _get_validator_schema(self) -> JSONSchema:
+        """
+        Gets the schema to create the jsonschema validator from. This
+        must validate the same JSON as get_json_validation_schema, but
+        may be in a form more suitable for validation. By default it
+        is the validation schema, using native keywords where possible.
+
+        :param self:    The validator instance/class.
+        :return:        The schema.
+        """
+        return use_native_keywords(self.get_json_validation_schema())
+
     @instanceoptionalmethod
     @ensure_error_type(JSONValidationError, "Error cloning JSON validator: {0}")
     def clone_json_validation_schema(self) -> JSONSchema:
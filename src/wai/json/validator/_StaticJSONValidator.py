@@ -1,26 +1,314 @@
 from abc import ABC
+from contextvars import ContextVar
+from inspect import ismethod
+from threading import Lock
+from typing import Any, Tuple, Set, FrozenSet, Dict, Optional
 
 from wai.common.meta import instanceoptionalmethod
 
-from ..schema import JSONSchema
+from ..schema import JSONSchema, simplify
 from ._JSONValidator import JSONValidator
+from ._native import use_native_keywords
+from . import _persistent as persistent
+
+# The names of the attributes the schema/validator are cached under
+SCHEMA_CACHE_ATTRIBUTE: str = "__json_validation_schema"
+SCHEMA_MODULES_CACHE_ATTRIBUTE: str = "__json_validation_schema_modules"
+VALIDATOR_CACHE_ATTRIBUTE: str = "__validator"
+CACHE_ATTRIBUTES: FrozenSet[str] = frozenset((SCHEMA_CACHE_ATTRIBUTE,
+                                              SCHEMA_MODULES_CACHE_ATTRIBUTE,
+                                              VALIDATOR_CACHE_ATTRIBUTE))
+
+
+class SchemaBuild:
+    """
+    Record of a schema which is being built in the current context.
+    """
+    __slots__ = ("owner", "recursive", "incomplete", "modules")
+
+    def __init__(self, owner: Any):
+        # The object the schema is being built for
+        self.owner: Any = owner
+
+        # Whether the schema refers to itself while it is being built
+        self.recursive: bool = False
+
+        # Whether the schema refers to another schema still being built,
+        # so isn't self-contained and mustn't be cached
+        self.incomplete: bool = False
+
+        # The modules which contributed to the schema
+        self.modules: Set[str] = set()
+
+
+# The schemas being built in the current context, outermost first
+_schema_builds: ContextVar[Tuple[SchemaBuild, ...]] = ContextVar("_schema_builds", default=())
+
+# Locks ensuring each schema is built once, by the ID of the cache owner
+# (only held while the schema is being built)
+_schema_locks: Dict[int, Lock] = {}
+
+# Locks ensuring each validator is created once, by the ID of the cache owner
+# (only held while the validator is being created)
+_validator_locks: Dict[int, Lock] = {}
+
+# Lock protecting the schema/validator locks
+_owner_locks_lock: Lock = Lock()
 
 
 class StaticJSONValidator(JSONValidator, ABC):
     """
     Base class for JSON validators whose schema is
     constant for the lifetime of the class/object.
+    The schema and validator are created once and cached,
+    even when first requested by several threads at once.
     """
     @instanceoptionalmethod
     def get_json_validation_schema(self) -> JSONSchema:
-        if not hasattr(self, "__json_validation_schema"):
-            setattr(self, "__json_validation_schema", super().get_json_validation_schema())
+        # Use the cached schema if there is one
+        owner = self._get_cache_owner()
+        cached = get_cached_schema(owner)
+        if cached is not None:
+            return cached
+
+        # Requests for the schema while building it (in this context) don't need the lock
+        if self._is_building_json_validation_schema():
+            return self._build_json_validation_schema(owner)
 
-        return getattr(self, "__json_validation_schema")
+        # Build the schema once, even if requested by several threads at once. Schemas built
+        # while building another only take the lock if it's free, so threads building
+        # mutually-recursive schemas can't deadlock (at worst, both build the same schema)
+        lock = owner_lock(_schema_locks, owner)
+        locked = lock.acquire(blocking=len(_schema_builds.get()) == 0)
+        try:
+            schema = get_cached_schema(owner)
+            if schema is None:
+                schema = self._build_json_validation_schema(owner)
+        finally:
+            if locked:
+                lock.release()
+
+        # The lock is only discarded once the schema is cached, so threads can't
+        # build it concurrently after a failed build
+        if locked and SCHEMA_CACHE_ATTRIBUTE in vars(owner):
+            release_owner_lock(_schema_locks, owner)
+
+        return schema
+
+    @instanceoptionalmethod
+    def _build_json_validation_schema(self, owner: Any) -> JSONSchema:
+        """
+        Builds (or loads from the on-disk cache) the schema for this
+        validator, and caches it on the owner if it is self-contained.
+
+        :param self:    The validator instance/class.
+        :param owner:   The cache owner.
+        :return:        The schema.
+        """
+        # Types' schema may be in the on-disk cache
+        if persistent.is_persistent_cache_enabled() and isinstance(owner, type):
+            loaded = persistent.load_schema(owner)
+            if loaded is not None:
+                schema, modules = loaded
+                cache_schema(owner, schema, modules)
+                note_schema_modules(modules)
+                return schema
+
+        # Record that the schema is being built while building it
+        build = SchemaBuild(owner)
+        token = _schema_builds.set(_schema_builds.get() + (build,))
+        try:
+            schema = super().get_json_validation_schema()
+        finally:
+            _schema_builds.reset(token)
+
+        # Record the modules defining the owner's type(s)
+        for cls in (owner if isinstance(owner, type) else type(owner)).__mro__:
+            build.modules.add(cls.__module__)
+        note_schema_modules(build.modules)
+
+        # Only cache self-contained schemas
+        if not build.incomplete:
+            cache_schema(owner, schema, frozenset(build.modules))
+            if persistent.is_persistent_cache_enabled() and isinstance(owner, type):
+                persistent.store_schema(owner, schema, build.modules)
+
+        return schema
+
+    def __getstate__(self):
+        # Instances' cached schema/validator are recreated when needed, rather than pickled
+        return {name: value for name, value in vars(self).items() if name not in CACHE_ATTRIBUTES}
 
     @instanceoptionalmethod
     def get_validator(self):
-        if not hasattr(self, "__validator"):
-            setattr(self, "__validator", super().get_validator())
+        # Use the cached validator if there is one
+        owner = self._get_cache_owner()
+        validator = vars(owner).get(VALIDATOR_CACHE_ATTRIBUTE, None)
+        if validator is not None:
+            return validator
+
+        # Get the schema before locking, as building it may create other validators
+        self.get_json_validation_schema()
+
+        # Create the validator once, even if requested by several threads at once
+        with owner_lock(_validator_locks, owner):
+            if VALIDATOR_CACHE_ATTRIBUTE not in vars(owner):
+                setattr(owner, VALIDATOR_CACHE_ATTRIBUTE, self._create_validator())
+
+        # The lock is only discarded once the validator is cached (on failure, the
+        # exception skips this), so threads can't create it concurrently after a failure
+        release_owner_lock(_validator_locks, owner)
+
+        return vars(owner)[VALIDATOR_CACHE_ATTRIBUTE]
+
+    @instanceoptionalmethod
+    def _create_validator(self):
+        """
+        Creates the jsonschema validator, using the on-disk cache if enabled.
+
+        :param self:    The validator instance/class.
+        :return:        The jsonschema validator.
+        """
+        if not persistent.is_persistent_cache_enabled():
+            return super().get_validator()
+
+        # Try to load the validator
+        schema = self.get_json_validation_schema()
+        validator = persistent.load_validator(schema)
+
+        # Create and store it if it isn't cached
+        if validator is None:
+            validator = super().get_validator()
+            persistent.store_validator(schema, validator)
+
+        return validator
+
+    @instanceoptionalmethod
+    def _get_validator_schema(self) -> JSONSchema:
+        # Simplify the schema, as the validator is created once and used often
+        return use_native_keywords(simplify(self.get_json_validation_schema()))
 
-        return getattr(self, "__validator")
+    @instanceoptionalmethod
+    def _get_cache_owner(self) -> Any:
+        """
+        Gets the object to cache the schema/validator on. This is whatever
+        _get_json_validation_schema is bound to (the class for class-methods,
+        the instance for instance-methods), so that sub-classes don't
+        inherit the cached schema of their base class.
+
+        :param self:    The validator instance/class.
+        :return:        The cache owner.
+        """
+        method = self._get_json_validation_schema
+        return method.__self__ if ismethod(method) else self
+
+    @instanceoptionalmethod
+    def _is_building_json_validation_schema(self) -> bool:
+        """
+        Whether the schema for this validator is currently being
+        built in this context (i.e. this is a recursive request for it).
+
+        :param self:    The validator instance/class.
+        :return:        True if the schema is being built.
+        """
+        owner = self._get_cache_owner()
+        return any(build.owner is owner for build in _schema_builds.get())
+
+    @instanceoptionalmethod
+    def _note_recursive_json_validation_schema(self):
+        """
+        Records that a reference to the schema for this validator has been
+        made while it is being built. Any schemas being built inside it
+        will contain the reference without the referenced definition, so
+        are marked as incomplete.
+
+        :param self:    The validator instance/class.
+        """
+        owner = self._get_cache_owner()
+        builds = _schema_builds.get()
+        for index, build in enumerate(builds):
+            if build.owner is owner:
+                build.recursive = True
+                for inner_build in builds[index + 1:]:
+                    inner_build.incomplete = True
+                return
+
+    @instanceoptionalmethod
+    def _is_json_validation_schema_recursive(self) -> bool:
+        """
+        Whether the schema for this validator, which is currently being
+        built, refers to itself.
+
+        :param self:    The validator instance/class.
+        :return:        True if the schema is recursive.
+        """
+        owner = self._get_cache_owner()
+        return any(build.owner is owner and build.recursive for build in _schema_builds.get())
+
+
+def note_schema_modules(modules: Set[str]):
+    """
+    Records that the given modules contributed to the schema
+    currently being built (if any).
+
+    :param modules:     The modules.
+    """
+    builds = _schema_builds.get()
+    if len(builds) > 0:
+        builds[-1].modules.update(modules)
+
+
+def get_cached_schema(owner: Any) -> Optional[JSONSchema]:
+    """
+    Gets the schema cached on a cache owner, if any, and records
+    the modules it came from for the schema currently being built.
+
+    :param owner:   The cache owner.
+    :return:        The schema, or None if it isn't cached.
+    """
+    cached = vars(owner)
+    if SCHEMA_CACHE_ATTRIBUTE not in cached:
+        return None
+
+    note_schema_modules(cached[SCHEMA_MODULES_CACHE_ATTRIBUTE])
+    return cached[SCHEMA_CACHE_ATTRIBUTE]
+
+
+def cache_schema(owner: Any, schema: JSONSchema, modules: FrozenSet[str]):
+    """
+    Caches a schema on a cache owner.
+
+    :param owner:       The cache owner.
+    :param schema:      The schema.
+    :param modules:     The modules which contributed to the schema.
+    """
+    # The schema is set last, as its presence means the cache is complete
+    setattr(owner, SCHEMA_MODULES_CACHE_ATTRIBUTE, modules)
+    setattr(owner, SCHEMA_CACHE_ATTRIBUTE, schema)
+
+
+def owner_lock(locks: Dict[int, Lock], owner: Any) -> Lock:
+    """
+    Gets the lock for building the schema or creating the validator
+    of a cache owner.
+
+    :param locks:   The schema or validator locks.
+    :param owner:   The cache owner.
+    :return:        The lock.
+    """
+    with _owner_locks_lock:
+        return locks.setdefault(id(owner), Lock())
+
+
+def release_owner_lock(locks: Dict[int, Lock], owner: Any):
+    """
+    Discards the lock for building the schema or creating the validator
+    of a cache owner. Only called once the schema/validator is cached, so
+    any thread getting a new lock finds it cached (threads still waiting
+    on the old lock keep a reference to it).
+
+    :param locks:   The schema or validator locks.
+    :param owner:   The cache owner.
+    """
+    with _owner_locks_lock:
+        locks.pop(id(owner), None)
@@ -0,0 +1,127 @@
+from collections import OrderedDict
+from contextvars import ContextVar
+from threading import Lock
+from typing import Optional, Tuple, Any, Callable
+
+from ..error import JSONSerialisationError
+from ..raw import RawJSONElement, content_hash
+
+# The cache in use by the current context, if any
+_active_cache: ContextVar[Optional['ValidationCache']] = ContextVar("_active_cache", default=None)
+
+# The tokens for restoring previously-active caches in the current context
+_cache_tokens: ContextVar[Tuple] = ContextVar("_cache_tokens", default=())
+
+
+class ValidationCache:
+    """
+    Cache of successful validations of raw JSON. While the cache is active
+    (using a with-statement), validating raw JSON which has exactly the same
+    content (see raw.content_hash) as raw JSON already validated by the same
+    validator skips validation. This includes the validation performed by
+    from_raw_json.
+
+    Only successful validations are remembered, so invalid raw JSON is
+    always re-validated (producing the same error). The cache can be reused
+    across several with-blocks, in which case max_size can be used to bound
+    the number of validations remembered (least-recently-used are discarded
+    first). A cache can be shared between threads, but must be activated in each.
+    """
+    def __init__(self, max_size: Optional[int] = 1024, algorithm: str = "sha256"):
+        # The maximum number of validations to remember
+        self._max_size: Optional[int] = max_size
+
+        # The hashlib algorithm to digest raw JSON with
+        self._algorithm: str = algorithm
+
+        # The validators, keyed by their ID and the digest of the raw JSON they
+        # validated (holding the validator keeps its ID from being reused)
+        self._validations: OrderedDict = OrderedDict()
+
+        # Lock protecting the validations
+        self._lock: Lock = Lock()
+
+        # Statistics
+        self._hits: int = 0
+        self._misses: int = 0
+
+    @staticmethod
+    def active() -> Optional['ValidationCache']:
+        """
+        Gets the validation cache active in the current context.
+
+        :return:    The cache, or None if there is no cache active.
+        """
+        return _active_cache.get()
+
+    @property
+    def max_size(self) -> Optional[int]:
+        """
+        The maximum number of validations this cache remembers.
+        """
+        return self._max_size
+
+    @property
+    def hits(self) -> int:
+        """
+        The number of times validation was skipped.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        The number of times validation was performed.
+        """
+        return self._misses
+
+    def clear(self):
+        """
+        Forgets all validations.
+        """
+        with self._lock:
+            self._validations.clear()
+
+    def validate(self, validator: Any, raw_json: RawJSONElement, validate: Callable[[RawJSONElement], None]):
+        """
+        Validates raw JSON, unless raw JSON with the same content
+        has already been validated by the given validator.
+
+        :param validator:   The validator instance/class.
+        :param raw_json:    The raw JSON to validate.
+        :param validate:    Function which performs the validation.
+        """
+        # Raw JSON which can't be digested isn't valid, so let validation report it
+        try:
+            key = (id(validator), content_hash(raw_json, self._algorithm, exact=True))
+        except JSONSerialisationError:
+            return validate(raw_json)
+
+        # Skip validation if it has already been performed
+        with self._lock:
+            if key in self._validations:
+                self._validations.move_to_end(key)
+                self._hits += 1
+                return
+            self._misses += 1
+
+        # Otherwise validate (raising if invalid)
+        validate(raw_json)
+
+        # Remember the validation
+        with self._lock:
+            self._validations[key] = validator
+            if self._max_size is not None and len(self._validations) > self._max_size:
+                self._validations.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._validations)
+
+    def __enter__(self) -> 'ValidationCache':
+        _cache_tokens.set(_cache_tokens.get() + (_active_cache.set(self),))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        tokens = _cache_tokens.get()
+        _cache_tokens.set(tokens[:-1])
+        _active_cache.reset(tokens[-1])
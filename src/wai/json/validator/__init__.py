@@ -3,4 +3,10 @@ Package specifying interfaces for objects/classes which can perform JSON validat
 """
 from ._BasicSchemaValidator import BasicSchemaValidator
 from ._JSONValidator import JSONValidator
+from ._persistent import (
+    enable_persistent_cache,
+    disable_persistent_cache,
+    is_persistent_cache_enabled
+)
 from ._StaticJSONValidator import StaticJSONValidator
+from ._ValidationCache import ValidationCache
@@ -0,0 +1,137 @@
+"""
+Module for native (Python) implementations of commonly-used schema,
+which jsonschema validators use in place of the equivalent
+standard schema.
+"""
+from typing import Dict, Callable
+
+from ..raw import check_raw_json
+from ..schema import (
+    JSONSchema,
+    IS_JSON_REFEREND,
+    IS_JSON_REFERENCE,
+    IS_JSON_DEFINITION,
+    compile_pattern,
+    get_format_checker
+)
+from ..schema.constants import *
+
+# Private keyword which validates any JSON natively, in place of IS_JSON_SCHEMA
+IS_JSON_KEYWORD: str = "wai.json:is-json"
+
+# The native-extended versions of jsonschema validator types
+_native_validator_types: Dict[type, type] = {}
+
+
+def is_json(validator, value, instance, schema):
+    """
+    Implementation of the IS_JSON_KEYWORD keyword for jsonschema validators.
+    Unlike the standard schema it replaces, this accepts all raw JSON (see
+    raw.check_raw_json), including tuples as arrays, so that frozen raw JSON
+    is valid wherever any JSON is.
+    """
+    problem = check_raw_json(instance) if value else None
+    if problem is not None:
+        from jsonschema.exceptions import ValidationError
+        yield ValidationError(f"{instance!r} is not valid JSON ({problem.reason} at '{problem.pointer}')")
+
+
+def pattern(validator, value, instance, schema):
+    """
+    Implementation of the standard pattern keyword for jsonschema validators,
+    using the process-wide cache of compiled patterns.
+    """
+    if isinstance(instance, str) and not compile_pattern(value).search(instance):
+        from jsonschema.exceptions import ValidationError
+        yield ValidationError(f"{instance!r} does not match {value!r}")
+
+
+def string_format(validator, value, instance, schema):
+    """
+    Implementation of the standard format keyword for jsonschema validators,
+    which enforces the formats registered with schema.register_format.
+    """
+    checker = get_format_checker(value)
+    if checker is not None and not checker(instance):
+        from jsonschema.exceptions import ValidationError
+        yield ValidationError(f"{instance!r} is not a {value!r}")
+
+
+# The implementations of keywords added to/replaced in jsonschema validators
+NATIVE_KEYWORDS: Dict[str, Callable] = {
+    IS_JSON_KEYWORD: is_json,
+    PATTERN_KEYWORD: pattern,
+    FORMAT_KEYWORD: string_format
+}
+
+
+def native_validator_type(validator_type: type) -> type:
+    """
+    Gets a version of a jsonschema validator type which supports
+    the native keywords.
+
+    :param validator_type:  The jsonschema validator type.
+    :return:                The extended validator type.
+    """
+    if validator_type not in _native_validator_types:
+        # jsonschema is slow to import, so only import it when first needed
+        import jsonschema.validators
+        _native_validator_types[validator_type] = jsonschema.validators.extend(validator_type, NATIVE_KEYWORDS)
+
+    return _native_validator_types[validator_type]
+
+
+def use_native_keywords(schema: JSONSchema) -> JSONSchema:
+    """
+    Replaces standard schema which have native implementations with
+    the native keywords. Currently replaces references to the "any JSON"
+    definition (IS_JSON_SCHEMA), which would otherwise be validated by
+    recursively resolving the reference at every level of the JSON.
+    The given schema is not modified.
+
+    :param schema:  The schema.
+    :return:        The schema using native keywords.
+    """
+    # Can only replace the standard definition
+    definitions = schema.get(DEFINITIONS_KEYWORD, {}) if isinstance(schema, dict) else {}
+    if IS_JSON_REFERENCE in definitions and definitions[IS_JSON_REFERENCE] != IS_JSON_DEFINITION[IS_JSON_REFERENCE]:
+        return schema
+
+    # Replace the references
+    schema = replace_is_json_references(schema)
+
+    # Remove the no-longer-referenced definition
+    if IS_JSON_REFERENCE in definitions:
+        schema[DEFINITIONS_KEYWORD] = {name: definition
+                                       for name, definition in schema[DEFINITIONS_KEYWORD].items()
+                                       if name != IS_JSON_REFERENCE}
+        if len(schema[DEFINITIONS_KEYWORD]) == 0:
+            del schema[DEFINITIONS_KEYWORD]
+
+    return schema
+
+
+def replace_is_json_references(schema: JSONSchema) -> JSONSchema:
+    """
+    Replaces all references to the "any JSON" definition with the
+    native keyword.
+
+    :param schema:  The schema.
+    :return:        The schema with the references replaced.
+    """
+    if not isinstance(schema, dict):
+        return schema
+
+    result = {}
+    for keyword, value in schema.items():
+        if keyword == REFERENCE_KEYWORD and value == IS_JSON_REFEREND:
+            keyword, value = IS_JSON_KEYWORD, True
+        elif keyword in SUB_SCHEMA_LIST_KEYWORDS and isinstance(value, list):
+            value = [replace_is_json_references(sub_schema) for sub_schema in value]
+        elif keyword in SUB_SCHEMA_KEYWORDS:
+            value = replace_is_json_references(value)
+        elif keyword in SUB_SCHEMA_MAP_KEYWORDS and isinstance(value, dict):
+            value = {name: replace_is_json_references(sub_schema) for name, sub_schema in value.items()}
+        result[keyword] = value
+
+    return result
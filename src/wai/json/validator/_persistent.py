@@ -0,0 +1,271 @@
+"""
+Module for the optional on-disk cache of validation schema and
+validator schema, which allows short-lived processes to skip building
+schema and meta-validating them on first use.
+
+Schema for JSON object types are keyed by the type's qualified name,
+and are only reused while the source files of all modules involved in
+building the schema are unchanged. Validator schema are keyed by the
+fingerprint of the validation schema they were created from, and the
+versions of this library and jsonschema.
+"""
+import json
+import os
+import sys
+from hashlib import sha256
+from tempfile import NamedTemporaryFile
+from typing import Optional, Iterable, Dict, Tuple, FrozenSet, Any
+
+from ..schema import JSONSchema, fingerprint
+from ._native import native_validator_type
+
+# The directory holding the cache, or None if the cache is disabled
+_cache_directory: Optional[str] = None
+
+# Key identifying the versions of the code which creates validator schema
+_library_key: Optional[str] = None
+
+# The modules whose source files are part of the library key
+LIBRARY_KEY_MODULES: Tuple[str, ...] = ("wai.json.schema._simplify", "wai.json.validator._native")
+
+
+def enable_persistent_cache(directory: str):
+    """
+    Enables the on-disk cache of schema and validators, stored in
+    the given directory (which is created if it doesn't exist).
+
+    :param directory:   The cache directory.
+    """
+    global _cache_directory, _library_key
+
+    os.makedirs(directory, exist_ok=True)
+
+    # Key validator schema by the versions of the code which produced them
+    _library_key = json.dumps([package_version("wai.json"),
+                               package_version("jsonschema"),
+                               module_stats(LIBRARY_KEY_MODULES)])
+
+    _cache_directory = directory
+
+
+def disable_persistent_cache():
+    """
+    Disables the on-disk cache of schema and validators. The cache
+    directory is left in place.
+    """
+    global _cache_directory
+
+    _cache_directory = None
+
+
+def is_persistent_cache_enabled() -> bool:
+    """
+    Whether the on-disk cache is enabled.
+
+    :return:    True if the cache is enabled.
+    """
+    return _cache_directory is not None
+
+
+def package_version(package: str) -> str:
+    """
+    Gets the installed version of a package.
+
+    :param package:     The package name.
+    :return:            The version, or "unknown" if the package isn't installed.
+    """
+    # importlib.metadata is slow to import, and only needed when enabling the cache
+    from importlib.metadata import version, PackageNotFoundError
+
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def module_stats(modules: Iterable[str]) -> Optional[Dict[str, Tuple[str, int, int]]]:
+    """
+    Gets the path, modification time and size of the source
+    files of the given modules. Built-in modules are ignored.
+
+    :param modules:     The names of the modules.
+    :return:            The stats, by module name, or None if any module
+                        doesn't have a source file.
+    """
+    stats = {}
+    for name in sorted(modules):
+        # Built-in modules can't change
+        module = sys.modules.get(name, None)
+        if getattr(getattr(module, "__spec__", None), "origin", None) in ("built-in", "frozen"):
+            continue
+
+        path = getattr(module, "__file__", None)
+        if path is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        stats[name] = (path, stat.st_mtime_ns, stat.st_size)
+
+    return stats
+
+
+def are_stats_current(stats: Dict[str, Any]) -> bool:
+    """
+    Checks if the source files recorded in the given stats are unchanged.
+
+    :param stats:   The stats, as recorded by module_stats.
+    :return:        True if all source files are unchanged.
+    """
+    for path, mtime, size in stats.values():
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if stat.st_mtime_ns != mtime or stat.st_size != size:
+            return False
+
+    return True
+
+
+def cache_path(kind: str, key: str) -> str:
+    """
+    Gets the path to a cache file.
+
+    :param kind:    The kind of entry (sub-directory).
+    :param key:     The key of the entry.
+    :return:        The path.
+    """
+    return os.path.join(_cache_directory, kind, f"{sha256(key.encode('utf-8')).hexdigest()}.json")
+
+
+def read_entry(kind: str, key: str) -> Optional[Dict[str, Any]]:
+    """
+    Reads an entry from the cache.
+
+    :param kind:    The kind of entry (sub-directory).
+    :param key:     The key of the entry.
+    :return:        The entry, or None if there is no readable entry.
+    """
+    try:
+        with open(cache_path(kind, key), "r") as file:
+            entry = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    # Guard against hash collisions
+    if not isinstance(entry, dict) or entry.get("key", None) != key:
+        return None
+
+    return entry
+
+
+def write_entry(kind: str, key: str, entry: Dict[str, Any]):
+    """
+    Writes an entry to the cache. Entries are written atomically, so
+    concurrent processes never see partially-written entries. Failure
+    to write is ignored.
+
+    :param kind:    The kind of entry (sub-directory).
+    :param key:     The key of the entry.
+    :param entry:   The entry.
+    """
+    path = cache_path(kind, key)
+    entry["key"] = key
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with NamedTemporaryFile("w", dir=os.path.dirname(path), suffix=".tmp", delete=False) as file:
+            json.dump(entry, file)
+        os.replace(file.name, path)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def type_key(cls: type) -> Optional[str]:
+    """
+    Gets the key for the schema of a type.
+
+    :param cls:     The type.
+    :return:        The key, or None if the type can't be identified across processes.
+    """
+    if "<locals>" in cls.__qualname__:
+        return None
+
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def load_schema(cls: type) -> Optional[Tuple[JSONSchema, FrozenSet[str]]]:
+    """
+    Loads the cached validation schema for a type.
+
+    :param cls:     The type.
+    :return:        The schema, and the modules it was built from,
+                    or None if there is no current cached schema.
+    """
+    key = type_key(cls)
+    if key is None:
+        return None
+
+    entry = read_entry("schema", key)
+    if entry is None or not are_stats_current(entry["modules"]):
+        return None
+
+    return entry["schema"], frozenset(entry["modules"])
+
+
+def store_schema(cls: type, schema: JSONSchema, modules: Iterable[str]):
+    """
+    Stores the validation schema for a type in the cache.
+
+    :param cls:         The type.
+    :param schema:      The schema.
+    :param modules:     The modules involved in building the schema.
+    """
+    key = type_key(cls)
+    stats = module_stats(modules)
+    if key is None or stats is None:
+        return
+
+    write_entry("schema", key, {"modules": stats, "schema": schema})
+
+
+def validator_key(schema: JSONSchema) -> str:
+    """
+    Gets the key for the validator schema created from a validation schema.
+
+    :param schema:  The validation schema.
+    :return:        The key.
+    """
+    return f"{fingerprint(schema)}:{_library_key}"
+
+
+def load_validator(schema: JSONSchema):
+    """
+    Creates a validator for a validation schema from the cached
+    validator schema, which was already checked when cached.
+
+    :param schema:  The validation schema.
+    :return:        The jsonschema validator, or None if there is no cached
+                    validator schema.
+    """
+    entry = read_entry("validator", validator_key(schema))
+    if entry is None:
+        return None
+
+    # jsonschema is slow to import, so only import it when first needed
+    import jsonschema.validators
+
+    validator_schema = entry["validator_schema"]
+
+    return native_validator_type(jsonschema.validators.validator_for(validator_schema))(validator_schema)
+
+
+def store_validator(schema: JSONSchema, validator):
+    """
+    Stores the schema of a validator in the cache.
+
+    :param schema:      The validation schema the validator was created for.
+    :param validator:   The jsonschema validator.
+    """
+    write_entry("validator", validator_key(schema), {"validator_schema": validator.schema})
@@ -1,10 +1,47 @@
 from wai.test import AbstractTest
 from wai.test.decorators import RegressionTest, Test, ExceptionTest
 
+import os
+import subprocess
+import sys
+import json
 from json import loads
+from tempfile import TemporaryDirectory
 
+from wai.json.error import (
+    JSONValidationError,
+    JSONSchemaError,
+    ModificationDisallowed,
+    JSONPatchError,
+    JSONPathError,
+    JSONSerialisationError
+)
 from wai.json.object import JSONObject
 from wai.json.object.property import *
+from wai.json.patch import diff, apply_patch
+from wai.json.serialise import InterningPool
+
+
+class PersistedObject(JSONObject):
+    """
+    Object defined at module-level, so its schema can be persisted.
+    """
+    a = NumberProperty()
+
+
+class LoadedObject(JSONObject):
+    """
+    Object defined at module-level, so it can be loaded by worker processes.
+    """
+    a = NumberProperty()
+
+
+class PickledObject(JSONObject):
+    """
+    Object defined at module-level, so it can be pickled.
+    """
+    a = ArrayProperty(element_property=NumberProperty())
+    b = MapProperty(value_property=LoadedObject.as_property(), optional=True)
 
 
 class JSONObjectTest(AbstractTest):
@@ -39,3 +76,977 @@ class JSONObjectTest(AbstractTest):
         subject.set_property("test", 13)
 
         self.assertDictEqual(subject.to_raw_json(), {"test": 13})
+
+    @Test
+    def evolve(self, subject: JSONObject):
+        class Inner(JSONObject):
+            x = NumberProperty()
+
+        class Outer(JSONObject):
+            a = NumberProperty()
+            inner = Inner.as_property()
+            values = ArrayProperty(element_property=NumberProperty())
+
+        original = Outer(a=1, inner=Inner(x=2), values=[1, 2, 3])
+        evolved = original.evolve(a=5)
+
+        self.assertEqual(evolved.a, 5)
+        self.assertEqual(original.a, 1)
+        self.assertIs(evolved.inner, original.inner)
+        self.assertIs(evolved.values, original.values)
+
+    @Test
+    def with_path(self, subject: JSONObject):
+        class Inner(JSONObject):
+            x = NumberProperty()
+            values = ArrayProperty(element_property=NumberProperty())
+
+        class Outer(JSONObject):
+            inner = Inner.as_property()
+            other = Inner.as_property()
+
+        original = Outer(inner=Inner(x=2, values=[1, 2, 3]), other=Inner(x=3, values=[]))
+        updated = original.with_path(["inner", "values", 1], 7)
+
+        self.assertEqual(updated.to_raw_json(), {"inner": {"x": 2, "values": [1, 7, 3]},
+                                                 "other": {"x": 3, "values": []}})
+        self.assertEqual(original.to_raw_json(), {"inner": {"x": 2, "values": [1, 2, 3]},
+                                                  "other": {"x": 3, "values": []}})
+        self.assertIs(updated.other, original.other)
+        self.assertIsNot(updated.inner, original.inner)
+
+    @ExceptionTest(JSONValidationError)
+    def with_path_validates(self, subject: JSONObject):
+        class Inner(JSONObject):
+            values = ArrayProperty(element_property=NumberProperty())
+
+        class Outer(JSONObject):
+            inner = Inner.as_property()
+
+        Outer(inner=Inner(values=[1])).with_path(["inner", "values", 0], "not a number")
+
+    @Test
+    def equality(self, subject: JSONObject):
+        class Inner(JSONObject):
+            x = NumberProperty()
+
+        class Outer(JSONObject):
+            inner = Inner.as_property()
+            values = ArrayProperty(element_property=NumberProperty())
+            map = MapProperty(value_property=StringProperty())
+
+        a = Outer(inner=Inner(x=1), values=[1, 2, 3], map={"k": "v"})
+        b = Outer(inner=Inner(x=1), values=[1, 2, 3], map={"k": "v"})
+
+        self.assertEqual(a, b)
+        self.assertEqual(a.values, b.values)
+        self.assertEqual(a.map, b.map)
+        self.assertEqual(a.values, [1, 2, 3])
+
+        # Modifications must invalidate any cached hashes
+        b.inner.x = 2
+        self.assertNotEqual(a, b)
+        b.inner.x = 1
+        self.assertEqual(a, b)
+        b.values.append(4)
+        self.assertNotEqual(a, b)
+        self.assertNotEqual(a.values, b.values)
+        b.map["k"] = "w"
+        self.assertNotEqual(a.map, b.map)
+
+        # Modifications deep inside a value invalidate the hashes of all its containers
+        class Deep(JSONObject):
+            outers = ArrayProperty(element_property=Outer.as_property())
+
+        c = Deep(outers=[Outer(inner=Inner(x=1), values=[], map={})])
+        d = Deep(outers=[Outer(inner=Inner(x=1), values=[], map={})])
+        self.assertEqual(c, d)
+        d.outers[0].inner.x = 2
+        self.assertNotEqual(c, d)
+
+        # Modifying other objects doesn't invalidate cached hashes
+        cached = c.__dict__["_cached_hash"]
+        Deep(outers=[Outer(inner=Inner(x=1), values=[], map={})])
+        self.assertNotEqual(c, d)
+        self.assertIs(c.__dict__["_cached_hash"], cached)
+
+        # Proxies holding objects equal the equivalent raw JSON
+        class Container(JSONObject):
+            objects = ArrayProperty(element_property=Inner.as_property())
+            by_name = MapProperty(value_property=Inner.as_property())
+
+        container = Container(objects=[Inner(x=1)], by_name={"k": Inner(x=1)})
+        self.assertEqual(container.objects, [{"x": 1}])
+        self.assertEqual(container.by_name, {"k": {"x": 1}})
+        self.assertNotEqual(container.by_name, {"k": {"x": 2}})
+
+        # Objects of different types are never equal
+        self.assertNotEqual(Inner(x=1), subject)
+
+    @Test
+    def hashing(self, subject: JSONObject):
+        """
+        Tests that objects and proxies are hashed consistently with equality,
+        and that equality distinguishes JSON types.
+        """
+        class Outer(JSONObject):
+            values = ArrayProperty(element_property=NumberProperty())
+            map = MapProperty(value_property=StringProperty())
+            any = RawProperty(schema={}, optional=True)
+
+        a = Outer(values=[1, 2], map={"k": "v"})
+        b = Outer(values=[1, 2], map={"k": "v"})
+
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(len({a, b}), 1)
+        self.assertEqual(len({a.values, b.values}), 1)
+        self.assertEqual(len({a.map, b.map}), 1)
+
+        # Freezing doesn't change the hash
+        hashes = {a}
+        a.freeze()
+        self.assertIn(a, hashes)
+        self.assertIn(b, hashes)
+
+        # Values of different JSON types are never equal (but numbers compare by value)
+        self.assertNotEqual(Outer(values=[], map={}, any=True), Outer(values=[], map={}, any=1))
+        self.assertNotEqual(Outer(values=[], map={}, any=[[0]]), Outer(values=[], map={}, any=[[False]]))
+        self.assertEqual(Outer(values=[1], map={}), Outer(values=[1.0], map={}))
+
+    @Test
+    def interning(self, subject: JSONObject):
+        class Category(JSONObject):
+            name = StringProperty()
+
+        class Annotation(JSONObject):
+            category = Category.as_property()
+            points = ArrayProperty(element_property=NumberProperty())
+
+        class Document(JSONObject):
+            annotations = ArrayProperty(element_property=Annotation.as_property())
+
+        raw = {"annotations": [{"category": {"name": "cat"}, "points": [1, 2]},
+                               {"category": {"name": "cat"}, "points": [1, 2]},
+                               {"category": {"name": "dog"}, "points": [1, 2]}]}
+
+        with InterningPool() as pool:
+            document = Document.from_raw_json(raw)
+
+        annotations = document.annotations
+        self.assertIs(annotations[0], annotations[1])
+        self.assertIsNot(annotations[0], annotations[2])
+        self.assertIs(annotations[0].points, annotations[2].points)
+        self.assertTrue(annotations[0].is_frozen)
+        self.assertEqual(document.to_raw_json(), raw)
+        self.assertGreater(pool.hits, 0)
+
+        # Interned instances can't be modified, but can be evolved
+        with self.assertRaises(ModificationDisallowed):
+            annotations[0].category.name = "bird"
+        with self.assertRaises(ModificationDisallowed):
+            annotations[0].points.append(3)
+        self.assertEqual(annotations[0].category.evolve(name="bird").name, "bird")
+
+        # Without the pool, instances are distinct
+        document = Document.from_raw_json(raw)
+        self.assertIsNot(document.annotations[0], document.annotations[1])
+        self.assertFalse(document.is_frozen)
+
+    @Test
+    def view(self, subject: JSONObject):
+        class Inner(JSONObject):
+            x = NumberProperty()
+
+        class Outer(JSONObject):
+            inner = Inner.as_property()
+            inners = ArrayProperty(element_property=Inner.as_property())
+            map = MapProperty(value_property=Inner.as_property())
+            raw = RawProperty(schema={"type": "object"}, optional=True)
+
+        raw = {"inner": {"x": 1}, "inners": [{"x": 2}, {"x": 3}], "map": {"k": {"x": 4}}, "raw": {"a": []}}
+        view = Outer.view(raw)
+
+        # Values are read from the raw JSON, without copying raw values
+        self.assertTrue(view.is_view)
+        self.assertIsInstance(view.inner, Inner)
+        self.assertEqual(view.inner.x, 1)
+        self.assertEqual([inner.x for inner in view.inners], [2, 3])
+        self.assertEqual(view.inners[1].x, 3)
+        self.assertEqual(view.map["k"].x, 4)
+        self.assertIs(view.raw, raw["raw"])
+        self.assertEqual(view.to_raw_json(), raw)
+
+        # Views compare equal to constructed objects
+        self.assertEqual(view, Outer.from_raw_json(raw))
+
+        # Views are read-only
+        with self.assertRaises(ModificationDisallowed):
+            view.inner = Inner(x=5)
+        with self.assertRaises(ModificationDisallowed):
+            view.inners.append(Inner(x=5))
+
+        # Evolving a view doesn't modify the raw JSON
+        evolved = view.with_path(["inners", 0, "x"], 5)
+        self.assertEqual(evolved.inners[0].x, 5)
+        self.assertEqual(raw["inners"][0]["x"], 2)
+
+    @Test
+    def patch(self, subject: JSONObject):
+        class Inner(JSONObject):
+            x = NumberProperty()
+
+        class Outer(JSONObject):
+            a = NumberProperty()
+            b = StringProperty(optional=True)
+            inner = Inner.as_property()
+            values = ArrayProperty(element_property=NumberProperty())
+
+        source = Outer(a=1, inner=Inner(x=2), values=[1, 2, 3, 4])
+        target = Outer(a=1, b="new", inner=Inner(x=3), values=[1, 5, 3, 4, 6])
+        patch = diff(source, target)
+
+        self.assertEqual(patch, [{"op": "add", "path": "/b", "value": "new"},
+                                 {"op": "replace", "path": "/inner/x", "value": 3},
+                                 {"op": "replace", "path": "/values/1", "value": 5},
+                                 {"op": "add", "path": "/values/4", "value": 6}])
+        self.assertEqual(apply_patch(source, patch), target)
+        self.assertEqual(source.values, [1, 2, 3, 4])
+
+        # Shared sub-structure produces no operations
+        self.assertEqual(diff(source, source.evolve(a=2)), [{"op": "replace", "path": "/a", "value": 2}])
+
+        # Remaining operations
+        patched = apply_patch(target, [{"op": "move", "from": "/values/0", "path": "/values/-"},
+                                       {"op": "copy", "from": "/inner/x", "path": "/a"},
+                                       {"op": "remove", "path": "/b"},
+                                       {"op": "test", "path": "/a", "value": 3}])
+        self.assertEqual(patched.to_raw_json(), {"a": 3, "inner": {"x": 3}, "values": [5, 3, 4, 6, 1]})
+
+    @ExceptionTest(JSONPatchError)
+    def patch_is_atomic(self, subject: JSONObject):
+        class Outer(JSONObject):
+            a = NumberProperty()
+
+        source = Outer(a=1)
+        try:
+            apply_patch(source, [{"op": "replace", "path": "/a", "value": 2},
+                                 {"op": "test", "path": "/a", "value": 1}])
+        finally:
+            self.assertEqual(source.a, 1)
+
+    @Test
+    def patch_rejects_malformed_operations(self, subject: JSONObject):
+        """
+        Tests that malformed patch operations raise JSONPatchError.
+        """
+        class Outer(JSONObject):
+            a = NumberProperty()
+
+        source = Outer(a=1)
+        for operation in ({"op": "replace", "path": 5, "value": 2},
+                          {"op": "remove", "path": None},
+                          {"op": "copy", "from": ["a"], "path": "/a"},
+                          {"op": ["add"], "path": "/a", "value": 2}):
+            with self.assertRaises(JSONPatchError):
+                apply_patch(source, [operation])
+
+    @Test
+    def patch_test_compares_types(self, subject: JSONObject):
+        """
+        Tests that the test operation requires values to have the same
+        JSON types (RFC 6902 4.6), not just be equal in Python.
+        """
+        class Outer(JSONObject):
+            flag = BoolProperty()
+            a = NumberProperty()
+            raw = RawProperty(schema={"type": "array"})
+
+        source = Outer(flag=True, a=1, raw=[[0]])
+
+        self.assertIs(apply_patch(source, [{"op": "test", "path": "/flag", "value": True},
+                                           {"op": "test", "path": "/a", "value": 1.0},
+                                           {"op": "test", "path": "/raw", "value": [[0]]}]), source)
+        for path, value in (("/flag", 1), ("/a", True), ("/raw", [[False]])):
+            with self.assertRaises(JSONPatchError):
+                apply_patch(source, [{"op": "test", "path": path, "value": value}])
+
+        # Diffs also see type changes inside arrays
+        target = Outer(flag=True, a=1, raw=[[False]])
+        self.assertEqual(diff(source, target), [{"op": "replace", "path": "/raw/0/0", "value": False}])
+
+    @Test
+    def paths(self, subject: JSONObject):
+        class Inner(JSONObject):
+            x = NumberProperty()
+            raw = RawProperty(schema={"type": "object"}, optional=True)
+
+        class Outer(JSONObject):
+            inner = Inner.as_property()
+            items = ArrayProperty(element_property=Inner.as_property())
+            map = MapProperty(value_property=NumberProperty())
+
+        obj = Outer(inner=Inner(x=1, raw={"a/b": [1, 2]}), items=[Inner(x=2)], map={"k": 3})
+
+        self.assertEqual(obj.get_path("/inner/x"), 1)
+        self.assertEqual(obj.get_path("/items/0/x"), 2)
+        self.assertEqual(obj.get_path("/inner/raw/a~1b/1"), 2)
+        self.assertEqual(obj.get_path(("map", "k")), 3)
+
+        obj.set_path("/items/0/x", 5)
+        obj.set_path("/items/-", {"x": 6})
+        obj.set_path("/inner/raw/a~1b/0", 7)
+        obj.delete_path("/map/k")
+
+        self.assertEqual(obj.to_raw_json(), {"inner": {"x": 1, "raw": {"a/b": [7, 2]}},
+                                             "items": [{"x": 5}, {"x": 6}],
+                                             "map": {}})
+
+        with self.assertRaises(JSONValidationError):
+            obj.set_path("/items/0/x", "not a number")
+        with self.assertRaises(JSONPathError):
+            obj.get_path("/items/2")
+
+    @Test
+    def paths_through_defaults(self, subject: JSONObject):
+        """
+        Tests that setting/deleting paths through absent properties with
+        defaults sets the default first, rather than losing the update.
+        """
+        class Inner(JSONObject):
+            x = NumberProperty()
+            y = NumberProperty(optional=True)
+
+        class Outer(JSONObject):
+            inner = JSONObjectProperty(object_type=Inner, optional=True, default=Inner(x=1, y=2))
+            arr = ArrayProperty(element_property=NumberProperty(), optional=True, default=[1, 2])
+            raw = RawProperty(schema={"type": "object"}, optional=True, default={"a": 1})
+
+        obj = Outer()
+        obj.set_path("/inner/x", 5)
+        obj.set_path("/arr/0", 9)
+        obj.set_path("/raw/a", 2)
+
+        self.assertEqual(obj.get_path("/inner/x"), 5)
+        self.assertEqual(obj.to_raw_json(), {"inner": {"x": 5, "y": 2}, "arr": [9, 2], "raw": {"a": 2}})
+
+        obj = Outer()
+        obj.delete_path("/inner/y")
+        self.assertEqual(obj.to_raw_json(), {"inner": {"x": 1}})
+        self.assertEqual(Outer().inner.y, 2)
+
+    @Test
+    def shared_definitions(self, subject: JSONObject):
+        class Leaf(JSONObject):
+            x = NumberProperty()
+
+        class Outer(JSONObject):
+            a = Leaf.as_property()
+            b = ArrayProperty(element_property=Leaf.as_property())
+
+        class SubLeaf(Leaf):
+            y = NumberProperty()
+
+        schema = Outer.get_json_validation_schema()
+        leaf_name = schema["properties"]["a"]["$ref"].rsplit("/", 1)[-1]
+
+        self.assertEqual(schema["properties"]["b"]["items"], schema["properties"]["a"])
+        self.assertIn(leaf_name, schema["definitions"])
+        self.assertIn("y", SubLeaf.get_json_validation_schema()["properties"])
+
+    @Test
+    def recursive_type(self, subject: JSONObject):
+        class Tree(JSONObject):
+            value = NumberProperty()
+            children = ArrayProperty(element_property=JSONObjectProperty(object_type=lambda: Tree), optional=True)
+
+        tree = Tree.from_raw_json({"value": 1, "children": [{"value": 2, "children": [{"value": 3}]}]})
+
+        self.assertIsInstance(tree.children[0].children[0], Tree)
+        self.assertFalse(Tree.is_valid_raw_json({"value": 1, "children": [{"value": 2, "children": [{}]}]}))
+
+    @Test
+    def schema_checking_is_memoised(self, subject: JSONObject):
+        from wai.json.schema import is_schema, check_schema
+
+        self.assertTrue(is_schema({"type": "number", "minimum": 0}))
+        self.assertTrue(is_schema({"minimum": 0, "type": "number"}))
+        self.assertFalse(is_schema({"type": 5}))
+        self.assertFalse(is_schema({"type": 5}))
+        with self.assertRaises(Exception):
+            check_schema({"type": 5})
+
+        # Remembered failures raise a new (equivalent) error each time
+        from jsonschema import SchemaError
+        errors = []
+        for _ in range(2):
+            with self.assertRaises(SchemaError) as context:
+                check_schema({"type": 5})
+            errors.append(context.exception)
+        self.assertIsNot(errors[0], errors[1])
+        self.assertEqual(errors[0].message, errors[1].message)
+
+    @Test
+    def schema_fingerprint(self, subject: JSONObject):
+        from wai.json.schema import fingerprint, enum
+
+        self.assertEqual(fingerprint({"type": "number", "enum": [3, 1, 2]}),
+                         fingerprint({"enum": [1, 2, 3], "type": "number"}))
+        self.assertNotEqual(fingerprint({"enum": [1, 2]}), fingerprint({"enum": [1, 2, 3]}))
+        self.assertEqual(enum("b", 1, "a", True, 1), enum(True, "a", "b", 1))
+        self.assertEqual(len(enum(1, True)["enum"]), 2)
+
+    @Test
+    def schema_simplification(self, subject: JSONObject):
+        from wai.json.schema import simplify
+
+        self.assertEqual(simplify({"allOf": [{"allOf": [{"type": "number"}, True]}, {"minimum": 0}, {"type": "number"}]}),
+                         {"allOf": [{"type": "number"}, {"minimum": 0}]})
+        self.assertEqual(simplify({"anyOf": [False, {"anyOf": [{"type": "string"}, {"type": "string"}]}]}),
+                         {"type": "string"})
+        self.assertIs(simplify({"allOf": [{"type": "string"}, False]}), False)
+        self.assertEqual(simplify({"properties": {"a": {"$ref": "#/definitions/A"}},
+                                   "definitions": {"A": {"type": "number"}, "B": {"type": "string"}}}),
+                         {"properties": {"a": {"type": "number"}}})
+
+        # Definitions referenced from keywords which aren't walked are kept
+        schema = {"$schema": "http://json-schema.org/draft-07/schema#",
+                  "dependencies": {"a": {"$ref": "#/definitions/x"}},
+                  "definitions": {"x": {"required": ["b"]}, "y": {"type": "string"}}}
+        self.assertEqual(simplify(schema), schema)
+        dependent = RawProperty(schema=schema)
+        dependent.validate_raw_json({"a": 1, "b": 2})
+        with self.assertRaises(JSONValidationError):
+            dependent.validate_raw_json({"a": 1})
+
+        # Recursive definitions are kept
+        recursive = {"$ref": "#/definitions/A",
+                     "definitions": {"A": {"items": {"$ref": "#/definitions/A"}}}}
+        self.assertEqual(simplify(recursive), recursive)
+
+    @Test
+    def native_any_json(self, subject: JSONObject):
+        payload = {"payload": [{"a": [1, "b", {"c": None, "d": [1.5, True]}]}] * 100}
+        schema = subject.get_validator().schema
+
+        self.assertNotIn("definitions", schema)
+        self.assertEqual(subject.from_raw_json(payload).to_raw_json(), payload)
+        self.assertFalse(subject.is_valid_raw_json({"payload": [{"a": object()}]}))
+        self.assertFalse(subject.is_valid_raw_json({"payload": {1: "non-string key"}}))
+
+        # Frozen raw JSON (with tuples as arrays) is any JSON, but tuples still
+        # aren't arrays for schema which require one
+        from wai.json.raw import deep_copy
+
+        class Holder(JSONObject):
+            payload = RawProperty(schema={"type": "array"})
+
+        frozen = deep_copy(payload, freeze=True)
+        self.assertIsInstance(frozen["payload"][0]["a"], tuple)
+        self.assertTrue(subject.is_valid_raw_json(frozen))
+        self.assertFalse(Holder.is_valid_raw_json(frozen))
+
+    @Test
+    def persistent_cache(self, subject: JSONObject):
+        """
+        Tests that the schema and validator of module-level types are persisted.
+        """
+        from wai.json.validator import enable_persistent_cache, disable_persistent_cache
+
+        with TemporaryDirectory() as directory:
+            enable_persistent_cache(directory)
+            try:
+                self.assertTrue(PersistedObject.is_valid_raw_json({"a": 1}))
+                self.assertEqual(len(os.listdir(os.path.join(directory, "schema"))), 1)
+                self.assertEqual(len(os.listdir(os.path.join(directory, "validator"))), 1)
+            finally:
+                disable_persistent_cache()
+
+    @Test
+    def lazy_jsonschema_import(self, subject: JSONObject):
+        """
+        Tests that jsonschema isn't imported until validation is first needed.
+        """
+        script = ("import sys\n"
+                  "import wai.json.object, wai.json.raw, wai.json.schema, wai.json.serialise\n"
+                  "from wai.json.object import JSONObject\n"
+                  "from wai.json.object.property import NumberProperty\n"
+                  "class A(JSONObject):\n"
+                  "    a = NumberProperty()\n"
+                  "assert 'jsonschema' not in sys.modules\n"
+                  "A.from_raw_json({'a': 1})\n"
+                  "assert 'jsonschema' in sys.modules\n")
+
+        result = subprocess.run([sys.executable, "-c", script],
+                                env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+                                capture_output=True)
+
+        self.assertEqual(result.returncode, 0, result.stderr.decode())
+
+    @Test
+    def string_patterns(self, subject: JSONObject):
+        """
+        Tests string properties with (anchored) patterns.
+        """
+        class IDs(JSONObject):
+            search = StringProperty(pattern="[0-9]+", optional=True)
+            anchored = StringProperty(pattern="[0-9]+", anchored=True, optional=True)
+
+        self.assertEqual(IDs(search="id-123").search, "id-123")
+        self.assertEqual(IDs(anchored="123").anchored, "123")
+        self.assertTrue(IDs.is_valid_raw_json({"search": "id-123", "anchored": "123"}))
+        self.assertFalse(IDs.is_valid_raw_json({"anchored": "id-123"}))
+        self.assertFalse(IDs.is_valid_raw_json({"search": "id"}))
+        with self.assertRaises(JSONValidationError):
+            IDs(anchored="id-123")
+        with self.assertRaises(JSONValidationError):
+            IDs(anchored="123\n")
+        self.assertFalse(IDs.is_valid_raw_json({"anchored": "123\n"}))
+        with self.assertRaises(JSONValidationError):
+            IDs(search=123)
+        with self.assertRaises(JSONSchemaError):
+            StringProperty(pattern="[")
+
+    @Test
+    def string_formats(self, subject: JSONObject):
+        """
+        Tests that string formats are enforced, including custom formats.
+        """
+        from wai.json.schema import register_format
+
+        class Formatted(JSONObject):
+            date = StringProperty(format="date", optional=True)
+            uuid = StringProperty(format="uuid", optional=True)
+            address = StringProperty(format="ipv4", optional=True)
+
+        self.assertTrue(Formatted.is_valid_raw_json({"date": "2020-02-29",
+                                                     "uuid": "123e4567-e89b-12d3-a456-426614174000",
+                                                     "address": "192.168.0.1"}))
+        self.assertFalse(Formatted.is_valid_raw_json({"date": "2019-02-29"}))
+        self.assertFalse(Formatted.is_valid_raw_json({"uuid": "123e4567"}))
+        self.assertFalse(Formatted.is_valid_raw_json({"address": "256.0.0.1"}))
+        with self.assertRaises(JSONValidationError):
+            Formatted(date="yesterday")
+
+        # Only ASCII digits are accepted (not e.g. fullwidth or Arabic-Indic digits)
+        self.assertFalse(Formatted.is_valid_raw_json({"date": "\uff12\uff10\uff12\uff10-02-29"}))
+        self.assertFalse(Formatted.is_valid_raw_json({"address": "192.168.0.\u0661"}))
+        with self.assertRaises(JSONValidationError):
+            Formatted(date="2020-02-\u0662\u0669")
+
+        # Unregistered formats are rejected unless unchecked
+        with self.assertRaises(JSONSchemaError):
+            StringProperty(format="wai.json-test-even-length")
+        StringProperty(format="wai.json-test-even-length", check_format=False)
+
+        register_format("wai.json-test-even-length", lambda value: len(value) % 2 == 0)
+        prop = StringProperty(format="wai.json-test-even-length")
+        self.assertTrue(prop.is_valid_raw_json("ab"))
+        self.assertFalse(prop.is_valid_raw_json("abc"))
+
+    @Test
+    def raw_deep_copy(self, subject: JSONObject):
+        """
+        Tests deep-copying raw JSON, including deep, shared, frozen and cyclic JSON.
+        """
+        from wai.json.error import JSONError
+        from wai.json.raw import deep_copy, FrozenRawJSONObject
+
+        shared = [1, {"a": None}]
+        raw = {"x": shared, "y": shared, "z": ("t", [2.5])}
+
+        copy = deep_copy(raw)
+        self.assertEqual(copy, raw)
+        self.assertIsNot(copy["x"], copy["y"])
+        self.assertIsNot(copy["z"][1], raw["z"][1])
+
+        copy = deep_copy(raw, preserve_sharing=True)
+        self.assertIs(copy["x"], copy["y"])
+
+        frozen = deep_copy(raw, freeze=True)
+        self.assertIsInstance(frozen, FrozenRawJSONObject)
+        self.assertEqual(frozen["x"], (1, {"a": None}))
+        with self.assertRaises(ModificationDisallowed):
+            frozen["x"] = 1
+        self.assertTrue(subject.is_valid_raw_json(frozen))
+
+        # Shared containers are frozen once, and stay shared
+        inner = [1]
+        frozen = deep_copy([[inner], [inner], {"a": inner}], preserve_sharing=True, freeze=True)
+        self.assertEqual(frozen, (((1,),), ((1,),), {"a": (1,)}))
+        self.assertIs(frozen[0][0], frozen[1][0])
+        self.assertIs(frozen[0][0], frozen[2]["a"])
+        self.assertIsInstance(frozen[2], FrozenRawJSONObject)
+
+        deep = []
+        for _ in range(10000):
+            deep = [deep]
+        self.assertEqual(len(deep_copy(deep)), 1)
+
+        cyclic = []
+        cyclic.append({"cycle": cyclic})
+        with self.assertRaises(JSONError):
+            deep_copy(cyclic)
+
+    @Test
+    def raw_json_diagnostics(self, subject: JSONObject):
+        """
+        Tests finding why Python objects aren't raw JSON.
+        """
+        from wai.json.raw import check_raw_json, is_raw_json_element
+
+        self.assertIsNone(check_raw_json({"a": [1, "b", (None, 2.5)]}))
+
+        problem = check_raw_json({"a": [1, {"b": object()}]})
+        self.assertEqual(problem.path, ("a", 1, "b"))
+        self.assertEqual(problem.pointer, "/a/1/b")
+
+        self.assertEqual(check_raw_json({"a": {1: None}}).path, ("a",))
+
+        cyclic = [1]
+        cyclic.append({"cycle": cyclic})
+        self.assertEqual(check_raw_json(cyclic).path, (1, "cycle"))
+        self.assertFalse(is_raw_json_element(cyclic))
+
+        nested = [[[]]]
+        self.assertIsNone(check_raw_json(nested, max_depth=3))
+        self.assertEqual(check_raw_json(nested, max_depth=2).path, (0, 0))
+
+    @Test
+    def measure(self, subject: JSONObject):
+        """
+        Tests measuring raw JSON and JSON objects.
+        """
+        from wai.json.raw import measure
+
+        raw = {"a": [1, 2.5, "\u00e9\"", None, True], "b": {"c": [], "d": float("inf")}}
+        measurements = measure(raw)
+        self.assertEqual(measurements.objects, 2)
+        self.assertEqual(measurements.arrays, 2)
+        self.assertEqual(measurements.nodes, 10)
+        self.assertEqual(measurements.max_depth, 3)
+        self.assertEqual(measurements.serialised_size, len(json.dumps(raw, separators=(",", ":"))))
+
+        class Measured(JSONObject):
+            a = NumberProperty()
+            b = ArrayProperty(element_property=StringProperty())
+
+        measured = Measured(a=1, b=["x", "y"])
+        self.assertEqual(measured.measure().serialised_size, len(measured.to_json_string()))
+
+    @Test
+    def canonical_encoding(self, subject: JSONObject):
+        """
+        Tests the canonical encoding and content hashing of raw JSON.
+        """
+        from hashlib import sha256
+        from wai.json.raw import canonical_dumps, content_hash
+
+        self.assertEqual(canonical_dumps({"b": [1.0, 1e-7, 1e21, "\u00e9"], "a": {"c": None, "B": True}}),
+                         '{"a":{"B":true,"c":null},"b":[1,1e-7,1e+21,"\u00e9"]}')
+        self.assertEqual(canonical_dumps(0.000001), "0.000001")
+        self.assertEqual(content_hash({"a": 1, "b": 2}), content_hash({"b": 2.0, "a": 1}))
+        self.assertEqual(content_hash([1, "x"]), sha256(b'[1,"x"]').hexdigest())
+
+        class Hashed(JSONObject):
+            a = NumberProperty(optional=True)
+            b = NumberProperty(optional=True)
+
+        self.assertEqual(Hashed(a=1, b=2).content_hash(), Hashed(b=2, a=1.0).content_hash())
+        self.assertNotEqual(Hashed(a=1).content_hash(), Hashed(b=1).content_hash())
+
+    @Test
+    def validation_cache(self, subject: JSONObject):
+        """
+        Tests that identical raw JSON is only validated once while a
+        validation cache is active.
+        """
+        from wai.json.validator import ValidationCache
+
+        class Cached(JSONObject):
+            a = NumberProperty()
+            b = ArrayProperty(element_property=StringProperty())
+
+        with ValidationCache(max_size=2) as cache:
+            Cached.validate_raw_json({"a": 1, "b": ["x"]})
+            Cached.validate_raw_json({"b": ["x"], "a": 1})
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+            # Deserialisation uses the cache (setting the number property validates it once)
+            Cached.from_raw_json({"a": 1, "b": ["x"]})
+            self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+            # Failed validations aren't remembered
+            for _ in range(2):
+                with self.assertRaises(JSONValidationError):
+                    Cached.validate_raw_json({"a": "1", "b": []})
+            self.assertEqual(cache.misses, 4)
+
+            # Least-recently-used validations are forgotten
+            Cached.validate_raw_json({"a": 2, "b": []})
+            Cached.validate_raw_json({"a": 3, "b": []})
+            self.assertEqual(len(cache), 2)
+            Cached.validate_raw_json({"a": 1, "b": ["x"]})
+            self.assertEqual(cache.misses, 7)
+
+        self.assertIsNone(ValidationCache.active())
+
+        # Raw JSON which only encodes the same canonically isn't conflated
+        class Limited(JSONObject):
+            n = NumberProperty(maximum=10 ** 21)
+            b = ArrayProperty(element_property=NumberProperty(), optional=True)
+
+        with ValidationCache():
+            Limited.validate_raw_json({"n": 10 ** 21, "b": [1]})
+            self.assertFalse(Limited.is_valid_raw_json({"n": 10 ** 21 + 1, "b": [1]}))
+            self.assertFalse(Limited.is_valid_raw_json({"n": 10 ** 21, "b": (1,)}))
+
+    @Test
+    def async_serialisation(self, subject: JSONObject):
+        """
+        Tests the asynchronous counterparts of the file/stream methods.
+        """
+        import asyncio
+        import socket
+        from concurrent.futures import ThreadPoolExecutor
+
+        class Config(JSONObject):
+            a = NumberProperty()
+            b = StringProperty(optional=True)
+
+        async def round_trip(directory: str):
+            # Files, on the default and a given executor
+            filename = os.path.join(directory, "config.json")
+            await Config(a=1, b="x").save_json_to_file_async(filename, indent=2)
+            with ThreadPoolExecutor(1) as executor:
+                loaded = await Config.load_json_from_file_async(filename, executor=executor)
+            self.assertEqual(loaded, Config(a=1, b="x"))
+
+            # Invalid JSON raises the same error type as the synchronous methods
+            with open(filename, "w") as file:
+                file.write('{"a": "1"}')
+            with self.assertRaises(JSONSerialisationError):
+                await Config.load_json_from_file_async(filename)
+
+            # In-process streams
+            read_socket, write_socket = socket.socketpair()
+            reader, reader_writer = await asyncio.open_connection(sock=read_socket)
+            _, writer = await asyncio.open_connection(sock=write_socket)
+            await Config(a=2).write_json_to_stream_async(writer)
+            writer.close()
+            await writer.wait_closed()
+            self.assertEqual(await Config.read_json_from_stream_async(reader), Config(a=2))
+            reader_writer.close()
+
+        with TemporaryDirectory() as directory:
+            asyncio.run(round_trip(directory))
+
+    @Test
+    def load_many(self, subject: JSONObject):
+        """
+        Tests loading many files in parallel, collecting errors.
+        """
+        with TemporaryDirectory() as directory:
+            for index in range(20):
+                with open(os.path.join(directory, f"{index:02}.json"), "w") as file:
+                    file.write(f'{{"a": {index}}}' if index != 7 else '{"a": "seven"}')
+
+            for executor in ("thread", "process"):
+                results = list(LoadedObject.load_many(os.path.join(directory, "*.json"),
+                                                         workers=3,
+                                                         executor=executor,
+                                                         ordered=True))
+                self.assertEqual([os.path.basename(result.filename) for result in results],
+                                 [f"{index:02}.json" for index in range(20)])
+                self.assertEqual([result.instance.a for result in results if result.succeeded],
+                                 [index for index in range(20) if index != 7])
+                self.assertIsInstance(results[7].error, JSONSerialisationError)
+
+            # Results as they complete cover every file
+            filenames = [os.path.join(directory, f"{index:02}.json") for index in range(20)]
+            self.assertEqual(sorted(result.filename for result in LoadedObject.load_many(filenames, workers=4)),
+                             filenames)
+
+            # Given executors are only sent as many loads at once as suit their size
+            from concurrent.futures import ThreadPoolExecutor
+            from wai.json.serialise._load_many import LOADS_PER_WORKER
+
+            class CountingExecutor(ThreadPoolExecutor):
+                submitted = 0
+
+                def submit(self, *args, **kwargs):
+                    self.submitted += 1
+                    return super().submit(*args, **kwargs)
+
+            with CountingExecutor(1) as executor:
+                results = LoadedObject.load_many(filenames, executor=executor, ordered=True)
+                next(results)
+                self.assertEqual(executor.submitted, LOADS_PER_WORKER)
+                self.assertEqual(len(list(results)), 19)
+
+    @Test
+    def specified_proxy_types(self, subject: JSONObject):
+        """
+        Tests that proxy types are shared between equivalent specifications,
+        and can be pickled.
+        """
+        import pickle
+
+        first = ArrayProperty(element_property=StringProperty(pattern="a+"), max_elements=3)
+        second = ArrayProperty(element_property=StringProperty(pattern="a+"), max_elements=3)
+        self.assertIs(first.proxy_type, second.proxy_type)
+        self.assertIs(first.get_validator(), second.get_validator())
+        self.assertIsNot(first.proxy_type,
+                         ArrayProperty(element_property=StringProperty(pattern="b+"), max_elements=3).proxy_type)
+        self.assertIsNot(first.proxy_type, ArrayProperty(element_property=StringProperty(pattern="a+")).proxy_type)
+        self.assertIs(MapProperty(value_property=first).proxy_type, MapProperty(value_property=second).proxy_type)
+
+        # Types are pickled by specification
+        map_type = MapProperty(value_property=AnyOfProperty(sub_properties=(NumberProperty(), first))).proxy_type
+        self.assertIs(pickle.loads(pickle.dumps(first.proxy_type)), first.proxy_type)
+        self.assertIs(pickle.loads(pickle.dumps(map_type)), map_type)
+        self.assertEqual(map_type({"x": ["aa"]}), {"x": ["aa"]})
+
+    @Test
+    def pickling(self, subject: JSONObject):
+        """
+        Tests that objects and proxies pickle compactly, and are unpickled
+        without validation.
+        """
+        import pickle
+        from concurrent.futures import ProcessPoolExecutor
+        from wai.json.raw import SharedNumericArray
+        from wai.json.validator import ValidationCache
+
+        value = PickledObject(a=[1, 2.5], b={"x": LoadedObject(a=3)})
+        frozen = PickledObject(a=[4]).freeze()
+        view = PickledObject.view({"a": [5, 6]})
+        with ValidationCache() as cache:
+            for original in (value, frozen, view):
+                copy = pickle.loads(pickle.dumps(original))
+                self.assertEqual(copy.to_raw_json(False), original.to_raw_json(False))
+                self.assertEqual((copy.is_frozen, copy.is_view), (original.is_frozen, original.is_view))
+            self.assertEqual(cache.misses, 0)
+
+        # Unpickled copies don't share mutable state with the original
+        copy = pickle.loads(pickle.dumps(value))
+        copy.a.append(3)
+        self.assertEqual(value.a, [1, 2.5])
+        self.assertEqual(copy.b["x"], LoadedObject(a=3))
+
+        # Numeric arrays can be shared with other processes
+        with SharedNumericArray([1, 2, 3]) as integers, SharedNumericArray([0.5, 2]) as floats:
+            self.assertEqual(pickle.loads(pickle.dumps(floats)).to_list(), [0.5, 2.0])
+            with ProcessPoolExecutor(1) as executor:
+                self.assertEqual(executor.submit(SharedNumericArray.to_list, integers).result(), [1, 2, 3])
+
+    @Test
+    def thread_safe_validator_creation(self, subject: JSONObject):
+        """
+        Tests that a validator requested by several threads at once is
+        only created once, and that instances can be read concurrently.
+        """
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        from threading import Barrier
+
+        created = []
+
+        class Contended(JSONObject):
+            a = NumberProperty()
+            b = ArrayProperty(element_property=StringProperty())
+
+            @classmethod
+            def _create_validator(cls):
+                created.append(cls)
+                time.sleep(0.05)
+                return super()._create_validator()
+
+        barrier = Barrier(8)
+        instance = Contended(a=1, b=["x", "y"]).freeze()
+
+        def use():
+            barrier.wait()
+            validator = Contended.get_validator()
+            self.assertEqual(instance.to_raw_json(), {"a": 1, "b": ["x", "y"]})
+            self.assertEqual(instance, Contended(a=1, b=["x", "y"]))
+            return validator
+
+        with ThreadPoolExecutor(8) as executor:
+            validators = list(executor.map(lambda _: use(), range(8)))
+
+        self.assertEqual(len(created), 1)
+        self.assertTrue(all(validator is validators[0] for validator in validators))
+
+    @Test
+    def schema_builds_lock_per_type(self, subject: JSONObject):
+        """
+        Tests that schemas are built once each, without building one
+        schema blocking the build of an unrelated schema.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from threading import Event
+        from wai.json.validator import StaticJSONValidator
+
+        built = []
+        slow_started = Event()
+        fast_built = Event()
+
+        class Slow(StaticJSONValidator):
+            @classmethod
+            def _get_json_validation_schema(cls):
+                built.append(cls)
+                slow_started.set()
+
+                # Wait for the unrelated schema, which would time out if it were blocked
+                self.assertTrue(fast_built.wait(5))
+                return {"type": "number"}
+
+        class Fast(StaticJSONValidator):
+            @classmethod
+            def _get_json_validation_schema(cls):
+                built.append(cls)
+                return {"type": "string"}
+
+        def build_fast():
+            slow_started.wait(5)
+            schema = Fast.get_json_validation_schema()
+            fast_built.set()
+            return schema
+
+        with ThreadPoolExecutor(4) as executor:
+            slow_schemas = [executor.submit(Slow.get_json_validation_schema) for _ in range(3)]
+            fast_schema = executor.submit(build_fast)
+            self.assertEqual(fast_schema.result(), {"type": "string"})
+            self.assertTrue(all(schema.result() == {"type": "number"} for schema in slow_schemas))
+
+        self.assertEqual(built.count(Slow), 1)
+        self.assertEqual(built.count(Fast), 1)
+
+    @Test
+    def failed_validator_creation_keeps_lock(self, subject: JSONObject):
+        """
+        Tests that a failed validator creation keeps the creation lock
+        (so later attempts are still serialised), until it succeeds.
+        """
+        from wai.json.validator import _StaticJSONValidator as static
+
+        attempts = []
+
+        class Failing(JSONObject):
+            a = NumberProperty()
+
+            @classmethod
+            def _create_validator(cls):
+                attempts.append(cls)
+                if len(attempts) == 1:
+                    raise RuntimeError("first attempt fails")
+                return super()._create_validator()
+
+        with self.assertRaises(RuntimeError):
+            Failing.get_validator()
+        lock = static._validator_locks[id(Failing)]
+        self.assertIs(static.owner_lock(static._validator_locks, Failing), lock)
+
+        Failing.get_validator()
+        self.assertNotIn(id(Failing), static._validator_locks)
+        self.assertEqual(len(attempts), 2)